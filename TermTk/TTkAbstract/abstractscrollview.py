@@ -80,7 +80,7 @@ class TTkAbstractScrollView(TTkContainer, TTkAbstractScrollViewInterface):
         self.update()
 
     def wheelEvent(self, evt):
-        delta = TTkCfg.scrollDelta
+        delta = TTkCfg.scrollDelta * evt.count
         offx, offy = self.getViewOffsets()
         if evt.evt == TTkK.WHEEL_Up:
             delta = -delta
@@ -93,6 +93,43 @@ class TTkTermColor():
         else:
             return '\033[0m'
 
+    _SGR_MOD = (
+        (BOLD,         '1', '22'),
+        (FAINT,        '2', '22'),
+        (ITALIC,       '3', '23'),
+        (UNDERLINE,    '4', '24'),
+        (BLINKING,     '5', '25'),
+        (REVERSED,     '7', '27'),
+        (HIDDEN,       '8', '28'),
+        (STRIKETROUGH, '9', '29'))
+
+    @staticmethod
+    def rgb2ansiDelta(fg: tuple=None, bg:tuple=None, mod:int=0, prevFg: tuple=None, prevBg:tuple=None, prevMod:int=0):
+        '''Return the SGR sequence required to switch from the "prev" attributes,
+        only the attributes that changed are emitted'''
+        ret = []
+        if fg != prevFg:
+            ret.append(f'38;2;{fg[0]};{fg[1]};{fg[2]}' if fg else '39')
+        if bg != prevBg:
+            ret.append(f'48;2;{bg[0]};{bg[1]};{bg[2]}' if bg else '49')
+        if mod != prevMod:
+            removed = prevMod & ~mod
+            added   = mod & ~prevMod
+            # Ps = 2 2 reset both Bold and Faint
+            if removed & (TTkTermColor.BOLD|TTkTermColor.FAINT):
+                added |= mod & (TTkTermColor.BOLD|TTkTermColor.FAINT)
+            rst = []
+            for val, sgrSet, sgrRst in TTkTermColor._SGR_MOD:
+                if removed & val and sgrRst not in rst:
+                    rst.append(sgrRst)
+            ret += rst
+            for val, sgrSet, sgrRst in TTkTermColor._SGR_MOD:
+                if added & val:
+                    ret.append(sgrSet)
+        if ret:
+            return f'\033[{";".join(ret)}m'
+        return ''
+
     def _256toRgb(val):
         pass
 
@@ -21,4 +21,5 @@
 # SOFTWARE.
 
 # from .input_mono import *
-from .input_thread import *
\ No newline at end of file
+# from .input_thread import *
+from .input_loop import *
\ No newline at end of file
@@ -0,0 +1,395 @@
+# MIT License
+#
+# Copyright (c) 2021 Eugenio Parodi <ceccopierangiolieugenio AT googlemail DOT com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+__all__ = ['TTkInput']
+
+import asyncio
+from time import time
+from typing import Optional
+
+from ..drivers import TTkInputDriver
+
+from TermTk.TTkCore.log import TTkLog
+from TermTk.TTkCore.timer import TTkTimer
+from TermTk.TTkCore.constant import TTkK
+from TermTk.TTkCore.signal import pyTTkSignal
+from TermTk.TTkCore.TTkTerm.term   import TTkTerm
+from TermTk.TTkCore.TTkTerm.inputkey   import TTkKeyEvent
+from TermTk.TTkCore.TTkTerm.inputmouse import TTkMouseEvent
+from TermTk.TTkCore.TTkTerm.inputtokenizer import TTkInputTokenizer
+
+
+class TTkInput:
+    inputEvent = pyTTkSignal(TTkKeyEvent, TTkMouseEvent)
+    pasteEvent = pyTTkSignal(str)
+    _tokenizer = TTkInputTokenizer()
+    # Seconds waited for the rest of an incomplete escape sequence
+    # before reporting it as it is (i.e. the "Escape" key)
+    _escTimeout = 0.05
+    _idle = True
+    _readInput = None
+    _readers = {}
+    _asyncLoop = None
+    _asyncQuit = None
+    _asyncFlush = None
+    _mevtPending = None
+    _droppedMove  = 0
+    _droppedDrag  = 0
+    _droppedWheel = 0
+    _leftLastTime = 0
+    _midLastTime = 0
+    _rightLastTime = 0
+    _leftTap = 0
+    _midTap = 0
+    _rightTap = 0
+
+    class Mouse(int):
+        ON = 0x01
+        DIRECT = 0x02
+
+    class Coalesce(int):
+        NONE  = 0x00
+        MOVE  = 0x01
+        DRAG  = 0x02
+        WHEEL = 0x04
+        ALL   = MOVE | DRAG | WHEEL
+        # The wheel steps are not merged by default,
+        # a wheelEvent that ignore the "count" would lose the merged steps
+        DEFAULT = MOVE | DRAG
+
+    _coalesce = Coalesce.DEFAULT
+
+    @staticmethod
+    def init(mouse:bool=False, directMouse:bool=False) -> None:
+        TTkInput._readInput = TTkInputDriver()
+        TTkTerm.setMouse(mouse, directMouse)
+
+    @staticmethod
+    def close() -> None:
+        TTkTerm.setMouse(False, False)
+        if TTkInput._readInput:
+            TTkInput._readInput.close()
+        if TTkInput._asyncQuit:
+            TTkInput._asyncQuit()
+
+    @staticmethod
+    def addReader(fd:int, callback) -> None:
+        ''' Call the callback in the main loop when the file descriptor is readable
+
+        :param fd: the file descriptor
+        :param callback: the function called (without arguments) when the fd is readable
+        '''
+        TTkInput._readers[fd] = callback
+        if loop := TTkInput._asyncLoop:
+            loop.add_reader(fd, TTkInput._asyncCallback, callback)
+        elif TTkInput._readInput:
+            # Include the new fd in the current wait
+            TTkInput._readInput.wakeup()
+
+    @staticmethod
+    def removeReader(fd:int) -> None:
+        TTkInput._readers.pop(fd, None)
+        if loop := TTkInput._asyncLoop:
+            loop.remove_reader(fd)
+
+    @staticmethod
+    def stop() -> None:
+        pass
+
+    @staticmethod
+    def cont() -> None:
+        if TTkInput._readInput:
+            TTkInput._readInput.cont()
+
+    @staticmethod
+    def setCoalescing(flags:int=Coalesce.DEFAULT) -> None:
+        ''' Set the mouse events merged when more of them are available in the same read
+
+        The input is read in batches, if the main loop falls behind (i.e. a fast trackpad scroll)
+        a batch contains a run of events superseded by the last one:
+
+        * :class:`Coalesce.MOVE`, :class:`Coalesce.DRAG` - only the last position is delivered
+        * :class:`Coalesce.WHEEL` - the steps in the same direction are delivered as a single event,
+          :attr:`~TermTk.TTkCore.TTkTerm.inputmouse.TTkMouseEvent.count` reports the number of steps
+
+        Any other event in between ends the run, the order of the events is preserved.
+
+        .. warning::
+            :class:`Coalesce.WHEEL` is not enabled by default,
+            enable it only if all the wheelEvent handlers scroll by the :attr:`~TermTk.TTkCore.TTkTerm.inputmouse.TTkMouseEvent.count` steps,
+            a handler that ignores it loses the merged steps.
+
+        :param flags: the :class:`Coalesce` flags, default :class:`Coalesce.DEFAULT` (MOVE | DRAG)
+        '''
+        TTkInput._coalesce = flags
+
+    @staticmethod
+    def coalescing() -> int:
+        return TTkInput._coalesce
+
+    @staticmethod
+    def droppedEvents() -> dict:
+        ''' Return the number of the mouse events merged by the coalescing
+
+        :rtype: dict {'move':int, 'drag':int, 'wheel':int}
+        '''
+        return {
+            'move'  : TTkInput._droppedMove,
+            'drag'  : TTkInput._droppedDrag,
+            'wheel' : TTkInput._droppedWheel }
+
+    @staticmethod
+    def _coalesceEvent(mevt:TTkMouseEvent) -> bool:
+        # Merge the event with the pending one,
+        # return False if the event can not be delayed
+        flags = TTkInput._coalesce
+        if not ( ( mevt.evt == TTkK.Move  and flags & TTkInput.Coalesce.MOVE  ) or
+                 ( mevt.evt == TTkK.Drag  and flags & TTkInput.Coalesce.DRAG  ) or
+                 ( mevt.key == TTkK.Wheel and flags & TTkInput.Coalesce.WHEEL ) ):
+            return False
+        pending = TTkInput._mevtPending
+        if ( pending is None or
+             pending.evt != mevt.evt or
+             pending.key != mevt.key or
+             pending.mod != mevt.mod or
+             # The wheel steps are merged only if they target the same position
+             ( mevt.key == TTkK.Wheel and (pending.x, pending.y) != (mevt.x, mevt.y) ) ):
+            TTkInput._flushPending()
+            TTkInput._mevtPending = mevt
+        elif mevt.key == TTkK.Wheel:
+            pending.count += mevt.count
+            TTkInput._droppedWheel += 1
+        elif mevt.evt == TTkK.Move:
+            TTkInput._mevtPending = mevt
+            TTkInput._droppedMove += 1
+        else:
+            TTkInput._mevtPending = mevt
+            TTkInput._droppedDrag += 1
+        return True
+
+    @staticmethod
+    def _flushPending() -> None:
+        if mevt := TTkInput._mevtPending:
+            TTkInput._mevtPending = None
+            TTkInput.inputEvent.emit(None, mevt)
+
+    @staticmethod
+    def _dispatch(stdinRead:Optional[str]) -> None:
+        tokenizer = TTkInput._tokenizer
+        if stdinRead is None:
+            # All the available input is consumed,
+            # an escape sequence still incomplete after a full wait is flushed
+            if TTkInput._idle and tokenizer.pending():
+                TTkInput._processTokens(tokenizer.flush())
+            TTkInput._idle = True
+            TTkInput._flushPending()
+            return
+        TTkInput._idle = False
+        TTkInput._processTokens(tokenizer.feed(stdinRead))
+
+    @staticmethod
+    def _processTokens(tokens:list) -> None:
+        for token in tokens:
+            kevt,mevt,paste = TTkInput._processToken(*token)
+
+            # The consecutive move/drag/wheel events are delayed
+            # until the end of the run (see setCoalescing)
+            if not kevt and not paste and mevt and TTkInput._coalesceEvent(mevt):
+                continue
+            TTkInput._flushPending()
+
+            if kevt or mevt:
+                TTkInput.inputEvent.emit(kevt, mevt)
+            if paste:
+                TTkInput.pasteEvent.emit(paste)
+
+    @staticmethod
+    def _nextTimeout() -> Optional[float]:
+        timeout = TTkTimer.nextTimeout()
+        if TTkInput._tokenizer.pending():
+            return TTkInput._escTimeout if timeout is None else min(timeout, TTkInput._escTimeout)
+        return timeout
+
+    @staticmethod
+    def start() -> None:
+        ''' Run the main loop
+
+        Input, timers and paint events are all processed in this thread,
+        the input driver waits for the input until the next timer deadline
+        '''
+        TTkTimer.attachLoop(TTkInput._readInput.wakeup)
+        for stdinRead in TTkInput._readInput.read(timeout=TTkInput._nextTimeout, readers=TTkInput._readers):
+            TTkInput._dispatch(stdinRead)
+            if stdinRead is None:
+                TTkTimer.processTimers()
+        TTkTimer.detachLoop()
+        TTkLog.debug("Close TTkInput")
+
+    _asyncTimer = None
+
+    @staticmethod
+    def _asyncSchedule() -> None:
+        # Process the expired timers and wait for the next deadline
+        if handle := TTkInput._asyncTimer:
+            handle.cancel()
+        TTkInput._asyncTimer = None
+        TTkTimer.processTimers()
+        if (timeout := TTkTimer.nextTimeout()) is not None and (loop := TTkInput._asyncLoop):
+            TTkInput._asyncTimer = loop.call_later(timeout, TTkInput._asyncSchedule)
+
+    @staticmethod
+    def _asyncCallback(callback) -> None:
+        callback()
+        TTkInput._asyncSchedule()
+
+    @staticmethod
+    def _asyncRead() -> None:
+        if handle := TTkInput._asyncFlush:
+            handle.cancel()
+            TTkInput._asyncFlush = None
+        if stdinRead := TTkInput._readInput.readAvailable():
+            TTkInput._dispatch(stdinRead)
+        TTkInput._dispatch(None)
+        if TTkInput._tokenizer.pending() and (loop := TTkInput._asyncLoop):
+            TTkInput._asyncFlush = loop.call_later(TTkInput._escTimeout, TTkInput._asyncEscTimeout)
+        TTkInput._asyncSchedule()
+
+    @staticmethod
+    def _asyncEscTimeout() -> None:
+        TTkInput._asyncFlush = None
+        TTkInput._dispatch(None)
+        TTkInput._asyncSchedule()
+
+    @staticmethod
+    async def startAsync() -> None:
+        ''' Run the main loop on the running asyncio event loop
+
+        The input and the registered readers are served by :meth:`asyncio.loop.add_reader`,
+        the timers (including the paint) by :meth:`asyncio.loop.call_later`.
+        Everything runs in the thread of the asyncio loop,
+        the signals can be emitted straight from the coroutines.
+        '''
+        loop = asyncio.get_running_loop()
+        quit = loop.create_future()
+        def _quit():
+            if not quit.done():
+                quit.set_result(None)
+        TTkInput._asyncLoop = loop
+        TTkInput._asyncQuit = lambda: loop.call_soon_threadsafe(_quit)
+        # The coroutines may start the timers from the loop thread as well,
+        # any change of the heap must reschedule the next deadline
+        TTkTimer.attachLoop(lambda: loop.call_soon_threadsafe(TTkInput._asyncSchedule), always=True)
+        loop.add_reader(TTkInput._readInput.fileno(), TTkInput._asyncRead)
+        for fd,callback in TTkInput._readers.items():
+            loop.add_reader(fd, TTkInput._asyncCallback, callback)
+        TTkInput._asyncSchedule()
+        try:
+            await quit
+        finally:
+            loop.remove_reader(TTkInput._readInput.fileno())
+            for fd in TTkInput._readers:
+                loop.remove_reader(fd)
+            if handle := TTkInput._asyncTimer:
+                handle.cancel()
+            TTkInput._asyncTimer = None
+            if handle := TTkInput._asyncFlush:
+                handle.cancel()
+            TTkInput._asyncFlush = None
+            TTkInput._asyncLoop = None
+            TTkInput._asyncQuit = None
+            TTkTimer.detachLoop()
+            TTkLog.debug("Close TTkInput")
+
+    @staticmethod
+    def _processToken(token:int, value) -> tuple:
+        if token == TTkInputTokenizer.Key:
+            if kevt := TTkKeyEvent.parse(value):
+                return kevt, None, None
+            hex = [f"0x{ord(x):02x}" for x in value]
+            TTkLog.error("UNHANDLED: "+value.replace("\033","<ESC>") + " - "+",".join(hex))
+        elif token == TTkInputTokenizer.Mouse:
+            return None, TTkInput._mouseEvent(*value), None
+        elif token == TTkInputTokenizer.Paste:
+            return None, None, value
+        # The focus reports are not used
+        return None, None, None
+
+    @staticmethod
+    def _mouseEvent(code:int, x:int, y:int, pressed:bool, raw:str) -> TTkMouseEvent:
+        key = TTkMouseEvent.NoButton
+        evt = TTkMouseEvent.Move
+        tap = 0
+
+        def _checkTap(lastTime, tap):
+            if pressed:
+                t = time()
+                if (t-lastTime) < 0.4:
+                    return t, tap+1
+                else:
+                    return t, 1
+            return lastTime, tap
+
+        mod = TTkK.NoModifier
+        if code & 0x10:
+            code &= ~0x10
+            mod |= TTkK.ControlModifier
+        if code & 0x08:
+            code &= ~0x08
+            mod |= TTkK.AltModifier
+
+        if code == 0x00:
+            TTkInput._leftLastTime, TTkInput._leftTap = _checkTap(TTkInput._leftLastTime, TTkInput._leftTap)
+            tap = TTkInput._leftTap
+            key = TTkMouseEvent.LeftButton
+            evt = TTkMouseEvent.Press if pressed else TTkMouseEvent.Release
+        elif code == 0x01:
+            TTkInput._midLastTime, TTkInput._midTap = _checkTap(TTkInput._midLastTime, TTkInput._midTap)
+            tap = TTkInput._midTap
+            key = TTkMouseEvent.MidButton
+            evt = TTkMouseEvent.Press if pressed else TTkMouseEvent.Release
+        elif code == 0x02:
+            TTkInput._rightLastTime, TTkInput._rightTap = _checkTap(TTkInput._rightLastTime, TTkInput._rightTap)
+            tap = TTkInput._rightTap
+            key = TTkMouseEvent.RightButton
+            evt = TTkMouseEvent.Press if pressed else TTkMouseEvent.Release
+        elif code == 0x20:
+            key = TTkMouseEvent.LeftButton
+            evt = TTkMouseEvent.Drag
+        elif code == 0x21:
+            key = TTkMouseEvent.MidButton
+            evt = TTkMouseEvent.Drag
+        elif code == 0x22:
+            key = TTkMouseEvent.RightButton
+            evt = TTkMouseEvent.Drag
+        elif code == 0x40:
+            key = TTkMouseEvent.Wheel
+            evt = TTkMouseEvent.Up
+        elif code == 0x41:
+            key = TTkMouseEvent.Wheel
+            evt = TTkMouseEvent.Down
+        elif code == 0x23:
+            evt = TTkMouseEvent.Move
+        elif code == 0x27:
+            mod |= TTkK.ShiftModifier
+            evt = TTkMouseEvent.Move
+
+        return TTkMouseEvent(x, y, key, evt, mod, tap, raw.replace("\033", "<ESC>"))
@@ -30,6 +30,7 @@ import threading, queue
 from ..drivers import TTkInputDriver
 
 from TermTk.TTkCore.log import TTkLog
+from TermTk.TTkCore.timer import TTkTimer
 from TermTk.TTkCore.constant import TTkK
 from TermTk.TTkCore.signal import pyTTkSignal
 from TermTk.TTkCore.TTkTerm.term   import TTkTerm
@@ -45,6 +46,7 @@ class TTkInput:
     _readInput = None
     _inputThread = None
     _inputQueue = None
+    _readers = {}
     _leftLastTime = 0
     _midLastTime = 0
     _rightLastTime = 0
@@ -70,6 +72,17 @@ class TTkInput:
         if TTkInput._readInput:
             TTkInput._readInput.close()
 
+    @staticmethod
+    def addReader(fd:int, callback) -> None:
+        ''' Call the callback (in the input thread) when the file descriptor is readable '''
+        TTkInput._readers[fd] = callback
+        if TTkInput._readInput:
+            TTkInput._readInput.wakeup()
+
+    @staticmethod
+    def removeReader(fd:int) -> None:
+        TTkInput._readers.pop(fd, None)
+
     @staticmethod
     def stop() -> None:
         pass
@@ -82,7 +95,10 @@ class TTkInput:
     @staticmethod
     def start() -> None:
         TTkInput._inputThread.start()
-        while inq := TTkInput._inputQueue.get():
+        TTkTimer.attachLoop(lambda: TTkInput._inputQueue.put(()))
+        while (inq := TTkInput._nextInput()) is not None:
+            TTkTimer.processTimers()
+            if not inq: continue
             kevt,mevt,paste = inq
 
             # Try to filter out the queued moved mouse events
@@ -91,7 +107,11 @@ class TTkInput:
                    mevt and mevt.evt == TTkK.Drag and
                    not TTkInput._inputQueue.empty() ):
                 mevtOld = mevt
-                kevt, mevt, paste = TTkInput._inputQueue.get()
+                if not (inq := TTkInput._inputQueue.get()):
+                    # Wakeup or quit, processed in the next iteration
+                    TTkInput._inputQueue.put(inq)
+                    break
+                kevt, mevt, paste = inq
                 if (kevt  or
                     paste or
                     mevt and mevt.evt != TTkK.Drag):
@@ -102,11 +122,21 @@ class TTkInput:
                 TTkInput.inputEvent.emit(kevt, mevt)
             if paste:
                 TTkInput.pasteEvent.emit(paste)
+        TTkTimer.detachLoop()
         TTkLog.debug("Close TTkInput")
 
+    @staticmethod
+    def _nextInput():
+        # Wait for the input until the next timer deadline, () on timeout or wakeup
+        try:
+            return TTkInput._inputQueue.get(timeout=TTkTimer.nextTimeout())
+        except queue.Empty:
+            return ()
+
     @staticmethod
     def _run():
-        for stdinRead in TTkInput._readInput.read():
+        for stdinRead in TTkInput._readInput.read(readers=TTkInput._readers):
+            if stdinRead is None: continue
             outq = TTkInput.key_process(stdinRead)
             TTkInput._inputQueue.put(outq)
         TTkInput._inputQueue.put(None)
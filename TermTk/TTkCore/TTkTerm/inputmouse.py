@@ -64,6 +64,12 @@ class TTkMouseEvent:
 
         The terminal "raw" information reporting this event (Do not use it unless you know what you are looking for)
 
+    .. py:attribute:: count
+        :type: int
+
+        The number of consecutive wheel steps merged in this event, always 1 unless the wheel coalescing is enabled
+        (see :meth:`~TermTk.TTkCore.TTkTerm.input_loop.TTkInput.setCoalescing`)
+
     '''
     # Keys
     NoButton      = TTkK.NoButton     # The button state does not refer to any button (see QMouseEvent::button()).
@@ -83,8 +89,8 @@ class TTkMouseEvent:
     Up      = TTkK.WHEEL_Up
     Down    = TTkK.WHEEL_Down
 
-    __slots__ = ('x', 'y', 'key', 'evt', 'mod', 'tap', 'raw')
-    def __init__(self, x: int, y: int, key: int, evt: int, mod: int, tap: int, raw: str):
+    __slots__ = ('x', 'y', 'key', 'evt', 'mod', 'tap', 'raw', 'count')
+    def __init__(self, x: int, y: int, key: int, evt: int, mod: int, tap: int, raw: str, count: int=1):
         self.x = x
         self.y = y
         self.key = key
@@ -92,11 +98,19 @@ class TTkMouseEvent:
         self.mod = mod
         self.raw = raw
         self.tap = tap
+        self.count = count
+
+    def __setstate__(self, state):
+        # The events pickled before the coalescing (i.e. the recordings) have no count
+        self.count = 1
+        _, slots = state
+        for k,v in slots.items():
+            setattr(self,k,v)
 
     def clone(self, pos=None, evt=None):
         x,y = pos or (self.x, self.y)
         evt = evt or self.evt
-        return TTkMouseEvent(x, y, self.key, evt, self.mod, self.tap, self.raw)
+        return TTkMouseEvent(x, y, self.key, evt, self.mod, self.tap, self.raw, self.count)
 
     def key2str(self):
         return {
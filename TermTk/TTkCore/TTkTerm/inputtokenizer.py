@@ -0,0 +1,222 @@
+# MIT License
+#
+# Copyright (c) 2024 Eugenio Parodi <ceccopierangiolieugenio AT googlemail DOT com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+__all__ = ['TTkInputTokenizer']
+
+import re
+from itertools import repeat
+
+class TTkInputTokenizer():
+    ''' Incremental tokenizer of the terminal input
+
+    The input is fed as it is read from the terminal,
+    an escape sequence split across two reads is completed by the next :meth:`feed`.
+
+    The input is scanned in linear time, the complete sequences are matched
+    by a single pattern (the only alternatives sharing a prefix are the SGR mouse
+    and the generic CSI, the retry is bounded by the sequence length),
+    the state machine completes the sequences split across the reads.
+
+    The tokens returned are tuples (type, value):
+
+    * :attr:`Key`      - a printable char, a control char or a complete escape sequence (str)
+    * :attr:`Mouse`    - an SGR mouse report, (code, x, y, pressed, raw) where x,y are 0 based
+    * :attr:`Paste`    - the text received between the bracketed paste markers (str)
+    * :attr:`FocusIn`, :attr:`FocusOut` - the terminal focus reports (None)
+
+    ::
+
+        tokenizer = TTkInputTokenizer()
+        tokenizer.feed("a\033[<0;1")    # [(Key, 'a')]
+        tokenizer.feed("0;5M")          # [(Mouse, (0, 9, 4, True, '\033[<0;10;5M'))]
+    '''
+    Key      = 0x01
+    Mouse    = 0x02
+    Paste    = 0x03
+    FocusIn  = 0x04
+    FocusOut = 0x05
+
+    _GROUND = 0x00
+    _ESC    = 0x01
+    _CSI    = 0x02
+    _SS3    = 0x03
+    _PASTE  = 0x04
+
+    _pasteEnd = '\033[201~'
+    # Complete sequences: SGR Mouse, CSI, SS3, Alt + key
+    _seq_re = re.compile('\033(?:\\[<([0-9]+);([0-9]+);([0-9]+)([mM])|\\[[\x20-\x3f]*[\x40-\x7e]|O.|[^\\[O\033])', re.DOTALL)
+    # CSI parameters and intermediate bytes
+    _csi_re = re.compile('[\x20-\x3f]*')
+    # Longest CSI sequence accepted, anything longer is broken input
+    _maxSeqLen = 64
+
+    __slots__ = ('_state', '_seq', '_paste', '_pasteTail')
+
+    def __init__(self):
+        self._state = TTkInputTokenizer._GROUND
+        self._seq = ''
+        self._paste = []
+        self._pasteTail = ''
+
+    def pending(self) -> bool:
+        ''' Return True if an incomplete escape sequence is waiting for the next :meth:`feed` '''
+        return self._state in (TTkInputTokenizer._ESC, TTkInputTokenizer._CSI, TTkInputTokenizer._SS3)
+
+    def flush(self) -> list:
+        ''' Return the incomplete escape sequence as a :attr:`Key` token
+
+        i.e. an "Escape" key pressed alone
+        '''
+        if not self.pending():
+            return []
+        seq = self._seq
+        self._seq = ''
+        self._state = TTkInputTokenizer._GROUND
+        return [(TTkInputTokenizer.Key, seq)]
+
+    def feed(self, data:str) -> list:
+        ''' Scan the input and return the list of the completed tokens
+
+        :param data: the input read from the terminal
+        :type data: str
+        '''
+        _T = TTkInputTokenizer
+        ret = []
+        # An escape alone is the "Escape" key
+        if data == '\033' and self._state == _T._GROUND:
+            return [(_T.Key, '\033')]
+        i, n = 0, len(data)
+        while i < n:
+            state = self._state
+            if state == _T._GROUND:
+                find, match, key, mouse = data.find, _T._seq_re.match, _T.Key, _T.Mouse
+                while self._state == _T._GROUND:
+                    # Everything until the next escape is a list of keys
+                    j = find('\033', i)
+                    if j < 0:
+                        j = n
+                    if j > i:
+                        ret += zip(repeat(key), data[i:j])
+                    if j == n:
+                        i = n
+                        break
+                    if m := match(data, j):
+                        seq = m.group()
+                        if m.lastindex:
+                            ret.append((mouse, (int(m[1]), int(m[2])-1, int(m[3])-1, m[4]=='M', seq)))
+                        elif seq[1] == '[':
+                            ret += self._csi(seq)
+                        else:
+                            ret.append((key, seq))
+                        i = m.end()
+                    else:
+                        # Incomplete or broken sequence
+                        self._state = _T._ESC
+                        self._seq = '\033'
+                        i = j+1
+            elif state == _T._ESC:
+                ch = data[i]
+                if ch == '[':
+                    self._state = _T._CSI
+                    self._seq = '\033['
+                elif ch == 'O':
+                    self._state = _T._SS3
+                    self._seq = '\033O'
+                elif ch == '\033':
+                    # "Escape" followed by another sequence
+                    ret.append((_T.Key, '\033'))
+                else:
+                    # Alt + key
+                    ret.append((_T.Key, '\033'+ch))
+                    self._state = _T._GROUND
+                    self._seq = ''
+                i += 1
+            elif state == _T._SS3:
+                ret.append((_T.Key, '\033O'+data[i]))
+                self._state = _T._GROUND
+                self._seq = ''
+                i += 1
+            elif state == _T._CSI:
+                # Parameters and intermediate bytes (0x20-0x3F)
+                # are terminated by the final byte (0x40-0x7E)
+                j = _T._csi_re.match(data, i).end()
+                seq = self._seq + data[i:j]
+                if j == n:
+                    if len(seq) > _T._maxSeqLen:
+                        ret.append((_T.Key, seq))
+                        self._state = _T._GROUND
+                        seq = ''
+                    self._seq = seq
+                    i = j
+                elif '@' <= data[j] <= '~':
+                    self._seq = ''
+                    self._state = _T._GROUND
+                    ret += self._csi(seq + data[j])
+                    i = j+1
+                else:
+                    # Broken sequence, the unexpected char is scanned again
+                    ret.append((_T.Key, seq))
+                    self._seq = ''
+                    self._state = _T._GROUND
+                    i = j
+            else: # _PASTE
+                chunk = data[i:] if i else data
+                probe = self._pasteTail + chunk
+                j = probe.find(_T._pasteEnd)
+                if j < 0:
+                    self._paste.append(chunk)
+                    self._pasteTail = probe[1-len(_T._pasteEnd):]
+                    i = n
+                else:
+                    # The end marker may start in the previous chunk
+                    cut = j - len(self._pasteTail)
+                    paste = ''.join(self._paste)
+                    if cut < 0:
+                        paste = paste[:cut]
+                    else:
+                        paste += chunk[:cut]
+                    self._paste = []
+                    self._pasteTail = ''
+                    self._state = _T._GROUND
+                    # due to the CRNL methos (don't ask me why) the terminal
+                    # is substituting all the \n with \r
+                    ret.append((_T.Paste, paste.replace('\r','\n')))
+                    i += cut + len(_T._pasteEnd)
+        return ret
+
+    def _csi(self, seq:str) -> list:
+        _T = TTkInputTokenizer
+        if seq[2] == '<' and seq[-1] in 'Mm':
+            # SGR Mouse: <ESC>[<code;x;y(M|m)
+            try:
+                code, x, y = map(int, seq[3:-1].split(';'))
+                return [(_T.Mouse, (code, x-1, y-1, seq[-1]=='M', seq))]
+            except ValueError:
+                pass
+        elif seq == '\033[200~':
+            self._state = _T._PASTE
+            return []
+        elif seq == '\033[I':
+            return [(_T.FocusIn, None)]
+        elif seq == '\033[O':
+            return [(_T.FocusOut, None)]
+        return [(_T.Key, seq)]
@@ -20,7 +20,8 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
-import os
+import os, select
+from threading import get_ident
 
 class TTkTermBase():
     CLEAR         = "\033[2J\033[0;0f" # Clear screen and set cursor to position 0,0
@@ -30,6 +31,9 @@ class TTkTermBase():
     SET_BRACKETED_PM   = "\033[?2004h" # Ps = 2 0 0 4  ⇒  Set bracketed paste mode, xterm.
     RESET_BRACKETED_PM = "\033[?2004l" # Ps = 2 0 0 4  ⇒  Reset bracketed paste mode, xterm.
 
+    BEGIN_SYNC_UPDATE = "\033[?2026h" # Ps = 2 0 2 6  ⇒  Begin synchronized update (the terminal holds the rendering)
+    END_SYNC_UPDATE   = "\033[?2026l" # Ps = 2 0 2 6  ⇒  End synchronized update (the terminal renders the frame)
+
     class Mouse(str):
         ON         = "\033[?1002h\033[?1006h" # Enable reporting of mouse position on click and release
         OFF        = "\033[?1002l\033[?1006l" # Disable mouse reporting
@@ -76,6 +80,23 @@ class TTkTermBase():
         def hide():
             TTkTermBase.push(TTkTermBase.Cursor.HIDE)
 
+    class Caps():
+        '''Terminal capabilities allowed in the output encoder (:class:`~TermTk.TTkCore.canvas_encoder.TTkCanvasEncoder`)'''
+        RELMOVE = 0x0001 # CUF/CUB/CUD/CUU/CHA  Relative cursor movements
+        REP     = 0x0002 # CSI n b  Repeat the preceding graphic character
+        ECH     = 0x0004 # CSI n X  Erase n characters
+        EL      = 0x0008 # CSI K    Erase to the end of the line
+        BCE     = 0x0010 # The erased cells use the current background color
+
+        @staticmethod
+        def fromString(caps:str) -> int:
+            '''Return the capabilities from a comma separated list of names, i.e. "relmove,ech,el"'''
+            ret = 0
+            for name in caps.upper().replace(' ','').split(','):
+                if name:
+                    ret |= getattr(TTkTermBase.Caps, name)
+            return ret
+
     class Sigmask():
         CTRL_C = 0x0001
         CTRL_S = 0x0002
@@ -87,9 +108,80 @@ class TTkTermBase():
     height: int = 0
     mouse: bool = True
     directMouse: bool = False
+    syncUpdate: bool = True
+    capabilities: int = Caps.RELMOVE | Caps.ECH | Caps.EL
 
     _sigWinChCb = None
 
+    # Frame output buffer,
+    # it is None when no frame is open and the output is pushed straight to the terminal
+    _frameBuffer = None
+    _frameThread = None
+    _frameStats = {'frames':0, 'bytes':0, 'syscalls':0, 'totBytes':0, 'totSyscalls':0}
+
+    @staticmethod
+    def frameBegin() -> None:
+        '''Open a frame, all the following :meth:`push` are collected until :meth:`frameEnd` is called'''
+        if TTkTermBase._frameBuffer is None:
+            TTkTermBase._frameBuffer = []
+            TTkTermBase._frameThread = get_ident()
+
+    @staticmethod
+    def frameEnd() -> None:
+        '''Close the current frame and commit the collected output to the terminal at once'''
+        if (buffer := TTkTermBase._frameBuffer) is None: return
+        TTkTermBase._frameBuffer = None
+        TTkTermBase._frameThread = None
+        if not buffer: return
+        if TTkTermBase.syncUpdate:
+            txt = TTkTermBase.BEGIN_SYNC_UPDATE + ''.join(buffer) + TTkTermBase.END_SYNC_UPDATE
+        else:
+            txt = ''.join(buffer)
+        nbytes, syscalls = TTkTermBase.pushFrame(txt)
+        stats = TTkTermBase._frameStats
+        stats['frames']      += 1
+        stats['bytes']        = nbytes
+        stats['syscalls']     = syscalls
+        stats['totBytes']    += nbytes
+        stats['totSyscalls'] += syscalls
+
+    @staticmethod
+    def _frameAppend(txt:str) -> bool:
+        # Collect the output in the frame opened by the current thread,
+        # the pushes from the other threads are not part of the frame
+        if (buffer := TTkTermBase._frameBuffer) is None or TTkTermBase._frameThread != get_ident():
+            return False
+        buffer.append(txt)
+        return True
+
+    @staticmethod
+    def _writeFd(fd:int, txt:str) -> tuple:
+        # Write the whole text straight to the file descriptor,
+        # the loop handles the partial writes of a non blocking fd
+        nbytes, syscalls = 0, 0
+        data = memoryview(txt.encode())
+        while data:
+            try:
+                n = os.write(fd, data)
+            except BlockingIOError:
+                select.select([],[fd],[])
+                continue
+            finally:
+                syscalls += 1
+            nbytes += n
+            data = data[n:]
+        return nbytes, syscalls
+
+    @staticmethod
+    def frameStats() -> dict:
+        '''Return the output statistics of the committed frames
+
+        * **frames**: number of the committed frames
+        * **bytes**, **syscalls**: bytes written and write calls used by the last frame
+        * **totBytes**, **totSyscalls**: the same counters accumulated over all the frames
+        '''
+        return TTkTermBase._frameStats.copy()
+
     @staticmethod
     def init(title: str = "TermTk", sigmask=0) -> None:
         TTkTermBase.title = title
@@ -149,6 +241,7 @@ class TTkTermBase():
     # compatible one in "term_unix.py" or "term_pyodide.py"
     setSigmask = lambda *args: None
     push       = lambda *args: None
+    pushFrame  = lambda *args: (0,0)
     flush      = lambda *args: None
     setEcho    = lambda *args: None
     CRNL       = lambda *args: None
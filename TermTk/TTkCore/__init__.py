@@ -1,12 +1,15 @@
 from .constant import *
 from .signal   import *
 from .log      import *
+from .logring  import *
 from .cfg      import *
 from .util     import *
 from .helper   import *
 from .propertyanimation import *
 from .ttk      import *
 from .canvas   import *
+from .canvas_packed import *
+from .canvas_encoder import *
 from .color    import *
 from .shortcut import *
 from .string   import *
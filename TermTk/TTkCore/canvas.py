@@ -20,7 +20,7 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
-__all__ = ['TTkCanvas']
+__all__ = ['TTkCanvas', 'TTkCanvasPool']
 
 from TermTk.TTkCore.TTkTerm.term import TTkTerm
 from TermTk.TTkCore.constant import TTkK
@@ -28,6 +28,68 @@ from TermTk.TTkCore.log import TTkLog
 from TermTk.TTkCore.cfg import TTkCfg
 from TermTk.TTkCore.color import TTkColor
 from TermTk.TTkCore.string import TTkString
+from TermTk.TTkCore.canvas_encoder import TTkCanvasEncoder
+
+import re
+
+class TTkCanvasPool():
+    ''' Pool of the canvas rows, grouped by size bucket
+
+    The buckets are the next power of 2 of the width and the height,
+    a canvas resized inside its bucket reuses its own rows and the
+    rows released by a canvas moving to a different bucket are reused
+    by the next canvas that needs them.
+    '''
+    __slots__ = ()
+    maxBuffers = 4
+    _buffers = {}
+    _stats = {'allocated':0, 'reused':0, 'inPlace':0, 'released':0, 'discarded':0}
+
+    @staticmethod
+    def bucket(w:int, h:int) -> (int, int):
+        return (1<<max(0,w-1).bit_length(), 1<<max(0,h-1).bit_length())
+
+    @staticmethod
+    def acquire(w:int, h:int):
+        ''' Return a (data, colors) rows buffer from the bucket of the size (w,h) or None '''
+        if buffers := TTkCanvasPool._buffers.get(TTkCanvasPool.bucket(w,h)):
+            TTkCanvasPool._stats['reused'] += 1
+            return buffers.pop()
+        TTkCanvasPool._stats['allocated'] += 1
+        return None
+
+    @staticmethod
+    def release(w:int, h:int, buffer):
+        ''' Return to the pool the (data, colors) rows buffer of a canvas of size (w,h) '''
+        buffers = TTkCanvasPool._buffers.setdefault(TTkCanvasPool.bucket(w,h), [])
+        if len(buffers) < TTkCanvasPool.maxBuffers:
+            TTkCanvasPool._stats['released'] += 1
+            buffers.append(buffer)
+        else:
+            TTkCanvasPool._stats['discarded'] += 1
+
+    @staticmethod
+    def stats() -> dict:
+        ''' Return the allocation counters of the canvas buffers
+
+        * **allocated**: buffers allocated from scratch
+        * **reused**: buffers taken from the pool
+        * **inPlace**: resizes inside the same bucket, no buffer allocated
+        * **released**: buffers returned to the pool
+        * **discarded**: buffers left to the garbage collector because the bucket was full
+        * **pooled**: buffers currently available in the pool
+        '''
+        return TTkCanvasPool._stats | {'pooled': sum(len(b) for b in TTkCanvasPool._buffers.values())}
+
+    @staticmethod
+    def resetStats():
+        for k in TTkCanvasPool._stats:
+            TTkCanvasPool._stats[k] = 0
+
+    @staticmethod
+    def clear():
+        ''' Drop all the pooled buffers '''
+        TTkCanvasPool._buffers.clear()
 
 class TTkCanvas:
     ''' Init the Canvas object
@@ -39,6 +101,7 @@ class TTkCanvas:
         '_width', '_height', '_newWidth', '_newHeight',
         '_data', '_colors',
         '_bufferedData', '_bufferedColors',
+        '_dirtyRows', '_opacity',
         '_visible', '_transparent', '_doubleBuffer')
     def __init__(self, *args, **kwargs):
         self._visible = True
@@ -48,6 +111,8 @@ class TTkCanvas:
         self._height = 0
         self._data = [[]]
         self._colors = [[]]
+        self._dirtyRows = bytearray()
+        self._opacity = []
         self._newWidth = kwargs.get('width', 0 )
         self._newHeight = kwargs.get('height', 0 )
         self.updateSize()
@@ -76,14 +141,32 @@ class TTkCanvas:
         else:
             baseData = [' ']*w
             baseColors = [TTkColor.RST]*w
-        self._data   = [baseData.copy()   for _ in range(h)]
-        self._colors = [baseColors.copy() for _ in range(h)]
+        if TTkCanvasPool.bucket(w,h) == TTkCanvasPool.bucket(self._width,self._height):
+            TTkCanvasPool._stats['inPlace'] += 1
+        else:
+            if self._width and self._height:
+                TTkCanvasPool.release(self._width, self._height, (self._data, self._colors))
+            self._data, self._colors = TTkCanvasPool.acquire(w,h) or ([],[])
+        TTkCanvas._fitRows(self._data,   baseData,   h)
+        TTkCanvas._fitRows(self._colors, baseColors, h)
         if self._doubleBuffer:
-            self._bufferedData   = [baseData.copy()   for _ in range(h)]
-            self._bufferedColors = [baseColors.copy() for _ in range(h)]
+            baseData = [' ']*w
+            baseColors = [TTkColor.RST]*w
+            TTkCanvas._fitRows(self._bufferedData,   baseData,   h)
+            TTkCanvas._fitRows(self._bufferedColors, baseColors, h)
+        self._dirtyRows = bytearray(b'\x01')*h
+        self._opacity = [()]*h
         self._height = h
         self._width  = w
 
+    @staticmethod
+    def _fitRows(rows, base, h):
+        ''' Reset in place h rows with the content of base, adding or removing the missing rows '''
+        del rows[h:]
+        for row in rows:
+            row[:] = base
+        rows.extend(base.copy() for _ in range(h-len(rows)))
+
     def size(self):
         return (self._width, self._height)
 
@@ -105,14 +188,20 @@ class TTkCanvas:
         else:
             baseData = [' ']*w
             baseColors = [TTkColor.RST]*w
-        self._data   = [baseData.copy()   for _ in range(h)]
-        self._colors = [baseColors.copy() for _ in range(h)]
+        # Reuse the rows storage
+        for row in self._data:
+            row[:] = baseData
+        for row in self._colors:
+            row[:] = baseColors
+        self._dirtyRows[:] = b'\x01'*h
 
     def copy(self):
         ret = TTkCanvas()
         ret._width = self._width
         ret._height = self._height
         ret._data, ret._colors = self.copyBuffers()
+        ret._dirtyRows = bytearray(b'\x01')*self._height
+        ret._opacity = [()]*self._height
 
     def copyBuffers(self):
         h = self._height
@@ -131,6 +220,7 @@ class TTkCanvas:
            0 <= _x < self._width  :
             self._data[_y][_x] = _ch
             self._colors[_y][_x] = _col.mod(_x,_y)
+            self._dirtyRows[_y] = 1
 
     def fill(self, pos=(0,0), size=None, char=' ', color=TTkColor.RST):
         w,h = self.size()
@@ -153,6 +243,7 @@ class TTkCanvas:
         for iy in range(fya,fyb):
             self._data[iy][fxa:fxb]   = fillCh
             self._colors[iy][fxa:fxb] = fillColor
+        self._dirtyRows[fya:fyb] = b'\x01'*(fyb-fya)
 
     def drawVLine(self, pos, size, color=TTkColor.RST):
         if size == 0: return
@@ -223,6 +314,7 @@ class TTkCanvas:
         if forceColor:
             colors=[color]*len(colors)
         a,b = max(0,-x), min(len(txt),self._width-x)
+        self._dirtyRows[y] = 1
         for i in range(a,b):
             #self._set(y, x+i, txt[i-x], colors[i-x])
             self._data[y][x+i] = txt[i]
@@ -599,6 +691,7 @@ class TTkCanvas:
     '''
     geom  = (x,y,w,h)
     bound = (x,y,w,h)
+    clip  = (x,y,w,h) optional, the only area of this canvas to be updated
 
                     x                       x+w
     canvas:         |xxxxxxxxxxxxxxxxxxxxxxx|
@@ -608,7 +701,28 @@ class TTkCanvas:
                           0                      self._width
     self._canvas:         |----|xxxxxx|----------|
     '''
-    def paintCanvas(self, canvas, geom, _slice, bound):
+    # Any write reset the row flag to 1 (to be pushed),
+    # the bit 2 marks a valid opacity mask of a transparent canvas
+    _OPACITY_VALID = 0x02
+    # Runs of transparent (0), mixed (1) and opaque (2) cells
+    _opacityRe = re.compile(rb'\x00+|\x01+|\x02+')
+
+    @staticmethod
+    def _maskRuns(mask:bytes) -> tuple:
+        ''' Return the (start, end, kind) runs of an opacity mask '''
+        return tuple((m.start(), m.end(), mask[m.start()]) for m in TTkCanvas._opacityRe.finditer(mask))
+
+    def _opacityRuns(self, y:int) -> tuple:
+        ''' Return the opacity runs of the row y of a transparent canvas,
+        the mask is rebuilt only if the row has been written since the last call
+        '''
+        if not self._dirtyRows[y] & TTkCanvas._OPACITY_VALID:
+            self._opacity[y] = TTkCanvas._maskRuns(bytes(
+                [(d is not None)+(c is not None) for d,c in zip(self._data[y],self._colors[y])]))
+            self._dirtyRows[y] |= TTkCanvas._OPACITY_VALID
+        return self._opacity[y]
+
+    def paintCanvas(self, canvas, geom, _slice, bound, clip=None):
         # TTkLog.debug(f"PaintCanvas:{geom=} {bound=} {self._widget._name=} {self._data[0] if self._data else 1234}")
         x, y, w, h  = geom
         bx,by,bw,bh = bound
@@ -620,12 +734,13 @@ class TTkCanvas:
         if bx+bw<0 or by+bh<0 or bx>=cw or by>=ch: return
         if x+w<=bx or y+h<=by or bx+bw<=x or by+bh<=y: return
 
-        if (0,0,cw,ch)==geom==bound and (cw,ch)==canvas.size() and not canvas._transparent:
+        if clip is None and (0,0,cw,ch)==geom==bound and (cw,ch)==canvas.size() and not canvas._transparent:
             # fast Copy
             # the canvas match exactly on top of the current one
             for y in range(h):
-                self._data[y]   = canvas._data[y].copy()
-                self._colors[y] = canvas._colors[y].copy()
+                self._data[y][:]   = canvas._data[y]
+                self._colors[y][:] = canvas._colors[y]
+            self._dirtyRows[:] = b'\x01'*h
             return
 
         x = min(x,cw-1)
@@ -639,38 +754,76 @@ class TTkCanvas:
         hslice = min(h if y+h < by+bh else by+bh-y,canvas._height)
 
         a, b = x+xoffset, x+wslice
-        slice_ab  = slice(a,b)
-        slice_off = slice(xoffset,wslice)
+        # The clip area restrict the updated cells,
+        # the wide chars checks are still evaluated on the real edges (a,b)
+        if clip is None:
+            ca, cb = a, b
+            cya, cyb = yoffset, hslice
+            clipa, clipb = 0, cw
+        else:
+            clx,cly,clw,clh = clip
+            ca,  cb  = max(a,clx), min(b,clx+clw)
+            cya, cyb = max(yoffset,cly-y), min(hslice,cly+clh-y)
+            clipa, clipb = max(0,clx), min(cw,clx+clw)
+            cb = max(ca,cb)
+            if cya>=cyb: return
+        self._dirtyRows[y+cya:y+cyb] = b'\x01'*(cyb-cya)
+        slice_ab  = slice(ca,cb)
+        slice_off = slice(ca-x,cb-x)
         if canvas._transparent:
-            for iy in range(yoffset,hslice):
-                if None in canvas._data[iy][slice_off]:
-                    self._data[y+iy][slice_ab]   = [cca if cca is not None else ccb for cca,ccb in zip(canvas._data[iy][slice_off],self._data[y+iy][slice_ab])]
-                else:
-                    self._data[y+iy][slice_ab]   = canvas._data[iy][slice_off]
-                if None in canvas._colors[iy][slice_off]:
-                    self._colors[y+iy][slice_ab] = [cca if cca else ccb for cca,ccb in zip(canvas._colors[iy][slice_off],self._colors[y+iy][slice_ab])]
-                else:
-                    self._colors[y+iy][slice_ab] = canvas._colors[iy][slice_off]
+            # Only the opaque runs are copied,
+            # the cells are merged one by one only in the partially transparent runs
+            sa, sb = ca-x, cb-x
+            for iy in range(cya,cyb):
+                srcData,  srcColors = canvas._data[iy], canvas._colors[iy]
+                dstData,  dstColors = self._data[y+iy], self._colors[y+iy]
+                for ra,rb,kind in canvas._opacityRuns(iy):
+                    if rb <= sa: continue
+                    if ra >= sb: break
+                    if not kind: continue
+                    ra, rb = max(ra,sa), min(rb,sb)
+                    if kind == 2:
+                        dstData[ra+x:rb+x]   = srcData[ra:rb]
+                        dstColors[ra+x:rb+x] = srcColors[ra:rb]
+                    else:
+                        dstData[ra+x:rb+x]   = [cca if cca is not None else ccb for cca,ccb in zip(srcData[ra:rb],dstData[ra+x:rb+x])]
+                        dstColors[ra+x:rb+x] = [cca if cca else ccb for cca,ccb in zip(srcColors[ra:rb],dstColors[ra+x:rb+x])]
         else:
-            for iy in range(yoffset,hslice):
+            for iy in range(cya,cyb):
                 self._data[y+iy][slice_ab]   = canvas._data[iy][slice_off]
                 self._colors[y+iy][slice_ab] = canvas._colors[iy][slice_off]
 
-        for iy in range(yoffset,hslice):
+        for iy in range(cya,cyb):
             # Check the full wide chars on the edge of the two canvasses
-            if ((0 <= a < cw) and self._data[y+iy][a]==''):
+            if ((clipa <= a < clipb) and self._data[y+iy][a]==''):
                 self._data[y+iy][a]   = TTkCfg.theme.unicodeWideOverflowCh[0]
                 self._colors[y+iy][a] = TTkString.unicodeWideOverflowColor
-            if ((0 < b <= cw) and self._data[y+iy][b-1] and TTkString._isWideCharData(self._data[y+iy][b-1])):
+            if ((clipa < b <= clipb) and self._data[y+iy][b-1] and TTkString._isWideCharData(self._data[y+iy][b-1])):
                 self._data[y+iy][b-1]   = TTkCfg.theme.unicodeWideOverflowCh[1]
                 self._colors[y+iy][b-1] = TTkString.unicodeWideOverflowColor
-            if ((0 < a <= cw) and self._data[y+iy][a-1] and TTkString._isWideCharData(self._data[y+iy][a-1])):
+            if ((clipa < a <= clipb) and self._data[y+iy][a-1] and TTkString._isWideCharData(self._data[y+iy][a-1])):
                 self._data[y+iy][a-1]   = TTkCfg.theme.unicodeWideOverflowCh[1]
                 self._colors[y+iy][a-1] = TTkString.unicodeWideOverflowColor
-            if ((0 <= b < cw) and self._data[y+iy][b]==''):
+            if ((clipa <= b < clipb) and self._data[y+iy][b]==''):
                 self._data[y+iy][b]   = TTkCfg.theme.unicodeWideOverflowCh[0]
                 self._colors[y+iy][b] = TTkString.unicodeWideOverflowColor
 
+    def copyRect(self, canvas, rect):
+        ''' Copy the area (x,y,w,h) of a canvas with the same size,
+        the transparent cells are copied as well
+
+        :param canvas: the source canvas
+        :param rect: the area to be copied
+        '''
+        x,y,w,h = rect
+        a, b = max(0,x), min(self._width, canvas._width, x+w)
+        if a>=b: return
+        ya, yb = max(0,y), min(self._height, canvas._height, y+h)
+        for iy in range(ya, yb):
+            self._data[iy][a:b]   = canvas._data[iy][a:b]
+            self._colors[iy][a:b] = canvas._colors[iy][a:b]
+        self._dirtyRows[ya:yb] = b'\x01'*max(0,yb-ya)
+
     def toAnsi(self):
         # TTkLog.debug("pushToTerminal")
         ret = ""
@@ -712,85 +865,38 @@ class TTkCanvas:
         baseColors = [TTkColor.RST]*w
         self._bufferedData   = [baseData.copy()   for _ in range(h)]
         self._bufferedColors = [baseColors.copy() for _ in range(h)]
+        self._dirtyRows[:] = b'\x01'*h
+
+    def cleanDirtyRows(self):
+        ''' Mark all the rows as pushed to the terminal,
+        to be used after all the damaged areas of the frame are pushed
+        '''
+        self._dirtyRows[:] = bytes(self._height)
 
     def pushToTerminalBuffered(self, x, y, w, h):
         # TTkLog.debug("pushToTerminal")
+        # Only the dirty rows of the area (x,y,w,h) are compared with the terminal buffer
+        # and the changed rows are copied back to it
         data, colors = self._data, self._colors
         oldData, oldColors = self._bufferedData, self._bufferedColors
-        lastcolor = TTkColor.RST
-        empty = True
-        ansi = ""
-        for y,(lda,ldb,lca,lcb) in enumerate(zip(data,oldData,colors,oldColors)):
-            for x,(da,db,ca,cb) in enumerate(zip(lda,ldb,lca,lcb)):
-                if da==db and ca==cb:
-                    if not empty:
-                        TTkTerm.push(ansi)
-                        empty=True
-                    continue
-                ch = da
-                color = ca
-                if empty:
-                    ansi = TTkTerm.Cursor.moveTo(y+1,x+1)
-                    empty = False
-                if color != lastcolor:
-                    ansi += str(color-lastcolor)
-                    lastcolor = color
-                ansi+=ch
-            if not empty:
-                TTkTerm.push(ansi)
-                empty=True
+        dirtyRows = self._dirtyRows
+        encoder = TTkCanvasEncoder(self._width)
+        xa, xb = max(0,x), min(self._width,x+w)
+        # The dirty flag can be reset only if the whole row is processed
+        fullRow = xa==0 and xb==self._width
+        for y in range(max(0,y), min(self._height,y+h)):
+            if not dirtyRows[y]: continue
+            if fullRow: dirtyRows[y] = 0
+            lda,ldb,lca,lcb = data[y][xa:xb],oldData[y][xa:xb],colors[y][xa:xb],oldColors[y][xa:xb]
+            if lda==ldb and lca==lcb: continue
+            changed = [x for x,(da,db,ca,cb) in enumerate(zip(lda,ldb,lca,lcb),xa) if da!=db or ca!=cb]
+            TTkTerm.push(encoder.encodeRow(y, data[y], colors[y], changed))
+            oldData[y][xa:xb]   = lda
+            oldColors[y][xa:xb] = lca
         # Reset the color at the end
-        TTkTerm.push(TTkColor.RST)
+        if rst := encoder.reset():
+            TTkTerm.push(rst)
         # TTkTerm.flush()
-        # Switch the buffer
-        self._bufferedData, self._bufferedColors = data, colors
-        self._data,         self._colors         = oldData, oldColors
 
-    def pushToTerminalBufferedNew(self, x, y, w, h):
-        # TTkLog.debug("pushToTerminal")
-        data, colors = self._data, self._colors
-        oldData, oldColors = self._bufferedData, self._bufferedColors
-        lastcolor = TTkColor.RST
-        empty = True
-        ansi = ""
-        for y,(lda,ldb,lca,lcb) in enumerate(zip(data,oldData,colors,oldColors)):
-            count = 0
-            chBk = ''
-            for x,(da,db,ca,cb) in enumerate(zip(lda,ldb,lca,lcb)):
-                if da==db and ca==cb:
-                    if not empty:
-                        ansi += "" if not chBk else chBk*count if count<=4 else f"{chBk}\033[{count-1}b"
-                        TTkTerm.push(ansi)
-                        count = 0
-                        chBk = ''
-                        empty=True
-                    continue
-                ch = da
-                color = ca
-                if empty:
-                    ansi = ("" if not chBk else chBk*count if count<=4 else f"{chBk}\033[{count-1}b") + TTkTerm.Cursor.moveTo(y+1,x+1)
-                    empty = False
-                    count = 0
-                    chBk = ''
-                if color != lastcolor:
-                    ansi += ("" if not chBk else chBk*count if count<=4 else f"{chBk}\033[{count-1}b") + str(color-lastcolor)
-                    lastcolor = color
-                    count = 0
-                    chBk = ''
-                # "Collect the consecutive characters"
-                if ch == chBk:
-                    count+=1
-                else:
-                    ansi += "" if not chBk else chBk*count if count<=4 else f"{chBk}\033[{count-1}b"
-                    chBk = ch
-                    count=1
-                # ansi+=ch
-            if not empty:
-                ansi += "" if not chBk else chBk*count if count<=4 else f"{chBk}\033[{count-1}b"
-                TTkTerm.push(ansi)
-                empty=True
-        # Reset the color at the end
-        TTkTerm.push(TTkColor.RST)
-        # Switch the buffer
-        self._bufferedData, self._bufferedColors = data, colors
-        self._data,         self._colors         = oldData, oldColors
\ No newline at end of file
+    # The REP encoding of the "new renderer" is now a capability of the encoder
+    pushToTerminalBufferedNew = pushToTerminalBuffered
@@ -0,0 +1,214 @@
+# MIT License
+#
+# Copyright (c) 2024 Eugenio Parodi <ceccopierangiolieugenio AT googlemail DOT com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+__all__ = ['TTkCanvasEncoder']
+
+from TermTk.TTkCore.TTkTerm.term import TTkTerm
+from TermTk.TTkCore.color import TTkColor
+from TermTk.TTkCore.string import TTkString
+
+class TTkCanvasEncoder():
+    '''TTkCanvasEncoder
+
+    Output stage between the canvas diff and the terminal,
+    it encodes the changed cells of each row choosing the cheapest sequence among:
+
+    * absolute (:meth:`~TermTk.TTkCore.TTkTerm.term_base.TTkTermBase.Cursor.moveTo`) or relative (CUF/CUB/CUD/CUU/CHA) cursor movements,
+    * the unchanged cells of a short gap emitted again instead of moving the cursor,
+    * REP (CSI n b) for the repeated glyphs,
+    * ECH (CSI n X) and EL (CSI K) for the blank runs.
+
+    Only the sequences allowed by the terminal :class:`~TermTk.TTkCore.TTkTerm.term_base.TTkTermBase.Caps` are used.
+
+    :param width: the width of the rows
+    :type width: int
+    :param caps: the allowed capabilities, defaults to :class:`~TermTk.TTkCore.TTkTerm.term_base.TTkTermBase`.capabilities
+    :type caps: int, optional
+    '''
+    __slots__ = ('_width', '_caps', '_cx', '_cy', '_color')
+
+    # The longest unchanged gap that is worth to be emitted again
+    MAX_GAP = 16
+
+    def __init__(self, width:int, caps:int=None):
+        self._width = width
+        self._caps = TTkTerm.capabilities if caps is None else caps
+        # The cursor position is unknown at the beginning
+        self._cx = self._cy = None
+        self._color = TTkColor.RST
+
+    @staticmethod
+    def _csi(n:int, cmd:str) -> str:
+        return f'\033[{n}{cmd}' if n!=1 else f'\033[{cmd}'
+
+    @staticmethod
+    def _bytes(ch:str) -> int:
+        return len(ch) if ch.isascii() else len(ch.encode())
+
+    def _moveStr(self, cx:int, cy:int, x:int, y:int) -> str:
+        ''' Return the cheapest movement from (cx,cy) to (x,y)'''
+        if cx == x and cy == y: return ''
+        ret = TTkTerm.Cursor.moveTo(y+1,x+1)
+        if cx is None or not self._caps & TTkTerm.Caps.RELMOVE:
+            return ret
+        csi = TTkCanvasEncoder._csi
+        if   cy < y: rel = csi(y-cy,'B')
+        elif cy > y: rel = csi(cy-y,'A')
+        else:        rel = ''
+        if cx != x:
+            hor = csi(x-cx,'C') if cx < x else csi(cx-x,'D')
+            cha = csi(x+1,'G')
+            rel += hor if len(hor) <= len(cha) else cha
+        return rel if len(rel) < len(ret) else ret
+
+    def _erasable(self, color) -> bool:
+        # The erased cells have no attributes and the background of the current color (BCE)
+        # or the default background
+        if color._mod or color._link: return False
+        if not color._bg: return True
+        return bool(self._caps & TTkTerm.Caps.BCE)
+
+    def _bridge(self, y:int, data, colors, a:int, b:int) -> bool:
+        ''' Return True if emitting again the unchanged cells [a,b) is cheaper than moving the cursor'''
+        if b-a > TTkCanvasEncoder.MAX_GAP: return False
+        cost = 0
+        color = colors[a-1]
+        for ch,c in zip(data[a:b+1],colors[a:b+1]):
+            if c != color:
+                cost += len(c.canvasDiff2Str(color))
+                color = c
+        cost += sum(TTkCanvasEncoder._bytes(ch) for ch in data[a:b])
+        move = len(self._moveStr(a, y, b, y)) + len(colors[b].canvasDiff2Str(colors[a-1]))
+        return cost <= move
+
+    def _cells(self, y:int, data, colors, a:int, b:int) -> (str, bool):
+        ''' Encode the cells [a,b) starting at the current cursor position,
+        return the encoded string and True if the rest of the line has been erased
+        '''
+        caps = self._caps
+        csi = TTkCanvasEncoder._csi
+        w = self._width
+        color = self._color
+        ret = []
+        unsure = False
+        x = a
+        while x < b:
+            ch, c = data[x], colors[x]
+            if not ch:
+                if x > 0 and TTkString._isWideCharData(data[x-1]):
+                    x += 1
+                    continue
+                # Orphan tail of an overwritten wide char,
+                # the terminal shows it as a blank cell
+                ch = ' '
+            e = x+1
+            while e < b and data[e] == ch and colors[e] == c: e += 1
+            n = e-x
+            if c != color:
+                ret.append(c.canvasDiff2Str(color))
+                color = c
+            if ch == ' ' and caps & (TTkTerm.Caps.ECH | TTkTerm.Caps.EL) and self._erasable(c):
+                if (caps & TTkTerm.Caps.EL and e == b and
+                    data[e:].count(' ') == w-e and colors[e:].count(c) == w-e):
+                    ret.append('\033[K')
+                    self._color = color
+                    if unsure:
+                        self._cx = self._cy = None
+                    else:
+                        self._cx = x
+                    return ''.join(ret), True
+                if caps & TTkTerm.Caps.ECH:
+                    ech = csi(n,'X') + (csi(n,'C') if e < b else '')
+                    if len(ech) < n:
+                        ret.append(ech)
+                        x = e if e < b else x
+                        if e == b: break
+                        continue
+            elif n > 1 and caps & TTkTerm.Caps.REP and len(ch) == 1 and ch.isprintable() and not TTkString._isWideCharData(ch):
+                rep = csi(n-1,'b')
+                if len(rep) < (n-1)*TTkCanvasEncoder._bytes(ch):
+                    ret.append(ch+rep)
+                    x = e
+                    continue
+            # Combined glyphs may have a different width in the terminal
+            unsure |= len(ch) > 1
+            ret.append(ch*n)
+            x = e
+            if (not ch.isascii() and (x >= w or data[x] != '') and
+                TTkString._isWideCharData(ch)):
+                # Wide glyph without its tail, it spills on the next cell
+                if x < b:
+                    ret.append(TTkTerm.Cursor.moveTo(y+1,x+1))
+                else:
+                    unsure = True
+        self._color = color
+        if unsure or x >= w:
+            # Unknown cursor position or pending wrap at the end of the line
+            self._cx = self._cy = None
+        else:
+            self._cx = x
+        return ''.join(ret), False
+
+    def encodeRow(self, y:int, data, colors, changed) -> str:
+        ''' Encode the changed cells of a row
+
+        :param y: the row
+        :type y: int
+        :param data: the glyphs of the full row
+        :type data: list[str]
+        :param colors: the colors of the full row
+        :type colors: list[:class:`~TermTk.TTkCore.color.TTkColor`]
+        :param changed: the sorted columns of the changed cells
+        :type changed: list[int]
+        '''
+        w = self._width
+        ret = []
+        k, n = 0, len(changed)
+        while k < n:
+            a = changed[k]
+            k += 1
+            if a > 0 and data[a] == '':
+                # The tail of an unchanged wide char
+                continue
+            # Extend the span over the following changed cells
+            # and the short unchanged gaps cheaper than a cursor movement
+            b = a+1
+            while k < n:
+                nx = changed[k]
+                if nx > b and not self._bridge(y, data, colors, b, nx): break
+                b = nx+1
+                k += 1
+            # Keep the tail of the wide chars
+            if b < w and data[b] == '': b += 1
+            ret.append(self._moveStr(self._cx, self._cy, a, y))
+            self._cx, self._cy = a, y
+            txt, eol = self._cells(y, data, colors, a, b)
+            ret.append(txt)
+            if eol: break
+        return ''.join(ret)
+
+    def reset(self) -> str:
+        ''' Return the sequence required to restore the default color'''
+        if self._color == TTkColor.RST:
+            return ''
+        self._color = TTkColor.RST
+        return str(TTkColor.RST)
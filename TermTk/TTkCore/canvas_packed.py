@@ -0,0 +1,451 @@
+# MIT License
+#
+# Copyright (c) 2024 Eugenio Parodi <ceccopierangiolieugenio AT googlemail DOT com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+__all__ = ['TTkCanvasPacked']
+
+from array import array
+from weakref import WeakSet
+
+from TermTk.TTkCore.TTkTerm.term import TTkTerm
+from TermTk.TTkCore.constant import TTkK
+from TermTk.TTkCore.cfg import TTkCfg
+from TermTk.TTkCore.color import TTkColor
+from TermTk.TTkCore.string import TTkString
+from TermTk.TTkCore.canvas import TTkCanvas
+from TermTk.TTkCore.canvas_encoder import TTkCanvasEncoder
+
+class _TTkCellTable():
+    ''' Interning table used to map the glyphs/colors to small integers
+
+    The id 0 is reserved to the transparent cell (None)
+
+    The table is shared by all the packed canvases,
+    in this way the ids can be compared across canvases without any lookup
+
+    The table is bounded, once it grows over maxSize the ids not used by any
+    packed canvas are released at the next frame (:meth:`TTkCanvasPacked.compactTables`)
+    '''
+    __slots__ = ('_ids', '_items', '_key')
+    maxSize = 0x10000
+
+    def __init__(self, key=None):
+        self._ids = {None:0}
+        self._items = [None]
+        self._key = key
+
+    def _keyOf(self, item):
+        return item if (self._key is None or item is None) else self._key(item)
+
+    def id(self, item) -> int:
+        if (ret := self._ids.get(key := self._keyOf(item))) is None:
+            ret = self._ids[key] = len(self._items)
+            self._items.append(item)
+        return ret
+
+    def ids(self, items) -> array:
+        return array('I', [self.id(i) for i in items])
+
+    def item(self, id:int):
+        return self._items[id]
+
+    def isFull(self) -> bool:
+        return len(self._items) > self.maxSize
+
+    def compact(self, used:set) -> list:
+        '''Keep only the used ids and return the map from the old ids to the new ones'''
+        remap = [0]*len(self._items)
+        self._ids, items = {None:0}, [None]
+        for oldId in sorted(used):
+            if not oldId: continue
+            item = self._items[oldId]
+            remap[oldId] = self._ids[self._keyOf(item)] = len(items)
+            items.append(item)
+        self._items = items
+        return remap
+
+    def __len__(self):
+        return len(self._items)
+
+# The key is made by the only fields used to render the color
+_glyphs = _TTkCellTable()
+_colors = _TTkCellTable(key=lambda c: (c._fg, c._bg, c._mod, c._link, c._clean))
+# All the packed canvases, their ids are remapped when the tables are compacted
+_canvases = WeakSet()
+
+class TTkCanvasPacked(TTkCanvas):
+    ''' Canvas where each cell is stored as interned integer ids
+
+    This is an alternative backend of :class:`~TermTk.TTkCore.canvas.TTkCanvas`,
+    glyphs and colors are stored in two flat :py:class:`array.array` ('I') of width*height items
+    and compared as integers during the composition and the diff with the terminal buffer.
+
+    It is enabled with the "TERMTK_PACKEDCANVAS" env variable or setting :class:`~TermTk.TTkCore.cfg.TTkCfg`.packedCanvas
+
+    :param  width: the width of the Canvas
+    :param  height: the height of the Canvas
+    '''
+    __slots__ = (
+        '_glyphs', '_colorIds',
+        '_bufferedGlyphs', '_bufferedColorIds',
+        '__weakref__')
+    def __init__(self, *args, **kwargs):
+        self._glyphs = array('I')
+        self._colorIds = array('I')
+        super().__init__(*args, **kwargs)
+        _canvases.add(self)
+
+    @staticmethod
+    def _baseIds(transparent):
+        if transparent:
+            return 0, 0
+        return _glyphs.id(' '), _colors.id(TTkColor.RST)
+
+    @staticmethod
+    def tableSizes():
+        '''Return the number of the interned (glyphs, colors)'''
+        return len(_glyphs), len(_colors)
+
+    @staticmethod
+    def compactTables(force:bool=False) -> None:
+        '''Release the interned glyphs/colors not used by any packed canvas
+
+        It is called at the beginning of each frame and it is a noop until one of the tables is full,
+        the ids stored in the canvases are remapped to the compacted tables.
+        '''
+        if not (force or _glyphs.isFull() or _colors.isFull()):
+            return
+        canvases = list(_canvases)
+        for table, buffers in (
+                (_glyphs, ('_glyphs',   '_bufferedGlyphs')),
+                (_colors, ('_colorIds', '_bufferedColorIds'))):
+            arrays = [a for c in canvases for b in buffers if (a := getattr(c, b, None)) is not None]
+            used = set()
+            for a in arrays:
+                used.update(a)
+            remap = table.compact(used)
+            for a in arrays:
+                a[:] = array('I', [remap[i] for i in a])
+
+    def enableDoubleBuffer(self):
+        self._doubleBuffer = True
+        self._bufferedGlyphs, self._bufferedColorIds = self.copyBuffers()
+
+    def updateSize(self):
+        if not self._visible: return
+        w,h = self._newWidth, self._newHeight
+        if w  == self._width and h == self._height:
+            return
+        g,c = self._baseIds(self._transparent)
+        self._glyphs   = array('I',[g])*(w*h)
+        self._colorIds = array('I',[c])*(w*h)
+        if self._doubleBuffer:
+            g,c = self._baseIds(False)
+            self._bufferedGlyphs   = array('I',[g])*(w*h)
+            self._bufferedColorIds = array('I',[c])*(w*h)
+        self._dirtyRows = bytearray(b'\x01')*h
+        self._opacity = [()]*h
+        self._height = h
+        self._width  = w
+
+    def clean(self):
+        if not self._visible: return
+        g,c = self._baseIds(self._transparent)
+        size = self._width*self._height
+        self._glyphs[:]   = array('I',[g])*size
+        self._colorIds[:] = array('I',[c])*size
+        self._dirtyRows[:] = b'\x01'*self._height
+
+    def copy(self):
+        ret = TTkCanvasPacked()
+        ret._width = ret._newWidth = self._width
+        ret._height = ret._newHeight = self._height
+        ret._transparent = self._transparent
+        ret._glyphs, ret._colorIds = self.copyBuffers()
+        ret._dirtyRows = bytearray(b'\x01')*self._height
+        ret._opacity = [()]*self._height
+        return ret
+
+    def copyBuffers(self):
+        return array('I', self._glyphs), array('I', self._colorIds)
+
+    def _set(self, _y, _x, _ch, _col=TTkColor.RST):
+        if 0 <= _y < self._height and \
+           0 <= _x < self._width  :
+            i = _y*self._width+_x
+            self._glyphs[i]   = _glyphs.id(_ch)
+            self._colorIds[i] = _colors.id(_col.mod(_x,_y))
+            self._dirtyRows[_y] = 1
+
+    def fill(self, pos=(0,0), size=None, char=' ', color=TTkColor.RST):
+        w,h = self.size()
+        if not size:
+            size=(w,h)
+        fxa,fya = pos
+        fw,fh = size
+        fxb,fyb = fxa+fw, fya+fh
+        # the fill area is outside the boundaries
+        if ( fxa >= w or fya >= h or
+             fxb <= 0 or fyb <= 0): return
+
+        fxa = max(0,fxa)
+        fya = max(0,fya)
+        fxb = min(w,fxb)
+        fyb = min(h,fyb)
+
+        fillCh    = array('I',[_glyphs.id(char)])*(fxb-fxa)
+        fillColor = array('I',[_colors.id(color)])*(fxb-fxa)
+        for iy in range(fya,fyb):
+            self._glyphs[iy*w+fxa:iy*w+fxb]   = fillCh
+            self._colorIds[iy*w+fxa:iy*w+fxb] = fillColor
+        self._dirtyRows[fya:fyb] = b'\x01'*(fyb-fya)
+
+    def drawTTkString(self, pos, text, width=None, color=TTkColor.RST, alignment=TTkK.NONE, forceColor=False):
+        if not self._visible: return
+
+        # Check the size and bounds
+        x,y = pos
+        if y<0 or y>=self._height : return
+
+        lentxt = text.termWidth()
+        if width is None or width<0:
+            width = lentxt
+
+        if x+width<0 or x>=self._width : return
+
+        text = text.align(width=width, alignment=alignment, color=color)
+        txt, colors = text.tab2spaces().getData()
+        if forceColor:
+            colors=[color]*len(colors)
+        a,b = max(0,-x), min(len(txt),self._width-x)
+        if a>=b: return
+        colorBg = color.background()
+        colorId = _colors.id
+        def _color(i,c):
+            if c == TTkColor.RST != color:
+                return colorId(color.mod(x+i,y))
+            elif (not c.background()) and colorBg:
+                return colorId((color + c).mod(x+i,y))
+            return colorId(c.mod(x+i,y))
+        s = y*self._width+x
+        self._dirtyRows[y] = 1
+        self._glyphs[s+a:s+b]   = _glyphs.ids(txt[a:b])
+        self._colorIds[s+a:s+b] = array('I',[_color(i,colors[i]) for i in range(a,b)])
+        # Check the full wide chars on the edge of the two canvasses
+        overflowColor = _colors.id(TTkString.unicodeWideOverflowColor)
+        if _glyphs.item(self._glyphs[s+a]) == '':
+            self._glyphs[s+a]   = _glyphs.id(TTkCfg.theme.unicodeWideOverflowCh[0])
+            self._colorIds[s+a] = overflowColor
+        if TTkString._isWideCharData(_glyphs.item(self._glyphs[s+b-1])):
+            self._glyphs[s+b-1]   = _glyphs.id(TTkCfg.theme.unicodeWideOverflowCh[1])
+            self._colorIds[s+b-1] = overflowColor
+
+    def _opacityRuns(self, y:int) -> tuple:
+        if not self._dirtyRows[y] & TTkCanvas._OPACITY_VALID:
+            s, e = y*self._width, (y+1)*self._width
+            self._opacity[y] = TTkCanvas._maskRuns(bytes(
+                [(g!=0)+(c!=0) for g,c in zip(self._glyphs[s:e],self._colorIds[s:e])]))
+            self._dirtyRows[y] |= TTkCanvas._OPACITY_VALID
+        return self._opacity[y]
+
+    def paintCanvas(self, canvas, geom, _slice, bound, clip=None):
+        x, y, w, h  = geom
+        bx,by,bw,bh = bound
+        cw,ch = self.size()
+        # out of bound
+        if not self._visible: return
+        if not canvas._visible: return
+        if canvas._width<=0 or canvas._height<=0: return
+        if bx+bw<0 or by+bh<0 or bx>=cw or by>=ch: return
+        if x+w<=bx or y+h<=by or bx+bw<=x or by+bh<=y: return
+
+        srcGlyphs, srcColorIds = self._canvasIds(canvas)
+
+        if clip is None and (0,0,cw,ch)==geom==bound and (cw,ch)==canvas.size() and not canvas._transparent:
+            # fast Copy
+            # the canvas match exactly on top of the current one
+            self._glyphs[:]   = srcGlyphs
+            self._colorIds[:] = srcColorIds
+            self._dirtyRows[:] = b'\x01'*ch
+            return
+
+        x = min(x,cw-1)
+        y = min(y,ch-1)
+        w = min(w,cw-x)
+        h = min(h,ch-y)
+
+        xoffset = min(max(0,bx-x),canvas._width-1)
+        yoffset = min(max(0,by-y),canvas._height-1)
+        wslice = min(w if x+w < bx+bw else bx+bw-x,canvas._width)
+        hslice = min(h if y+h < by+bh else by+bh-y,canvas._height)
+
+        a, b = x+xoffset, x+wslice
+        if a>=b: return
+        if clip is None:
+            ca, cb = a, b
+            cya, cyb = yoffset, hslice
+            clipa, clipb = 0, cw
+        else:
+            clx,cly,clw,clh = clip
+            ca,  cb  = max(a,clx), min(b,clx+clw)
+            cya, cyb = max(yoffset,cly-y), min(hslice,cly+clh-y)
+            clipa, clipb = max(0,clx), min(cw,clx+clw)
+            cb = max(ca,cb)
+            if cya>=cyb: return
+        self._dirtyRows[y+cya:y+cyb] = b'\x01'*(cyb-cya)
+        sw = canvas._width
+        dstG, dstC = self._glyphs, self._colorIds
+        if ca<cb and canvas._transparent:
+            # Only the opaque runs are copied,
+            # the cells are merged one by one only in the partially transparent runs
+            for iy in range(cya,cyb):
+                so, do = iy*sw-x, (y+iy)*cw
+                for ra,rb,kind in canvas._opacityRuns(iy):
+                    ra, rb = ra+x, rb+x
+                    if rb <= ca: continue
+                    if ra >= cb: break
+                    if not kind: continue
+                    ra, rb = max(ra,ca), min(rb,cb)
+                    if kind == 2:
+                        dstG[do+ra:do+rb] = srcGlyphs[so+ra:so+rb]
+                        dstC[do+ra:do+rb] = srcColorIds[so+ra:so+rb]
+                    else:
+                        dstG[do+ra:do+rb] = array('I',[cca or ccb for cca,ccb in zip(srcGlyphs[so+ra:so+rb],dstG[do+ra:do+rb])])
+                        dstC[do+ra:do+rb] = array('I',[cca or ccb for cca,ccb in zip(srcColorIds[so+ra:so+rb],dstC[do+ra:do+rb])])
+        elif ca<cb:
+            for iy in range(cya,cyb):
+                sa, sb = iy*sw+ca-x, iy*sw+cb-x
+                da, db = (y+iy)*cw+ca, (y+iy)*cw+cb
+                dstG[da:db] = srcGlyphs[sa:sb]
+                dstC[da:db] = srcColorIds[sa:sb]
+
+        emptyId = _glyphs.id('')
+        overflowColor = _colors.id(TTkString.unicodeWideOverflowColor)
+        overflowL = _glyphs.id(TTkCfg.theme.unicodeWideOverflowCh[0])
+        overflowR = _glyphs.id(TTkCfg.theme.unicodeWideOverflowCh[1])
+        _isWide = lambda gid: gid and TTkString._isWideCharData(_glyphs.item(gid))
+        for iy in range(cya,cyb):
+            row = (y+iy)*cw
+            # Check the full wide chars on the edge of the two canvasses
+            if ((clipa <= a < clipb) and dstG[row+a]==emptyId):
+                dstG[row+a], dstC[row+a] = overflowL, overflowColor
+            if ((clipa < b <= clipb) and _isWide(dstG[row+b-1])):
+                dstG[row+b-1], dstC[row+b-1] = overflowR, overflowColor
+            if ((clipa < a <= clipb) and _isWide(dstG[row+a-1])):
+                dstG[row+a-1], dstC[row+a-1] = overflowR, overflowColor
+            if ((clipa <= b < clipb) and dstG[row+b]==emptyId):
+                dstG[row+b], dstC[row+b] = overflowL, overflowColor
+
+    @staticmethod
+    def _canvasIds(canvas):
+        if isinstance(canvas, TTkCanvasPacked):
+            return canvas._glyphs, canvas._colorIds
+        # Foreign (list based) canvas, i.e. the TTkTerminal screen or the Drag pixmaps
+        # Convert it on the fly
+        srcGlyphs   = array('I')
+        srcColorIds = array('I')
+        for row in canvas._data:   srcGlyphs.extend(  _glyphs.ids(row))
+        for row in canvas._colors: srcColorIds.extend(_colors.ids(row))
+        return srcGlyphs, srcColorIds
+
+    def copyRect(self, canvas, rect):
+        x,y,w,h = rect
+        a, b = max(0,x), min(self._width, canvas._width, x+w)
+        if a>=b: return
+        srcGlyphs, srcColorIds = self._canvasIds(canvas)
+        sw, dw = canvas._width, self._width
+        ya, yb = max(0,y), min(self._height, canvas._height, y+h)
+        for iy in range(ya, yb):
+            self._glyphs[iy*dw+a:iy*dw+b]   = srcGlyphs[iy*sw+a:iy*sw+b]
+            self._colorIds[iy*dw+a:iy*dw+b] = srcColorIds[iy*sw+a:iy*sw+b]
+        self._dirtyRows[ya:yb] = b'\x01'*max(0,yb-ya)
+
+    def _rowsAnsi(self, glyphs, colorIds):
+        w = self._width
+        lastcolor = TTkColor.RST
+        lastId = _colors.id(lastcolor)
+        for y in range(self._height):
+            ansi = ""
+            for g,c in zip(glyphs[y*w:y*w+w],colorIds[y*w:y*w+w]):
+                if c != lastId:
+                    color = _colors.item(c)
+                    ansi += str(color-lastcolor)
+                    lastcolor, lastId = color, c
+                ansi += _glyphs.item(g) or ''
+            yield y, ansi, lastcolor
+
+    def toAnsi(self):
+        ret = ""
+        rstColor = str(TTkColor.RST)
+        prevcolor = TTkColor.RST
+        for _, ansi, lastcolor in self._rowsAnsi(self._glyphs, self._colorIds):
+            ret += str(prevcolor) + ansi + (rstColor if lastcolor != TTkColor.RST else '') + '\n'
+            prevcolor = lastcolor
+        return ret
+
+    def pushToTerminal(self, x, y, w, h):
+        self.compactTables()
+        prevcolor = TTkColor.RST
+        for y, ansi, lastcolor in self._rowsAnsi(self._glyphs, self._colorIds):
+            TTkTerm.push(str(prevcolor)+TTkTerm.Cursor.moveTo(y+1,1)+ansi)
+            prevcolor = lastcolor
+
+    def cleanBuffers(self):
+        if not self._visible: return
+        g,c = self._baseIds(False)
+        size = self._width*self._height
+        self._bufferedGlyphs   = array('I',[g])*size
+        self._bufferedColorIds = array('I',[c])*size
+        self._dirtyRows[:] = b'\x01'*self._height
+
+    def pushToTerminalBuffered(self, x, y, w, h):
+        # Only the dirty rows of the area (x,y,w,h) are compared with the terminal buffer
+        # and the changed rows are copied back to it
+        self.compactTables()
+        glyphs, colorIds = self._glyphs, self._colorIds
+        oldGlyphs, oldColorIds = self._bufferedGlyphs, self._bufferedColorIds
+        glyphItem, colorItem = _glyphs._items, _colors._items
+        cw = self._width
+        encoder = TTkCanvasEncoder(cw)
+        dirtyRows = self._dirtyRows
+        xa, xb = max(0,x), min(cw,x+w)
+        fullRow = xa==0 and xb==cw
+        for y in range(max(0,y), min(self._height,y+h)):
+            if not dirtyRows[y]: continue
+            if fullRow: dirtyRows[y] = 0
+            s, e = y*cw+xa, y*cw+xb
+            # Skip the unchanged rows with a single C comparison
+            if glyphs[s:e] == oldGlyphs[s:e] and colorIds[s:e] == oldColorIds[s:e]:
+                continue
+            changed = [x for x,(ga,gb,ca,cb) in enumerate(zip(glyphs[s:e],oldGlyphs[s:e],colorIds[s:e],oldColorIds[s:e]),xa) if ga!=gb or ca!=cb]
+            # The encoder works on the full row of glyphs and colors
+            rs, re = y*cw, y*cw+cw
+            TTkTerm.push(encoder.encodeRow(y,
+                            [glyphItem[g] for g in glyphs[rs:re]],
+                            [colorItem[c] for c in colorIds[rs:re]],
+                            changed))
+            oldGlyphs[s:e]   = glyphs[s:e]
+            oldColorIds[s:e] = colorIds[s:e]
+        # Reset the color at the end
+        if rst := encoder.reset():
+            TTkTerm.push(rst)
+
+    pushToTerminalBufferedNew = pushToTerminalBuffered
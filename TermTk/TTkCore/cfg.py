@@ -34,6 +34,7 @@ class TTkCfg:
     maxFps = 65
     doubleBuffer = True
     doubleBufferNew = False
+    packedCanvas = False
 
     scrollDelta = 5
     theme = None
@@ -60,8 +60,60 @@ from TermTk.TTkCore.helper import TTkHelper
 # [47m          --        set background color to white
 # [49m          2.53      set background color to default (black)
 
+class _TTkColorTable():
+    ''' Interning table of the colors
+
+    Each color get a small integer id the first time it is compared,
+    equal colors (same fg, bg, mod, link) share the same id.
+
+    The table is bounded, once full it is cleared and a new generation starts,
+    the ids are never reused so two different ids issued in the current generation
+    identify two different colors, older ids fallback to the fields comparison.
+    '''
+    maxSize = 0x10000
+
+    _ids = {}
+    _nextId = 1
+    _baseId = 1
+    # Canonical instances returned by the colors composition (+,|)
+    _instances = {}
+    # (id,id) -> color - lastcolor
+    _subCache = {}
+    # (id,id) -> (ansi transition, bytes saved)
+    _diffCache = {}
+    _diffStats = {'hits':0, 'misses':0, 'bytesSaved':0}
+
+    @staticmethod
+    def clear():
+        _TTkColorTable._ids = {}
+        _TTkColorTable._instances = {}
+        _TTkColorTable._subCache = {}
+        _TTkColorTable._diffCache = {}
+        _TTkColorTable._baseId = _TTkColorTable._nextId
+
+    @staticmethod
+    def intern(color) -> int:
+        key = (color._fg, color._bg, color._mod, color._link)
+        if (cid := _TTkColorTable._ids.get(key)) is None:
+            if len(_TTkColorTable._ids) >= _TTkColorTable.maxSize:
+                _TTkColorTable.clear()
+            cid = _TTkColorTable._ids[key] = _TTkColorTable._nextId
+            _TTkColorTable._nextId += 1
+        color._id = cid
+        color._hash = hash(key)
+        return cid
+
+    @staticmethod
+    def instance(fg, bg, mod, link, clean):
+        key = (fg, bg, mod, link, clean)
+        if (ret := _TTkColorTable._instances.get(key)) is None:
+            if len(_TTkColorTable._instances) >= _TTkColorTable.maxSize:
+                _TTkColorTable.clear()
+            ret = _TTkColorTable._instances[key] = TTkColor(fg=fg, bg=bg, mod=mod, link=link, clean=clean)
+        return ret
+
 class _TTkColor:
-    __slots__ = ('_fg','_bg','_mod', '_colorMod', '_link', '_buffer', '_clean')
+    __slots__ = ('_fg','_bg','_mod', '_colorMod', '_link', '_buffer', '_clean', '_id', '_hash')
     _fg: tuple; _bg: tuple; _mod: int
     def __init__(self, fg:tuple=None, bg:tuple=None, mod:int=0, colorMod=None, link:str='', clean=False):
         self._fg  = fg
@@ -71,6 +123,20 @@ class _TTkColor:
         self._clean = clean or not (fg or bg or mod)
         self._colorMod = colorMod
         self._buffer = None
+        self._id = None
+
+    # The interning ids are valid only in the current process,
+    # they are not pickled and they are reset on the restored colors
+    _pickleSlots = ('_fg','_bg','_mod', '_colorMod', '_link', '_buffer', '_clean')
+    def __getstate__(self):
+        return (None, {k:getattr(self,k) for k in self._pickleSlots if hasattr(self,k)})
+
+    def __setstate__(self, state):
+        _, slots = state
+        self.__init__()
+        for k,v in slots.items():
+            if k in self._pickleSlots:
+                setattr(self,k,v)
 
     def foreground(self):
         if self._fg:
@@ -188,13 +254,23 @@ class _TTkColor:
         return self._buffer
 
     def __eq__(self, other):
+        if self is other: return True
         if other is None: return False
+        sid = self._id  or _TTkColorTable.intern(self)
+        oid = other._id or _TTkColorTable.intern(other)
+        if sid == oid: return True
+        if sid >= _TTkColorTable._baseId and oid >= _TTkColorTable._baseId: return False
         return (
             self._fg   == other._fg   and
             self._bg   == other._bg   and
             self._mod  == other._mod  and
             self._link == other._link )
 
+    def __hash__(self):
+        if self._id is None:
+            _TTkColorTable.intern(self)
+        return self._hash
+
     # self | other
     def __or__(self, other):
         # TTkLog.debug("__add__")
@@ -206,6 +282,8 @@ class _TTkColor:
         mod: str = self._mod + other._mod
         link:str = self._link or other._link
         colorMod = self._colorMod or other._colorMod
+        if colorMod is None:
+            return _TTkColorTable.instance(fg, bg, mod, link, clean)
         return TTkColor(
                     fg=fg, bg=bg, mod=mod,
                     colorMod=colorMod, link=link,
@@ -222,6 +300,8 @@ class _TTkColor:
         mod: str = self._mod + other._mod
         link:str = self._link or other._link
         colorMod = other._colorMod or self._colorMod
+        if colorMod is None:
+            return _TTkColorTable.instance(fg, bg, mod, link, clean)
         return TTkColor(
                     fg=fg, bg=bg, mod=mod,
                     colorMod=colorMod, link=link,
@@ -230,15 +310,49 @@ class _TTkColor:
     def __sub__(self, other):
         # TTkLog.debug("__sub__")
         # if other is None: return str(self)
+        key = (self._id  or _TTkColorTable.intern(self),
+               other._id or _TTkColorTable.intern(other))
+        if (ret := _TTkColorTable._subCache.get(key)) is not None:
+            return ret
         if ( None == self._bg   != other._bg   or
              None == self._fg   != other._fg   or
                      self._link != other._link or
                      self._mod  != other._mod ):
-            ret = self.copy()
+            ret = self.copy(modifier=False)
             ret._clean = True
+            if len(_TTkColorTable._subCache) >= _TTkColorTable.maxSize:
+                _TTkColorTable._subCache.clear()
+            _TTkColorTable._subCache[key] = ret
             return ret
         return self
 
+    def canvasDiff2Str(self, other) -> str:
+        '''Return the shortest ansi sequence required to switch the terminal from the "other" color to this one
+
+        Only the attributes that changed are emitted
+        (unless a full reset followed by this color is shorter),
+        the results are cached for each pair of colors (:meth:`TTkColor.diffCacheStats`)
+        '''
+        key = (self._id  or _TTkColorTable.intern(self),
+               other._id or _TTkColorTable.intern(other))
+        stats = _TTkColorTable._diffStats
+        if (ret := _TTkColorTable._diffCache.get(key)) is not None:
+            stats['hits'] += 1
+            stats['bytesSaved'] += ret[1]
+            return ret[0]
+        stats['misses'] += 1
+        full  = str(self-other)
+        delta = TTkHelper.Color.rgb2ansiDelta(
+                            fg=self._fg,       bg=self._bg,      mod=self._mod,
+                        prevFg=other._fg,  prevBg=other._bg, prevMod=other._mod)
+        clean = TTkHelper.Color.rgb2ansi(fg=self._fg, bg=self._bg, mod=self._mod, clean=True)
+        txt = min(delta, clean, key=len)
+        if len(_TTkColorTable._diffCache) >= _TTkColorTable.maxSize:
+            _TTkColorTable._diffCache.clear()
+        _TTkColorTable._diffCache[key] = (txt, len(full)-len(txt))
+        stats['bytesSaved'] += len(full)-len(txt)
+        return txt
+
     def modParam(self, *args, **kwargs):
         if not self._colorMod: return self
         ret = self.copy()
@@ -250,6 +364,7 @@ class _TTkColor:
         return self._colorMod.exec(x,y,self)
 
     def copy(self, modifier=True):
+        # The copy is not interned, it can be modified by the caller
         ret = _TTkColor()
         ret._fg   = self._fg
         ret._bg   = self._bg
@@ -462,6 +577,16 @@ class TTkColor(_TTkColor):
     BLINKING     = _TTkColor(mod=TTkHelper.Color.BLINKING)
     '''"Blinking" modifier'''
 
+    @staticmethod
+    def diffCacheStats() -> dict:
+        '''Debug helper, return the statistics of the colors transitions cache used by :meth:`canvasDiff2Str`
+
+        * **hits**, **misses**: the cache lookups
+        * **bytesSaved**: bytes saved compared to the full color sequences
+        * **size**: the number of the cached transitions
+        '''
+        return {**_TTkColorTable._diffStats, 'size':len(_TTkColorTable._diffCache)}
+
     @staticmethod
     def hexToRGB(val):
         r = int(val[1:3],base=16)
@@ -426,6 +426,20 @@ class TTkConstant:
     WindowShortcut             = ShortcutContext.WindowShortcut
     ApplicationShortcut        = ShortcutContext.ApplicationShortcut
 
+    class ConnectionType(int):
+        '''This enum describes the types of connection that can be used between signals and slots.'''
+        AutoConnection   = 0x00
+        '''(Default) Same as :attr:`DirectConnection`.'''
+        DirectConnection = 0x01
+        '''The slot is invoked immediately when the signal is emitted. The slot is executed in the signalling thread.'''
+        QueuedConnection = 0x02
+        '''The slot is invoked in the main loop thread before the next paint.
+           The emissions of the same signal within a frame are coalesced, the slot is invoked once with the last arguments.'''
+
+    AutoConnection   = ConnectionType.AutoConnection
+    DirectConnection = ConnectionType.DirectConnection
+    QueuedConnection = ConnectionType.QueuedConnection
+
     Key_Escape                  = 0x01000000
     Key_Tab                     = 0x01000001
     Key_Backtab                 = 0x01000002
@@ -30,7 +30,8 @@ from TermTk.TTkCore.log import TTkLog
 class TTkInputDriver():
     def close(self): pass
     def cont(self):  pass
-    def read(self):  pass
+    def wakeup(self): pass
+    def read(self, timeout=None, readers=None): pass
 
 
 class TTkSignalDriver():
@@ -83,6 +83,8 @@ class TTkTerm(TTkTermBase):
 
     @staticmethod
     def _push(*args):
+        if TTkTerm._frameAppend(str(*args)):
+            return
         try:
             sys.stdout.write(str(*args))
             sys.stdout.flush()
@@ -92,6 +94,16 @@ class TTkTerm(TTkTermBase):
             TTkLog.fatal(e)
     TTkTermBase.push = _push
 
+    @staticmethod
+    def _pushFrame(txt):
+        try:
+            sys.stdout.flush()
+            return TTkTerm._writeFd(sys.stdout.fileno(), txt)
+        except Exception as e:
+            TTkLog.fatal(e)
+        return 0, 0
+    TTkTermBase.pushFrame = _pushFrame
+
     @staticmethod
     def _flush():
         sys.stdout.flush()
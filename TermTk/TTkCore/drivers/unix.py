@@ -22,7 +22,7 @@
 
 __all__ = ['TTkSignalDriver','TTkInputDriver']
 
-import sys, os, re
+import sys, os
 import signal
 from select import select
 
@@ -35,10 +35,12 @@ from TermTk.TTkCore.signal import pyTTkSignal, pyTTkSlot
 
 
 class TTkInputDriver():
-    __slots__ = ('_readPipe','_attr')
+    __slots__ = ('_readPipe','_wakePipe','_attr')
 
     def __init__(self):
         self._readPipe = os.pipe()
+        self._wakePipe = os.pipe()
+        os.set_blocking(self._wakePipe[1], False)
         self._attr = termios.tcgetattr(sys.stdin)
         tty.setcbreak(sys.stdin)
 
@@ -49,26 +51,49 @@ class TTkInputDriver():
     def cont(self):
         tty.setcbreak(sys.stdin)
 
-    def read(self):
-        rm = re.compile('(\033?[^\033]+)')
-        while self._readPipe[0] not in (list := select( [sys.stdin, self._readPipe[0]], [], [] )[0]):
-            # Read all the full input
-            _fl = fcntl.fcntl(sys.stdin, fcntl.F_GETFL)
-            fcntl.fcntl(sys.stdin, fcntl.F_SETFL, _fl | os.O_NONBLOCK) # Set the input as NONBLOCK to read the full sequence
-            stdinRead = sys.stdin.read()
-            fcntl.fcntl(sys.stdin, fcntl.F_SETFL, _fl)
-
-            # Split all the ansi sequences
-            # or yield any separate input char
-            if stdinRead == '\033':
-                yield '\033'
-                continue
-            for sr in rm.findall(stdinRead):
-                if '\033' == sr[0]:
-                    yield sr
-                else:
-                    for ch in sr:
-                        yield ch
+    def wakeup(self):
+        ''' Interrupt the wait of :meth:`read`, it can be called from any thread '''
+        try:
+            os.write(self._wakePipe[1], b'w')
+        except BlockingIOError:
+            # The pipe is full, a wakeup is already pending
+            pass
+
+    def fileno(self) -> int:
+        return sys.stdin.fileno()
+
+    def readAvailable(self) -> str:
+        ''' Read all the available input without blocking
+
+        The input is returned as it is, the sequences are split by
+        :class:`~TermTk.TTkCore.TTkTerm.inputtokenizer.TTkInputTokenizer`
+        '''
+        # Read all the full input
+        _fl = fcntl.fcntl(sys.stdin, fcntl.F_GETFL)
+        fcntl.fcntl(sys.stdin, fcntl.F_SETFL, _fl | os.O_NONBLOCK) # Set the input as NONBLOCK to read the full sequence
+        stdinRead = sys.stdin.read()
+        fcntl.fcntl(sys.stdin, fcntl.F_SETFL, _fl)
+
+        return stdinRead or ''
+
+    def read(self, timeout=None, readers=None):
+        ''' Yield the input as it is read and None once the available input is consumed,
+        the wait is interrupted and None is yielded also on timeout or :meth:`wakeup`
+
+        :param timeout: callable returning the max seconds to wait for the input, None to wait forever
+        :param readers: optional dict {fd:callback} of extra file descriptors served in the same wait,
+                        the callback is called when the fd is readable
+        '''
+        readers = {} if readers is None else readers
+        while self._readPipe[0] not in (list := select( [sys.stdin, self._readPipe[0], self._wakePipe[0], *readers], [], [], timeout() if timeout else None )[0]):
+            if self._wakePipe[0] in list:
+                os.read(self._wakePipe[0], 1024)
+            for fd in list:
+                if callback := readers.get(fd):
+                    callback()
+            if sys.stdin in list and (stdinRead := self.readAvailable()):
+                yield stdinRead
+            yield None
 
 
 
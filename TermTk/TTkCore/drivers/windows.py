@@ -23,6 +23,8 @@
 __all__ = ['TTkSignalDriver','TTkInputDriver']
 
 import signal
+import math
+from typing import Optional
 
 from ctypes import Structure, Union, byref, wintypes, windll
 
@@ -41,6 +43,10 @@ STD_ERROR_HANDLE  = wintypes.DWORD(-12) # The standard error device. Initially,
 
 INVALID_HANDLE_VALUE = -1 # WinBase.h
 
+# https://learn.microsoft.com/en-us/windows/win32/api/synchapi/nf-synchapi-waitformultipleobjects
+INFINITE      = 0xFFFFFFFF
+WAIT_OBJECT_0 = 0x00000000
+
 # https://learn.microsoft.com/en-us/windows/console/SetConsoleMode
 ENABLE_ECHO_INPUT             = 0x0004 # Characters read by the ReadFile or ReadConsole function are written to the active screen buffer as they are typed into the console. This mode can be used only if the ENABLE_LINE_INPUT mode is also enabled.
 ENABLE_INSERT_MODE            = 0x0020 # When enabled, text entered in a console window will be inserted at the current cursor location and all text following that location will not be overwritten. When disabled, all following text will be overwritten.
@@ -203,6 +209,13 @@ class TTkInputDriver():
     def __init__(self):
         self._run = True
         self._initTerminal()
+        # Auto-reset event used to interrupt the wait of the input
+        # From:
+        #   https://learn.microsoft.com/en-us/windows/win32/api/synchapi/nf-synchapi-createeventw
+        CreateEvent = windll.kernel32.CreateEventW
+        CreateEvent.argtypes = [wintypes.LPVOID, wintypes.BOOL, wintypes.BOOL, wintypes.LPCWSTR]
+        CreateEvent.restype = wintypes.HANDLE
+        self._hWakeup = CreateEvent(None, False, False, None)
 
     def _initTerminal(self):
         # Get the standard input handle.
@@ -275,6 +288,7 @@ class TTkInputDriver():
 
     def close(self):
         self._run = False
+        self.wakeup()
         # Restore input mode on exit.
         if not self._SetConsoleMode(self._hStdIn, self._fdwSaveOldModeIn):
             raise Exception("SetConsoleMode")
@@ -285,7 +299,22 @@ class TTkInputDriver():
     def cont(self):
         pass
 
-    def read(self) -> str|None:
+    def wakeup(self):
+        ''' Interrupt the wait of :meth:`read`, it can be called from any thread '''
+        windll.kernel32.SetEvent(wintypes.HANDLE(self._hWakeup))
+
+    def read(self, timeout=None, readers=None) -> Optional[str]:
+        ''' Yield the input as it is read and None once the available input is consumed,
+        the wait is interrupted and None is yielded also on timeout or :meth:`wakeup`
+
+        :param timeout: callable returning the max seconds to wait for the input, None to wait forever
+        :param readers: not supported, the extra file descriptors cannot be waited with the console input
+        '''
+        WaitForMultipleObjects = windll.kernel32.WaitForMultipleObjects
+        WaitForMultipleObjects.argtypes = [wintypes.DWORD, wintypes.LPVOID, wintypes.BOOL, wintypes.DWORD]
+        WaitForMultipleObjects.restype = wintypes.DWORD
+        handles = (wintypes.HANDLE*2)(self._hStdIn, self._hWakeup)
+
         # From:
         #   https://learn.microsoft.com/en-us/windows/console/ReadConsoleInput
         #
@@ -311,6 +340,13 @@ class TTkInputDriver():
 
         # Loop to read and handle the next 100 input events.
         while self._run:
+            # Wait for the input, a wakeup or the timeout
+            t = timeout() if timeout else None
+            ms = INFINITE if t is None else math.ceil(t*1000)
+            if WaitForMultipleObjects(2, handles, False, ms) != WAIT_OBJECT_0:
+                yield None
+                continue
+
             # Wait for the events.
             if not ReadConsoleInput(
                     self._hStdIn,      # input buffer handle
@@ -347,6 +383,7 @@ class TTkInputDriver():
                     TTkInputDriver.windowResized.emit(bb.Event.WindowBufferSizeEvent.dwSize.X, bb.Event.WindowBufferSizeEvent.dwSize.Y)
             if saveKeys:
                 yield "".join(saveKeys).encode("utf-16", "surrogatepass").decode("utf-16")
+            yield None
 
 class TTkSignalDriver():
     sigStop = pyTTkSignal()
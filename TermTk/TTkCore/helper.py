@@ -64,6 +64,9 @@ class TTkHelper:
     def unlockPaint():
         if rw := TTkHelper._rootWidget:
             rw._paintEvent.set()
+            # Restart the paint timer if it is idle
+            if (timer := rw._timer) and not timer.isActive():
+                timer.start()
 
     @staticmethod
     def addUpdateWidget(widget):
@@ -281,44 +284,50 @@ class TTkHelper:
             if not widget.isVisibleAndParent(): continue
             updateBuffers.add(widget)
             updateWidgets.add(widget)
+            # The parents are only composed again in the damaged areas
             parent = widget.parentWidget()
             while parent is not None:
-                updateBuffers.add(parent)
                 updateWidgets.add(parent)
                 parent = parent.parentWidget()
 
         # Paint all the canvas
         for widget in updateBuffers:
             if not widget.isVisibleAndParent(): continue
-            # Resize the canvas just before the paintEvent
-            # to avoid too many allocations
-            canvas = widget.getCanvas()
-            canvas.updateSize()
-            canvas.clean()
-            widget.paintEvent(canvas)
+            widget._repaint()
 
         # Compose all the canvas to the parents
         # From the deepest children to the bottom
+        # collecting the damaged areas (dirty rectangles) of each canvas
         pushToTerminal = False
+        damages = {}
         sortedUpdateWidget = sorted(updateWidgets, key=lambda w: -TTkHelper.widgetDepth(w))
         for widget in sortedUpdateWidget:
             if not widget.isVisibleAndParent(): continue
             pushToTerminal = True
-            widget.paintChildCanvas()
+            damages[widget] = widget._composeDamage(widget in updateBuffers, damages)
 
         if pushToTerminal:
-            if TTkHelper._cursor:
-                TTkTerm.Cursor.hide()
-            if TTkCfg.doubleBuffer:
-                TTkHelper._rootCanvas.pushToTerminalBuffered(0, 0, TTkGlbl.term_w, TTkGlbl.term_h)
-            elif TTkCfg.doubleBufferNew:
-                TTkHelper._rootCanvas.pushToTerminalBufferedNew(0, 0, TTkGlbl.term_w, TTkGlbl.term_h)
-            else:
-                TTkHelper._rootCanvas.pushToTerminal(0, 0, TTkGlbl.term_w, TTkGlbl.term_h)
-            if TTkHelper._cursor:
-                x,y = TTkHelper._cursorPos
-                TTkTerm.push(TTkTerm.Cursor.moveTo(y+1,x+1))
-                TTkTerm.Cursor.show(TTkHelper._cursorType)
+            TTkTerm.frameBegin()
+            # Always close the frame, an open frame would collect all the following output
+            try:
+                if TTkHelper._cursor:
+                    TTkTerm.Cursor.hide()
+                rootDamage = damages.get(TTkHelper._rootWidget, [])
+                if TTkCfg.doubleBuffer:
+                    for x,y,w,h in rootDamage:
+                        TTkHelper._rootCanvas.pushToTerminalBuffered(x, y, w, h)
+                elif TTkCfg.doubleBufferNew:
+                    for x,y,w,h in rootDamage:
+                        TTkHelper._rootCanvas.pushToTerminalBufferedNew(x, y, w, h)
+                elif rootDamage:
+                    TTkHelper._rootCanvas.pushToTerminal(0, 0, TTkGlbl.term_w, TTkGlbl.term_h)
+                TTkHelper._rootCanvas.cleanDirtyRows()
+                if TTkHelper._cursor:
+                    x,y = TTkHelper._cursorPos
+                    TTkTerm.push(TTkTerm.Cursor.moveTo(y+1,x+1))
+                    TTkTerm.Cursor.show(TTkHelper._cursorType)
+            finally:
+                TTkTerm.frameEnd()
 
     @staticmethod
     def rePaintAll():
@@ -350,7 +359,7 @@ class TTkHelper:
         if x<lx or x>=lx+lw or y<ly or y>=lh+ly: return None
         x-=lx
         y-=ly
-        for item in reversed(layout.zSortedItems):
+        for item in layout._itemsAt(x, y):
             if item.layoutItemType() == TTkK.WidgetItem and not item.isEmpty():
                 widget = item.widget()
                 if not widget._visible: continue
@@ -25,16 +25,16 @@ __all__ = ['TTkLog']
 # This code is inspired by
 # https://github.com/ceccopierangiolieugenio/pyCuT/blob/master/cupy/CuTCore/CuDebug.py
 
-import inspect
+import sys
 import logging
-from collections.abc import Callable, Set
+from collections.abc import Callable
 
 class _TTkContext:
     __slots__ = ['file', 'line', 'function']
-    def __init__(self, cf):
-        self.file = cf[1]
-        self.line = cf[2]
-        self.function = cf[3]
+    def __init__(self, frame):
+        self.file = frame.f_code.co_filename
+        self.line = frame.f_lineno
+        self.function = frame.f_code.co_name
     def __str__(self):
         return f"{self.file}:{self.line} [{self.function}]"
 
@@ -46,9 +46,13 @@ class TTkLog:
     CriticalMsg = 0x0010
     FatalMsg    = 0x0020
     SystemMsg   = CriticalMsg
+    AllMsg      = 0x003F
 
-    # TypeHandlers = list[Callable]
-    _messageHandler: Set = []
+    # [(modes, handler), ...]
+    _messageHandler: list = []
+    # Union of the modes required by the handlers,
+    # the messages of any other mode are discarded without any processing
+    _modes: int = 0x0000
 
     @staticmethod
     def _logging_message_handler(mode, context, message):
@@ -61,52 +65,92 @@ class TTkLog:
         log(f"{context.file}:{context.line} {message}")
 
     @staticmethod
-    def use_default_file_logging(file="session.log"):
-        logging.basicConfig(level=logging.DEBUG,
-                    filename=file,
-                    format='%(levelname)s:(%(threadName)-9s) %(message)s',)
-        TTkLog.installMessageHandler(TTkLog._logging_message_handler)
+    def use_default_file_logging(file="session.log", modes:int=AllMsg):
+        # The messages are collected in a ring buffer and written
+        # to the file by a background thread (:class:`~TermTk.TTkCore.logring.TTkLogRing`)
+        from TermTk.TTkCore.logring import TTkLogRing
+        return TTkLogRing(file=file, modes=modes)
 
     @staticmethod
-    def use_default_stdout_logging():
+    def use_default_stdout_logging(modes:int=AllMsg):
         logging.basicConfig(level=logging.DEBUG,
                     format='%(levelname)s:(%(threadName)-9s) %(message)s',)
-        TTkLog.installMessageHandler(TTkLog._logging_message_handler)
+        TTkLog.installMessageHandler(TTkLog._logging_message_handler, modes)
 
 
     @staticmethod
-    def _process_msg(mode: int, msg: str):
-        for cb in TTkLog._messageHandler:
-            curframe = inspect.currentframe()
-            calframe = inspect.getouterframes(curframe,1)
-            if len(calframe) > 2:
-                ctx = _TTkContext(calframe[2])
+    def _process_msg(mode: int, msg, args):
+        # Called only if at least one handler requires this mode,
+        # the frame of the caller is 2 levels up (_process_msg <- debug/info/... <- caller)
+        ctx = _TTkContext(sys._getframe(2))
+        if args:
+            msg = msg % args
+        elif callable(msg):
+            msg = msg()
+        for modes,cb in TTkLog._messageHandler:
+            if modes & mode:
                 cb(mode, ctx, msg)
 
+    # The message can be a string, a callable returning the string
+    # or a %-format string with its arguments, i.e.
+    #    TTkLog.debug(f"Value: {value}")
+    #    TTkLog.debug(lambda: f"Value: {expensive()}")
+    #    TTkLog.debug("Value: %s", value)
+    # the callable and the %-format are evaluated only if a handler requires the message
+
+    @staticmethod
+    def debug(msg, *args):
+        if TTkLog._modes & TTkLog.DebugMsg:
+            TTkLog._process_msg(TTkLog.DebugMsg, msg, args)
+
     @staticmethod
-    def debug(msg):
-        TTkLog._process_msg(TTkLog.DebugMsg, msg)
+    def info(msg, *args):
+        if TTkLog._modes & TTkLog.InfoMsg:
+            TTkLog._process_msg(TTkLog.InfoMsg, msg, args)
 
     @staticmethod
-    def info(msg):
-        TTkLog._process_msg(TTkLog.InfoMsg, msg)
+    def error(msg, *args):
+        if TTkLog._modes & TTkLog.ErrorMsg:
+            TTkLog._process_msg(TTkLog.ErrorMsg, msg, args)
 
     @staticmethod
-    def error(msg):
-        TTkLog._process_msg(TTkLog.ErrorMsg, msg)
+    def warn(msg, *args):
+        if TTkLog._modes & TTkLog.WarningMsg:
+            TTkLog._process_msg(TTkLog.WarningMsg, msg, args)
 
     @staticmethod
-    def warn(msg):
-        TTkLog._process_msg(TTkLog.WarningMsg, msg)
+    def critical(msg, *args):
+        if TTkLog._modes & TTkLog.CriticalMsg:
+            TTkLog._process_msg(TTkLog.CriticalMsg, msg, args)
 
     @staticmethod
-    def critical(msg):
-        TTkLog._process_msg(TTkLog.CriticalMsg, msg)
+    def fatal(msg, *args):
+        if TTkLog._modes & TTkLog.FatalMsg:
+            TTkLog._process_msg(TTkLog.FatalMsg, msg, args)
+
+    @staticmethod
+    def isEnabled(mode:int) -> bool:
+        ''' Return True if at least one handler requires the messages of this mode '''
+        return bool(TTkLog._modes & mode)
+
+    @staticmethod
+    def installMessageHandler(mh: Callable, modes:int=AllMsg):
+        ''' Install a message handler
+
+        :param mh: the handler, called with (mode, context, message)
+        :param modes: the bitmask of the modes (:attr:`DebugMsg`, :attr:`InfoMsg`, ...) forwarded to this handler
+        '''
+        TTkLog._messageHandler.append((modes, mh))
+        TTkLog._updateModes()
 
     @staticmethod
-    def fatal(msg):
-        TTkLog._process_msg(TTkLog.FatalMsg, msg)
+    def removeMessageHandler(mh: Callable):
+        TTkLog._messageHandler = [(m,cb) for m,cb in TTkLog._messageHandler if cb != mh]
+        TTkLog._updateModes()
 
     @staticmethod
-    def installMessageHandler(mh: Callable):
-        TTkLog._messageHandler.append(mh)
+    def _updateModes():
+        modes = 0
+        for m,_ in TTkLog._messageHandler:
+            modes |= m
+        TTkLog._modes = modes
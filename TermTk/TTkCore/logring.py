@@ -0,0 +1,165 @@
+# MIT License
+#
+# Copyright (c) 2024 Eugenio Parodi <ceccopierangiolieugenio AT googlemail DOT com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+__all__ = ['TTkLogRing']
+
+import atexit
+import threading
+from itertools import islice
+from collections import deque
+
+from TermTk.TTkCore.log import TTkLog
+from TermTk.TTkCore.signal import pyTTkSignal
+
+class TTkLogRing():
+    ''' Bounded in memory sink of the :class:`~TermTk.TTkCore.log.TTkLog` messages
+
+    The messages are stored in a ring buffer, once it is full the oldest messages are discarded.
+    The logging call never blocks on the I/O, if a file is provided
+    a background thread writes the new messages in batches.
+
+    The discarded messages are counted in :meth:`dropped`.
+
+    :param size: the max number of messages stored
+    :param file: optional file where the messages are appended
+    :param modes: the message types (:attr:`~TermTk.TTkCore.log.TTkLog.DebugMsg` | ...) stored in the ring
+    '''
+    __slots__ = ('_records', '_lock', '_count', '_dropped', '_written',
+                 '_file', '_writer', '_writerEvent', '_closed',
+                 # Signals
+                 'messageAdded')
+
+    _default = None
+    _flushInterval = 0.1
+    _levelNames = {
+        TTkLog.DebugMsg:    'DEBUG',
+        TTkLog.InfoMsg:     'INFO',
+        TTkLog.ErrorMsg:    'ERROR',
+        TTkLog.WarningMsg:  'WARNING',
+        TTkLog.CriticalMsg: 'CRITICAL',
+        TTkLog.FatalMsg:    'CRITICAL'}
+
+    def __init__(self, size:int=10000, file:str=None, modes:int=TTkLog.AllMsg):
+        self.messageAdded = pyTTkSignal()
+        # (mode, file, line, threadName, message)
+        self._records = deque(maxlen=size)
+        self._lock = threading.Lock()
+        self._count = 0
+        self._dropped = 0
+        self._written = 0
+        self._file = file
+        self._writer = None
+        self._writerEvent = threading.Event()
+        self._closed = threading.Event()
+        if file:
+            self._writer = threading.Thread(target=self._writerLoop, name='TTkLogRing', daemon=True)
+            self._writer.start()
+            atexit.register(self.close)
+        TTkLog.installMessageHandler(self._messageHandler, modes)
+
+    @staticmethod
+    def default():
+        ''' Return the ring shared by the :class:`~TermTk.TTkTestWidgets.logviewer.TTkLogViewer` widgets '''
+        if not TTkLogRing._default:
+            TTkLogRing._default = TTkLogRing()
+        return TTkLogRing._default
+
+    def _messageHandler(self, mode, context, message):
+        record = (mode, context.file, context.line, threading.current_thread().name, message)
+        with self._lock:
+            self._records.append(record)
+            self._count += 1
+        self._writerEvent.set()
+        self.messageAdded.emit()
+
+    def count(self) -> int:
+        ''' Return the number of messages received since the creation '''
+        return self._count
+
+    def dropped(self) -> int:
+        ''' Return the number of messages discarded before being written to the file,
+        or discarded by the ring if there is no file
+        '''
+        return self._dropped if self._file else self.first()
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def first(self) -> int:
+        ''' Return the index of the oldest message stored '''
+        return self._count - len(self._records)
+
+    def records(self, start:int=0, stop:int=None) -> list:
+        ''' Return the stored messages with index in the range [start, stop),
+        the index of a message is its position since the creation of the ring,
+        each message is a tuple (mode, file, line, threadName, message)
+        '''
+        with self._lock:
+            first = self._count - len(self._records)
+            start = max(0, start-first)
+            stop  = None if stop is None else max(0, stop-first)
+            return list(islice(self._records, start, stop))
+
+    def tail(self, start:int) -> tuple:
+        ''' Return (index, messages) of the stored messages with index >= start,
+        index is the index of the first message returned
+        '''
+        with self._lock:
+            first = self._count - len(self._records)
+            index = max(start, first)
+            return index, list(islice(self._records, index-first, None))
+
+    def _take(self) -> list:
+        # Return the messages not written yet
+        with self._lock:
+            n = self._count - self._written
+            size = len(self._records)
+            if n > size:
+                self._dropped += n - size
+                n = size
+            self._written = self._count
+            return list(islice(self._records, size-n, size))
+
+    def _writerLoop(self):
+        levelNames = TTkLogRing._levelNames
+        with open(self._file, 'a') as f:
+            while True:
+                self._writerEvent.wait()
+                # Collect the messages of the next interval in a single batch
+                closed = self._closed.wait(TTkLogRing._flushInterval)
+                self._writerEvent.clear()
+                if records := self._take():
+                    f.write(''.join(
+                        f"{levelNames.get(mode,'DEBUG')}:({thread:<9}) {file}:{line} {message}\n"
+                        for mode,file,line,thread,message in records))
+                    f.flush()
+                if closed:
+                    break
+
+    def close(self):
+        ''' Stop receiving messages and write the pending messages to the file '''
+        TTkLog.removeMessageHandler(self._messageHandler)
+        if self._writer:
+            self._closed.set()
+            self._writerEvent.set()
+            self._writer.join()
+            self._writer = None
@@ -57,10 +57,13 @@ Methods
 
 __all__ = ['pyTTkSlot', 'pyTTkSignal']
 
-from inspect import getfullargspec
+from inspect import getfullargspec, ismethod
 from types import LambdaType
+from weakref import WeakSet, ref
 from threading import Lock
 
+from TermTk.TTkCore.constant import TTkK
+
 def pyTTkSlot(*args, **kwargs):
     def pyTTkSlot_d(func):
         # Add signature attributes to the function
@@ -71,9 +74,36 @@ def pyTTkSlot(*args, **kwargs):
 def pyTTkSignal(*args, **kwargs):
     return _pyTTkSignal_obj(*args, **kwargs)
 
+class _pyTTkQueuedSlot():
+    ''' Slot of a :attr:`~TermTk.TTkCore.constant.TTkConstant.QueuedConnection`,
+    the emission is posted in the queue processed by the main loop
+    '''
+    __slots__ = ('_slot', '_sl', '_objRef', '_connected')
+    def __init__(self, slot, sl, objRef):
+        self._slot = slot
+        self._sl = sl
+        self._objRef = objRef
+        self._connected = True
+
+    def __call__(self, *args, **kwargs):
+        _pyTTkSignal_obj._post(self, args, kwargs)
+
+    def _invoke(self, args, kwargs):
+        if not self._connected: return
+        if (sl := self._sl) is not None:
+            args = args[sl]
+        if (objRef := self._objRef) is None:
+            self._slot(*args, **kwargs)
+        elif (obj := objRef()) is not None:
+            self._slot(obj, *args, **kwargs)
+
 class _pyTTkSignal_obj():
-    _signals = []
-    __slots__ = ('_types', '_name', '_revision', '_connected_slots', '_mutex')
+    _signals = WeakSet()
+    # Pending emissions of the queued connections {queuedSlot: (args, kwargs)}
+    _queue = {}
+    _queueLock = Lock()
+    _queueWakeup = None
+    __slots__ = ('_types', '_nargs', '_name', '_revision', '_connected_slots', '_slots', '_emitting', '__weakref__')
     def __init__(self, *args, **kwargs):
         # ref: http://pyqt.sourceforge.net/Docs/PyQt5/signals_slots.html#PyQt5.QtCore.pyqtSignal
 
@@ -88,13 +118,20 @@ class _pyTTkSignal_obj():
         #    Return type:
         #        an unbound signal
         self._types = args
+        self._nargs = len(args)
         self._name = kwargs.get('name', None)
         self._revision = kwargs.get('revision', 0)
+        # {key: (slot, slice, objRef)}
+        # slice is None if the slot takes all the arguments,
+        # objRef is the weak reference to the receiver of the bound methods (slot is the unbound function)
         self._connected_slots = {}
-        self._mutex = Lock()
-        _pyTTkSignal_obj._signals.append(self)
+        # Immutable snapshot of the connected slots used by emit
+        self._slots = ()
+        # Avoid the recursive emission of the same signal
+        self._emitting = False
+        _pyTTkSignal_obj._signals.add(self)
 
-    def connect(self, slot):
+    def connect(self, slot, type:TTkK.ConnectionType=TTkK.AutoConnection):
         # ref: http://pyqt.sourceforge.net/Docs/PyQt5/signals_slots.html#connect
 
         # connect(slot[, type=PyQt5.QtCore.Qt.AutoConnection[, no_receiver_check=False]]) -> PyQt5.QtCore.QMetaObject.Connection
@@ -126,25 +163,125 @@ class _pyTTkSignal_obj():
                 if a!=b and not issubclass(a,b):
                     error = "Decorated slot has no signature compatible: "+slot.__name__+str(slot._TTkslot_attr)+" != signal"+str(self._types)
                     raise TypeError(error)
-        if slot not in self._connected_slots:
-            self._connected_slots[slot]=slice(nargs)
+        if (key := _pyTTkSignal_obj._slotKey(slot)) not in self._connected_slots:
+            sl = None if nargs >= self._nargs else slice(nargs)
+            entry = (slot, sl, None)
+            if ismethod(slot):
+                try:
+                    # The connection does not keep the receiver alive,
+                    # it is removed once the receiver is destroyed
+                    objRef = ref(slot.__self__, _pyTTkSignal_obj._receiverDestroyed(ref(self), key))
+                    entry = (slot.__func__, sl, objRef)
+                except TypeError:
+                    pass
+            if type == TTkK.QueuedConnection:
+                entry = (_pyTTkQueuedSlot(*entry), None, None)
+            self._connected_slots[key] = entry
+            self._updateSlots()
+
+    @staticmethod
+    def _slotKey(slot):
+        # The bound methods are identified by the receiver identity and the function,
+        # the receiver may not be hashable (i.e. a dataclass),
+        # its identity is stable while it is alive or referenced by the connection
+        if ismethod(slot):
+            return (id(slot.__self__), slot.__func__)
+        return slot
+
+    @staticmethod
+    def _receiverDestroyed(signalRef, key):
+        def _cb(_):
+            if (signal := signalRef()) is not None:
+                signal._removeSlot(key)
+                signal._updateSlots()
+        return _cb
+
+    def _removeSlot(self, key):
+        if (entry := self._connected_slots.pop(key, None)) and isinstance(entry[0], _pyTTkQueuedSlot):
+            # Drop the pending emission
+            entry[0]._connected = False
 
     def disconnect(self, *args, **kwargs):
         for slot in args:
-            if slot in self._connected_slots:
-                del self._connected_slots[slot]
+            self._removeSlot(_pyTTkSignal_obj._slotKey(slot))
+        self._updateSlots()
+
+    def _updateSlots(self):
+        # The tuple is replaced and never modified,
+        # a connect/disconnect during the emit does not affect the running loop
+        self._slots = tuple(self._connected_slots.values())
 
     def emit(self, *args, **kwargs):
-        if not self._mutex.acquire(False): return
-        if len(args) != len(self._types):
+        if self._emitting: return
+        if len(args) != self._nargs:
             error = "func"+str(self._types)+" signal has "+str(len(self._types))+" argument(s) but "+str(len(args))+" provided"
             raise TypeError(error)
-        for slot,sl in self._connected_slots.copy().items():
-            slot(*args[sl], **kwargs)
-        self._mutex.release()
+        if not (slots := self._slots): return
+        self._emitting = True
+        try:
+            if len(slots) == 1:
+                slot,sl,objRef = slots[0]
+                if objRef is None:
+                    if sl is None:
+                        slot(*args, **kwargs)
+                    else:
+                        slot(*args[sl], **kwargs)
+                elif (obj := objRef()) is not None:
+                    if sl is None:
+                        slot(obj, *args, **kwargs)
+                    else:
+                        slot(obj, *args[sl], **kwargs)
+            else:
+                for slot,sl,objRef in slots:
+                    if objRef is None:
+                        if sl is None:
+                            slot(*args, **kwargs)
+                        else:
+                            slot(*args[sl], **kwargs)
+                    elif (obj := objRef()) is not None:
+                        if sl is None:
+                            slot(obj, *args, **kwargs)
+                        else:
+                            slot(obj, *args[sl], **kwargs)
+        finally:
+            self._emitting = False
 
     def clear(self):
-        self._connected_slots = {}
+        for key in list(self._connected_slots):
+            self._removeSlot(key)
+        self._slots = ()
+
+    @staticmethod
+    def _post(queuedSlot, args, kwargs):
+        with _pyTTkSignal_obj._queueLock:
+            wakeup = not _pyTTkSignal_obj._queue
+            _pyTTkSignal_obj._queue[queuedSlot] = (args, kwargs)
+        if wakeup and (cb := _pyTTkSignal_obj._queueWakeup):
+            cb()
+
+    @staticmethod
+    def attachQueue(wakeup) -> None:
+        ''' Register the callback used to notify the main loop of the pending queued emissions
+
+        :param wakeup: callback, it can be called from any thread
+        '''
+        _pyTTkSignal_obj._queueWakeup = wakeup
+        if _pyTTkSignal_obj._queue:
+            wakeup()
+
+    @staticmethod
+    def detachQueue() -> None:
+        _pyTTkSignal_obj._queueWakeup = None
+
+    @staticmethod
+    def processQueued() -> None:
+        ''' Invoke the slots of the pending queued emissions, must be called by the main loop thread '''
+        with _pyTTkSignal_obj._queueLock:
+            if not (queue := _pyTTkSignal_obj._queue):
+                return
+            _pyTTkSignal_obj._queue = {}
+        for queuedSlot,(args,kwargs) in queue.items():
+            queuedSlot._invoke(args, kwargs)
 
     @staticmethod
     def clearAll():
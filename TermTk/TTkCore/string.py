@@ -24,6 +24,10 @@ __all__ = ['TTkString']
 
 import re
 import unicodedata
+from array import array
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
+from itertools import accumulate, repeat
 
 from TermTk.TTkCore.cfg import TTkCfg
 from TermTk.TTkCore.constant import TTkK
@@ -60,16 +64,19 @@ class TTkString():
     '''
     unicodeWideOverflowColor = TTkColor.fg("#888888")+TTkColor.bg("#000088")
 
-    __slots__ = ('_text','_colors','_baseColor','_hasTab','_hasSpecialWidth')
+    # The colors are stored as run-length spans,
+    # a tuple of (start, color) pairs sorted by start,
+    # the first one starting at 0 and no two adjacent spans sharing the same color object
+    __slots__ = ('_text','_spans','_baseColor','_hasTab','_hasSpecialWidth')
 
     def __init__(self, text="", color=None):
         if issubclass(type(text), TTkString):
             self._text      = text._text
-            self._colors    = text._colors if color is None else [color]*len(self._text)
+            self._spans     = text._spans if color is None else TTkString._spansFill(color, len(self._text))
             self._baseColor = text._baseColor
         else:
             self._baseColor = TTkColor.RST if color is None else color
-            self._text, self._colors = TTkString._parseAnsi(str(text), self._baseColor)
+            self._text, self._spans = TTkString._parseAnsi(str(text), self._baseColor)
         self._hasTab = '\t' in self._text
         self._checkWidth()
         # raise AttributeError(f"{type(text)} not supported in TTkString")
@@ -79,27 +86,37 @@ class TTkString():
         ret = TTkString()
         if text and colors:
             ret._text = text
-            ret._colors = colors
+            ret._spans = TTkString._spansFromList(colors)
             ret._baseColor = colors[-1] if colors else TTkColor.RST
             ret._hasTab = '\t' in text
             ret._checkWidth()
         return ret
 
+    # The split alternates the text and the escape sequences
+    _ansiRe = re.compile('(\033[^m]*m)')
+
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _ansiColor(ansi):
+        return TTkColor.ansi(ansi)
+
     @staticmethod
     def _parseAnsi(text, color = TTkColor.RST):
+        if '\033' not in text:
+            return text, TTkString._spansFill(color, len(text))
+        _ansiColor = TTkString._ansiColor
+        txtret = []
+        spans = []
         pos = 0
-        txtret = ""
-        colret = []
-        for m in re.findall('\033[^m]*m', text):
-            index = text.index(m,pos)
-            txt = text[pos:index]
-            txtret += txt
-            colret += [color]*len(txt)
-            color+=TTkColor.ansi(m)
-            pos = index+len(m)
-        txtret += text[pos:]
-        colret += [color]*(len(text)-pos)
-        return txtret, colret
+        for i,tok in enumerate(TTkString._ansiRe.split(text)):
+            if i & 1:
+                color += _ansiColor(tok)
+            elif tok:
+                if not spans or spans[-1][1] is not color:
+                    spans.append((pos,color))
+                txtret.append(tok)
+                pos += len(tok)
+        return ''.join(txtret), tuple(spans)
 
     def termWidth(self):
         return self._hasSpecialWidth if self._hasSpecialWidth is not None else len(self)
@@ -115,18 +132,18 @@ class TTkString():
         ret._baseColor = self._baseColor
         if   isinstance(other, TTkString):
             ret._text   = self._text   + other._text
-            ret._colors = self._colors + other._colors
+            ret._spans  = TTkString._spansConcat(self._spans, len(self._text), other._spans)
             ret._hasTab = '\t' in ret._text
             ret._fastCheckWidth(self._hasSpecialWidth, other._hasSpecialWidth)
         elif isinstance(other, str):
-            atxt, acol = TTkString._parseAnsi(other, self._baseColor)
+            atxt, aspans = TTkString._parseAnsi(other, self._baseColor)
             ret._text   = self._text   + atxt
-            ret._colors = self._colors + acol
+            ret._spans  = TTkString._spansConcat(self._spans, len(self._text), aspans)
             ret._hasTab = '\t' in ret._text
             ret._checkWidth()
         elif isinstance(other, _TTkColor):
             ret._text   = self._text
-            ret._colors = self._colors
+            ret._spans  = self._spans
             ret._hasSpecialWidth = self._hasSpecialWidth
             ret._hasTab = self._hasTab
             ret._baseColor = other
@@ -137,12 +154,12 @@ class TTkString():
         ret._baseColor = self._baseColor
         if  isinstance(other, TTkString):
             ret._text   = other._text   + self._text
-            ret._colors = other._colors + self._colors
+            ret._spans  = TTkString._spansConcat(other._spans, len(other._text), self._spans)
             ret._hasTab = '\t' in ret._text
             ret._fastCheckWidth(self._hasSpecialWidth, other._hasSpecialWidth)
         elif isinstance(other, str):
             ret._text   = other + self._text
-            ret._colors = [self._baseColor]*len(other) + self._colors
+            ret._spans  = TTkString._spansConcat(TTkString._spansFill(self._baseColor, len(other)), len(other), self._spans)
             ret._hasTab = '\t' in ret._text
             ret._checkWidth()
         return ret
@@ -171,9 +188,9 @@ class TTkString():
     def sameAs(self, other):
         if not issubclass(type(other),TTkString): return False
         return (
-            self==other and
-            len(self._colors) == len(other._colors) and
-            all(s==o for s,o in zip(self._colors,other._colors)) )
+            self==other and (
+            self._spans == other._spans or
+            self._expandColors() == other._expandColors() ) )
 
     def isdigit(self):
         return self._text.isdigit()
@@ -181,7 +198,7 @@ class TTkString():
     def lstrip(self, ch):
         ret = TTkString()
         ret._text = self._text.lstrip(ch)
-        ret._colors = self._colors[-len(ret._text):]
+        ret._spans = TTkString._spansSlice(self._spans, len(self._text)-len(ret._text), len(self._text))
         return ret
 
     def charAt(self, pos):
@@ -193,12 +210,14 @@ class TTkString():
         return self
 
     def colorAt(self, pos):
-        if pos >= len(self._colors):
+        if pos >= len(self._text):
             return TTkColor()
-        return self._colors[pos]
+        if pos < 0: pos += len(self._text)
+        return TTkString._spansColorAt(self._spans, pos)
 
     def setColorAt(self, pos, color):
-        self._colors[pos] = color
+        if pos < 0: pos += len(self._text)
+        self._spans = TTkString._spansSetRange(self._spans, len(self._text), pos, pos+1, color)
         return self
 
     def tab2spaces(self, tabSpaces=4):
@@ -208,15 +227,26 @@ class TTkString():
         slices = self._text.split("\t")
         ret._text += slices[0]
         pos = len(slices[0])
-        ret._colors += self._colors[0:pos]
+        # (position after the tab, shift of the following chars)
+        shifts = []
+        shift = 0
         for s in slices[1:]:
-            c  = self._colors[pos]
             lentxt = ret.termWidth()
             spaces = tabSpaces - (lentxt+tabSpaces)%tabSpaces
             ret._text   += " "*spaces + s
-            ret._colors += [c]*spaces + self._colors[pos+1:pos+1+len(s)]
             ret._fastCheckWidth(self._hasSpecialWidth)
             pos+=len(s)+1
+            shift += spaces-1
+            shifts.append((pos-len(s),shift))
+        # The tab spaces keep the tab color, the spans are only moved
+        spans = []
+        i, shift = 0, 0
+        for a,c in self._spans:
+            while i < len(shifts) and shifts[i][0] <= a:
+                shift = shifts[i][1]
+                i += 1
+            spans.append((a+shift,c))
+        ret._spans = tuple(spans)
         return ret
 
     def tabCharPos(self, pos, tabSpaces=4, alignTabRight=False):
@@ -272,18 +302,16 @@ class TTkString():
             ret                   x = 7 (tab is a char)
 
         '''
+        if not self._hasTab:
+            return max(0,bisect_right(TTkString.widths(self._text), pos)-1)
         # get pos in the slice:
         dx = pos
         pp = 0
-        for i,ch in enumerate(self._text):
+        for i,(ch,w) in enumerate(zip(self._text, TTkString._charWidths(self._text))):
             if ch=='\t':
                 pp += tabSpaces - (pp+tabSpaces)%tabSpaces
-            elif unicodedata.east_asian_width(ch) == 'W':
-                pp += 2
-            elif unicodedata.category(ch) in ('Me','Mn'):
-                pass
             else:
-                pp += 1
+                pp += w
             if dx < pp:
                 return i
         return len(self._text)
@@ -296,11 +324,12 @@ class TTkString():
         ''' Return the ansii (terminal colors/events) representation of the string '''
         out   = ""
         color = None
-        for ch, col in zip(self._text, self._colors):
+        text  = self._text
+        for (a,col),(b,_) in zip(self._spans, self._spans[1:]+((len(text),None),)):
             if col != color:
                 color = col
                 out += str(TTkColor.RST) + str(color)
-            out += ch
+            out += text[a:b]
         if strip:
             rstCh  = "\u001b[0m"
             lenRst = len(rstCh)
@@ -328,45 +357,40 @@ class TTkString():
 
         if lentxt < width:
             pad = width-lentxt
+            _concat = TTkString._spansConcat
+            _fill   = TTkString._spansFill
             if alignment in [TTkK.NONE, TTkK.LEFT_ALIGN]:
                 ret._text   = self._text   + " "    *pad
-                ret._colors = self._colors + [color]*pad
+                ret._spans  = _concat(self._spans, len(self._text), _fill(color,pad))
             elif alignment == TTkK.RIGHT_ALIGN:
                 ret._text   = " "    *pad + self._text
-                ret._colors = [color]*pad + self._colors
+                ret._spans  = _concat(_fill(color,pad), pad, self._spans)
             elif alignment == TTkK.CENTER_ALIGN:
                 p1 = pad//2
                 p2 = pad-p1
                 ret._text   = " "    *p1 + self._text   + " "    *p2
-                ret._colors = [color]*p1 + self._colors + [color]*p2
+                ret._spans  = _concat(_concat(_fill(color,p1), p1, self._spans), p1+len(self._text), _fill(color,p2))
             elif alignment == TTkK.JUSTIFY:
                 # TODO: Text Justification
                 ret._text   = self._text   + " "    *pad
-                ret._colors = self._colors + [color]*pad
+                ret._spans  = _concat(self._spans, len(self._text), _fill(color,pad))
         elif self._hasSpecialWidth is not None:
             # Trim the string to a fixed size taking care of the variable width unicode chars
-            rt = ""
-            sz = 0
-            for ch in self._text:
-                rt += ch
-                if unicodedata.category(ch) in ('Me','Mn'):
-                    continue
-
-                sz += 2 if unicodedata.east_asian_width(ch) == 'W' else 1
-
-                if sz == width:
-                    ret._text   =  rt
-                    ret._colors =  self._colors[:len(rt)]
-                    break
-                elif sz > width:
-                    ret._text   =  rt[:-1]+TTkCfg.theme.unicodeWideOverflowCh[1]
-                    ret._colors =  self._colors[:len(ret._text)]
-                    ret._colors[-1] = TTkString.unicodeWideOverflowColor
-                    break
+            # the first char reaching the width may be a wide one overflowing it
+            widths = TTkString.widths(self._text)
+            i = bisect_left(widths, width)
+            if widths[i] == width:
+                ret._text   =  self._text[:i]
+                ret._spans  =  TTkString._spansSlice(self._spans, 0, i)
+            else:
+                ret._text   =  self._text[:i-1]+TTkCfg.theme.unicodeWideOverflowCh[1]
+                ret._spans  =  TTkString._spansConcat(
+                                    TTkString._spansSlice(self._spans, 0, i-1), i-1,
+                                    ((0,TTkString.unicodeWideOverflowColor),))
         else:
             # Legacy, trim the string
             ret._text   =  self._text[:width]
-            ret._colors =  self._colors[:width]
+            ret._spans  =  TTkString._spansSlice(self._spans, 0, len(ret._text))
 
         ret._hasTab = '\t' in ret._text
         ret._fastCheckWidth(self._hasSpecialWidth)
@@ -375,7 +399,7 @@ class TTkString():
 
     def extractShortcuts(self):
         def _chGenerator():
-            for ch,color in zip(self._text,self._colors):
+            for ch,color in zip(self._text,self._expandColors()):
                 yield ch,color
         _newText   = ""
         _newColors = []
@@ -413,24 +437,30 @@ class TTkString():
 
         ret = TTkString()
         if oldLen == newLen:
-            ret._colors += self._colors
+            ret._spans  = self._spans
             ret._text   = self._text.replace(*args, **kwargs)
         elif oldLen > newLen:
+            colors = self._expandColors()
+            retColors = []
             start = 0
             while pos := self._text.index(old, start) if old in self._text[start:] else None:
-                ret._colors += self._colors[start:pos+newLen]
+                retColors += colors[start:pos+newLen]
                 start = pos+oldLen
                 count -= 1
                 if count == 0: break
-            ret._colors += self._colors[start:]
+            retColors += colors[start:]
+            ret._spans  = TTkString._spansFromList(retColors)
             ret._text   = self._text.replace(*args, **kwargs)
         else:
+            colors = self._expandColors()
+            retColors = []
             start = 0
             while pos := self._text.index(old, start) if old in self._text[start:] else None:
-                ret._colors += self._colors[start:pos+oldLen] + [self._colors[pos+oldLen-1]]*(newLen-oldLen)
+                retColors += colors[start:pos+oldLen] + [colors[pos+oldLen-1]]*(newLen-oldLen)
                 start = pos+oldLen
                 if count == 0: break
-            ret._colors += self._colors[start:]
+            retColors += colors[start:]
+            ret._spans  = TTkString._spansFromList(retColors)
             ret._text   = self._text.replace(*args, **kwargs)
 
         ret._hasTab = '\t' in ret._text
@@ -458,24 +488,22 @@ class TTkString():
         ret._text  += self._text
         ret._hasTab = self._hasTab
         ret._hasSpecialWidth = self._hasSpecialWidth
+        _complete = lambda c: c|color
         if match:
-            ret._colors = self._colors.copy()
+            ret._spans = self._spans
             start=0
             lenMatch = len(match)
             while pos := self._text.index(match, start) if match in self._text[start:] else None:
                 start = pos+lenMatch
-                for i in range(pos, pos+lenMatch):
-                    ret._colors[i] |= color
+                ret._spans = TTkString._spansMapRange(ret._spans, len(self._text), pos, pos+lenMatch, _complete)
         elif posFrom == posTo == None:
-            ret._colors = [c|color for c in self._colors]
+            ret._spans = TTkString._spansMap(self._spans, _complete)
         elif posFrom < posTo:
-            ret._colors = self._colors.copy()
             posFrom = min(len(self._text),posFrom)
             posTo   = min(len(self._text),posTo)
-            for i in range(posFrom, posTo):
-                ret._colors[i] |= color
+            ret._spans = TTkString._spansMapRange(self._spans, len(self._text), posFrom, posTo, _complete)
         else:
-            ret._colors = [c|color for c in self._colors]
+            ret._spans = TTkString._spansMap(self._spans, _complete)
         return ret
 
 
@@ -498,21 +526,20 @@ class TTkString():
         ret._hasTab = self._hasTab
         ret._hasSpecialWidth = self._hasSpecialWidth
         if match:
-            ret._colors += self._colors
+            ret._spans = self._spans
             start=0
             lenMatch = len(match)
             while pos := self._text.index(match, start) if match in self._text[start:] else None:
                 start = pos+lenMatch
-                ret._colors[pos: pos+lenMatch] = [color]*lenMatch
+                ret._spans = TTkString._spansSetRange(ret._spans, len(self._text), pos, pos+lenMatch, color)
         elif posFrom == posTo == None:
-            ret._colors = [color]*len(self._text)
+            ret._spans = TTkString._spansFill(color, len(self._text))
         elif posFrom < posTo:
-            ret._colors += self._colors
             posFrom = min(len(self._text),posFrom)
             posTo   = min(len(self._text),posTo)
-            ret._colors[posFrom:posTo] = [color]*(posTo-posFrom)
+            ret._spans = TTkString._spansSetRange(self._spans, len(self._text), posFrom, posTo, color)
         else:
-            ret._colors += self._colors
+            ret._spans = self._spans
         return ret
 
     def substring(self, fr=None, to=None):
@@ -524,8 +551,9 @@ class TTkString():
         :type to: int, optional
         '''
         ret = TTkString()
+        fr, to, _ = slice(fr,to).indices(len(self._text))
         ret._text   = self._text[fr:to]
-        ret._colors = self._colors[fr:to]
+        ret._spans  = TTkString._spansSlice(self._spans, fr, to)
         ret._hasTab = '\t' in ret._text
         ret._fastCheckWidth(self._hasSpecialWidth)
         return ret
@@ -555,7 +583,7 @@ class TTkString():
         if self._hasSpecialWidth is not None:
             return self._getDataW()
         else:
-            return (tuple(self._text), self._colors)
+            return (tuple(self._text), self._expandColors())
 
     def search(self, regexp, ignoreCase=False):
         ''' Return the **re.match** of the **regexp**
@@ -597,45 +625,91 @@ class TTkString():
         return ret
 
     # Unicode Zero/Half/Normal sized chars helpers:
+    # The width of each char (0 = zero sized, 1 = half, 2 = full) is looked up in
+    # a str table covering the BMP (used by str.translate), built at the first use,
+    # the rare planes are cached
+    _widthTable = None
+
+    @staticmethod
+    def _charWidthUnicode(ch):
+        if unicodedata.category(ch) in ('Me','Mn'):
+            return 0
+        return 2 if unicodedata.east_asian_width(ch) == 'W' else 1
+
+    @staticmethod
+    def _buildWidthTable():
+        _w = TTkString._charWidthUnicode
+        TTkString._widthTable = ''.join(chr(_w(chr(i))) for i in range(0x10000))
+        return TTkString._widthTable
+
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _charWidthRare(ch):
+        return TTkString._charWidthUnicode(ch)
+
+    @staticmethod
+    def _charWidth(ch):
+        if (o := ord(ch)) < 0x10000:
+            return ord((TTkString._widthTable or TTkString._buildWidthTable())[o])
+        return TTkString._charWidthRare(ch)
+
+    @staticmethod
+    def _charWidths(txt):
+        if txt.isascii():
+            return b'\x01'*len(txt)
+        table = TTkString._widthTable or TTkString._buildWidthTable()
+        try:
+            # The chars outside the table are not translated and fail the encoding
+            return txt.translate(table).encode('latin-1')
+        except UnicodeEncodeError:
+            _rare = TTkString._charWidthRare
+            return bytes(ord(table[o]) if o < 0x10000 else _rare(chr(o)) for o in map(ord, txt))
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def widths(txt):
+        ''' Return the displayed width of each prefix of the text
+
+        The result is memoized and must not be modified,
+        the item **i** is the width of **txt[:i]** (the tabs are considered one char wide)
+
+        :param txt: the text
+        :type txt: str
+
+        :return: array
+        '''
+        return array('I', accumulate(TTkString._charWidths(txt), initial=0))
+
     @staticmethod
     def _isWideCharData(ch):
-        if len(ch) == 1:
-            return unicodedata.east_asian_width(ch)=='W'
-        if len(ch) > 1:
-            return unicodedata.east_asian_width(ch[0])=='W'
-        return False
+        return TTkString._charWidth(ch[0]) == 2 if ch else False
 
     @staticmethod
     def _isSpecialWidthChar(ch):
-        return ( unicodedata.east_asian_width(ch) == 'W' or
-                 unicodedata.category(ch) in ('Me','Mn') )
+        return TTkString._charWidth(ch) != 1
 
     @staticmethod
     def _getWidthText(txt):
-        return ( len(txt) +
-            sum(unicodedata.east_asian_width(ch) == 'W' for ch in txt) -
-            sum(unicodedata.category(ch) in ('Me','Mn') for ch in txt) )
+        return sum(TTkString._charWidths(txt))
 
     @staticmethod
     def _getLenTextWoZero(txt):
-        return ( len(txt) -
-            sum(unicodedata.category(ch) in ('Me','Mn') for ch in txt) )
+        return len(txt) - TTkString._charWidths(txt).count(0)
 
     def nextPos(self, pos):
+        text = self._text
         pos += 1
-        for i,ch in enumerate(self._text[pos:]):
-            if unicodedata.category(ch) not in ('Me','Mn'):
-                return pos+i
-        return len(self._text)
+        while pos < len(text) and not TTkString._charWidth(text[pos]):
+            pos += 1
+        return min(pos, len(text))
 
     def prevPos(self, pos):
-        # from TermTk.TTkCore.log import TTkLog
-        # TTkLog.debug(f"->{self._text[:pos]}<- {pos=}")
-        # TTkLog.debug(f"{str(reversed(self._text[:pos]))} {pos=}")
-        for i,ch in enumerate(reversed(self._text[:pos])):
-            # TTkLog.debug(f"{i}---> {ch}    ")
-            if unicodedata.category(ch) not in ('Me','Mn'):
-                return pos-i-1
+        text = self._text
+        pos = min(pos, len(text))
+        while pos > 0:
+            pos -= 1
+            if TTkString._charWidth(text[pos]):
+                return pos
         return 0
 
     def _fastCheckWidth(self,a,b=None):
@@ -643,30 +717,30 @@ class TTkString():
                 a is None and b is None ) else self._termWidthW()
 
     def _checkWidth(self):
-        # from: tests/timeit/09.widechar.check.py
-        # the first not halfsize char is 0x300
-        # this check is ~3 times faster than the 2 combined unicode checks
-        # and will quickly filter out the (more common) simple ascii text
-        tw = self._termWidthW() if any(ord(ch)>=0x300 for ch in self._text) else None
-        self._hasSpecialWidth = tw if tw != len(self._text) else None
+        # isascii() is constant time and will quickly filter out
+        # the (more common) simple ascii text,
+        # the wide and zero sized chars may balance the width, the check is on each char
+        if self._text.isascii():
+            self._hasSpecialWidth = None
+        else:
+            widths = TTkString._charWidths(self._text)
+            self._hasSpecialWidth = sum(widths) if widths.strip(b'\x01') else None
 
     def _termWidthW(self):
         ''' String displayed length
 
         This value consider the displayed size (Zero, Half, Full) of each character.
         '''
-        return ( len(self._text) +
-             sum(unicodedata.east_asian_width(ch) == 'W' for ch in self._text) -
-             sum(unicodedata.category(ch) in ('Me','Mn') for ch in self._text) )
+        return sum(TTkString._charWidths(self._text))
 
     def _getDataW(self):
         retTxt = []
         retCol = []
-        for i,ch in enumerate(self._text):
-            if unicodedata.east_asian_width(ch) == 'W':
+        for ch,w,c in zip(self._text, TTkString._charWidths(self._text), self._expandColors()):
+            if w == 2:
                 retTxt += (ch,'')
-                retCol += (self._colors[i],self._colors[i])
-            elif unicodedata.category(ch) in ('Me','Mn'):
+                retCol += (c,c)
+            elif w == 0:
                 if retTxt:
                     if len(retTxt)>1 and retTxt[-1] == '':
                         retTxt[-2]+=ch
@@ -677,5 +751,77 @@ class TTkString():
                 #    retCol = [TTkColor.RST]
             else:
                 retTxt.append(ch)
-                retCol.append(self._colors[i])
+                retCol.append(c)
         return (retTxt, retCol)
+
+    # Run-length colors helpers:
+    def _expandColors(self):
+        return TTkString._spansExpand(self._spans, len(self._text))
+
+    @staticmethod
+    def _spansFill(color, length):
+        return ((0,color),) if length > 0 else ()
+
+    @staticmethod
+    def _spansFromList(colors):
+        ret = []
+        prev = None
+        for i,c in enumerate(colors):
+            if c is not prev or not ret:
+                ret.append((i,c))
+                prev = c
+        return tuple(ret)
+
+    @staticmethod
+    def _spansExpand(spans, length):
+        if len(spans) == 1:
+            return [spans[0][1]]*length
+        ret = []
+        ext = ret.extend
+        for (a,c),(b,_) in zip(spans, spans[1:]+((length,None),)):
+            ext(repeat(c,b-a))
+        return ret
+
+    @staticmethod
+    def _spansColorAt(spans, pos):
+        # (pos+1,) sorts before any (pos+1, color) span,
+        # the colors are never compared
+        return spans[bisect_left(spans, (pos+1,))-1][1]
+
+    @staticmethod
+    def _spansSlice(spans, fr, to):
+        if fr >= to: return ()
+        i = bisect_left(spans, (fr+1,))-1
+        j = bisect_left(spans, (to,))
+        return ((0,spans[i][1]),) + tuple((a-fr,c) for a,c in spans[i+1:j])
+
+    @staticmethod
+    def _spansConcat(spansA, lenA, spansB):
+        if not spansB: return spansA
+        if not spansA: return spansB
+        if spansA[-1][1] is spansB[0][1]:
+            spansB = spansB[1:]
+        return spansA + tuple((a+lenA,c) for a,c in spansB)
+
+    @staticmethod
+    def _spansMap(spans, fn):
+        ret = []
+        prev = None
+        for a,c in spans:
+            c = fn(c)
+            if c is not prev or not ret:
+                ret.append((a,c))
+                prev = c
+        return tuple(ret)
+
+    @staticmethod
+    def _spansSetRange(spans, length, fr, to, color):
+        return TTkString._spansMapRange(spans, length, fr, to, lambda _: color)
+
+    @staticmethod
+    def _spansMapRange(spans, length, fr, to, fn):
+        if fr >= to: return spans
+        _slice, _concat = TTkString._spansSlice, TTkString._spansConcat
+        return _concat(
+                    _concat(_slice(spans, 0, fr), fr, TTkString._spansMap(_slice(spans, fr, to), fn)),
+                    to, _slice(spans, to, length))
@@ -51,6 +51,7 @@ class TTkTimer():
             # Little hack to avoid deadloop in pyodide
             if rw := TTkHelper._rootWidget:
                 rw._paintEvent.set()
+            TTkTimer._timers[tid]._timer = None
             TTkTimer._timers[tid].timeout.emit()
 
     @staticmethod
@@ -64,6 +65,9 @@ class TTkTimer():
     def quit(self):
         pass
 
+    def isActive(self) -> bool:
+        return self._timer is not None
+
     @pyTTkSlot(float)
     def start(self, sec=0.0):
         self.stop()
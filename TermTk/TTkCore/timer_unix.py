@@ -20,46 +20,97 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+import heapq
+import itertools
 import threading
+from time import monotonic
+from typing import Optional
 
 from TermTk.TTkCore.signal import pyTTkSlot, pyTTkSignal
-from TermTk.TTkCore.helper import TTkHelper
 
-class TTkTimer(threading.Thread):
-    __slots__ = (
-        'timeout', '_delay',
-        '_timer', '_quit', '_start')
+class TTkTimer():
+    ''' Single shot timer
+
+    The timers don't use any thread,
+    the deadlines are collected in a heap processed by the main loop
+    (:meth:`~TermTk.TTkCore.TTkTerm.input.TTkInput.start`)
+    and the :attr:`timeout` signal is emitted in the same thread of the input and paint events.
+    '''
+    __slots__ = ('timeout', '_tid')
+
+    # Heap of (deadline, tid, timer), the entries of the stopped or restarted timers
+    # are discarded once they reach the top of the heap
+    _heap = []
+    _lock = threading.Lock()
+    _tids = itertools.count(1)
+    _loopThread = None
+    _wakeupAlways = False
+    _wakeup = None
+
     def __init__(self):
         self.timeout = pyTTkSignal()
-        self._delay = 0
-        self._quit  = threading.Event()
-        self._start = threading.Event()
-        self._timer = threading.Event()
-        super().__init__()
-        TTkHelper.quitEvent.connect(self.quit)
+        self._tid = 0
 
     def quit(self):
-        self._quit.set()
-        self._timer.set()
-        self._start.set()
+        self.stop()
 
-    def run(self):
-        while not self._quit.is_set():
-            self._start.wait()
-            self._start.clear()
-            if not self._timer.wait(self._delay):
-                self.timeout.emit()
+    def isActive(self) -> bool:
+        return self._tid != 0
 
     @pyTTkSlot(float)
     def start(self, sec=0.0):
-        self._delay = sec
-        self._timer.set()
-        self._timer.clear()
-        self._start.set()
-        if not self.native_id:
-            super().start()
+        deadline = monotonic() + sec
+        with TTkTimer._lock:
+            self._tid = tid = next(TTkTimer._tids)
+            heapq.heappush(TTkTimer._heap, (deadline, tid, self))
+            first = TTkTimer._heap[0][1] == tid
+        # The main loop may be waiting for a later deadline
+        if first and TTkTimer._wakeup and (TTkTimer._wakeupAlways or threading.get_ident() != TTkTimer._loopThread):
+            TTkTimer._wakeup()
 
     @pyTTkSlot()
     def stop(self):
-        self._timer.set()
+        self._tid = 0
+
+    @staticmethod
+    def attachLoop(wakeup, always:bool=False) -> None:
+        ''' Register the main loop that process the timers
+
+        :param wakeup: callback used to interrupt the wait of the main loop from a different thread
+        :param always: call the wakeup also when the timer is started from the main loop thread
+        '''
+        TTkTimer._loopThread = threading.get_ident()
+        TTkTimer._wakeupAlways = always
+        TTkTimer._wakeup = wakeup
+
+    @staticmethod
+    def detachLoop() -> None:
+        TTkTimer._loopThread = None
+        TTkTimer._wakeupAlways = False
+        TTkTimer._wakeup = None
+
+    @staticmethod
+    def nextTimeout() -> Optional[float]:
+        ''' Return the seconds before the next deadline, None if no timer is active '''
+        heap = TTkTimer._heap
+        with TTkTimer._lock:
+            while heap and heap[0][2]._tid != heap[0][1]:
+                heapq.heappop(heap)
+            if not heap:
+                return None
+            return max(0.0, heap[0][0] - monotonic())
 
+    @staticmethod
+    def processTimers() -> None:
+        ''' Emit the timeout of the expired timers '''
+        heap = TTkTimer._heap
+        now = monotonic()
+        expired = []
+        with TTkTimer._lock:
+            while heap and heap[0][0] <= now:
+                _, tid, timer = heapq.heappop(heap)
+                if timer._tid == tid:
+                    timer._tid = 0
+                    expired.append(timer)
+        for timer in expired:
+            timer.timeout.emit()
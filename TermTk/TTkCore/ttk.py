@@ -34,7 +34,7 @@ from TermTk.TTkCore.TTkTerm.input import TTkInput
 from TermTk.TTkCore.TTkTerm.inputkey import TTkKeyEvent
 from TermTk.TTkCore.TTkTerm.inputmouse import TTkMouseEvent
 from TermTk.TTkCore.TTkTerm.term import TTkTerm
-from TermTk.TTkCore.signal import pyTTkSignal, pyTTkSlot
+from TermTk.TTkCore.signal import pyTTkSignal, pyTTkSlot, _pyTTkSignal_obj
 from TermTk.TTkCore.constant import TTkK
 from TermTk.TTkCore.log import TTkLog
 from TermTk.TTkCore.cfg import TTkCfg, TTkGlbl
@@ -85,6 +85,7 @@ class TTk(TTkContainer):
         '_drawMutex',
         '_paintEvent',
         '_lastMultiTap',
+        '_termResized',
         'paintExecuted')
 
     def __init__(self, *args, **kwargs):
@@ -95,8 +96,18 @@ class TTk(TTkContainer):
         if ('TERMTK_FILE_LOG' in os.environ and (_logFile := os.environ['TERMTK_FILE_LOG'])):
             TTkLog.use_default_file_logging(_logFile)
 
+        # If the "TERMTK_PACKEDCANVAS" env variable is defined
+        # the widgets use the array based canvas (TTkCanvasPacked)
+        # It must be defined before the root canvas is created
+        if 'TERMTK_PACKEDCANVAS' in os.environ:
+            TTkCfg.packedCanvas = True
+
         self._timer = None
         self.paintExecuted = pyTTkSignal()
+        # The resize is notified by the terminal driver thread,
+        # the burst of events is delivered once per frame in the main loop
+        self._termResized = pyTTkSignal(int, int)
+        self._termResized.connect(self._win_resize_cb, type=TTkK.QueuedConnection)
         super().__init__(*args, **kwargs)
         self._termMouse = True
         self._termDirectMouse = kwargs.get('mouseTrack',False)
@@ -119,6 +130,14 @@ class TTk(TTkContainer):
         if 'TERMTK_NEWRENDERER' in os.environ:
             TTkCfg.doubleBuffer = False
             TTkCfg.doubleBufferNew = True
+            TTkTerm.capabilities |= TTkTerm.Caps.REP
+
+        # If the "TERMTK_TERMCAPS" env variable is defined
+        # the output encoder use only the terminal capabilities listed
+        #  i.e.
+        #      TERMTK_TERMCAPS=relmove,rep,ech,el,bce   python3   demo/demo.py
+        if (_caps := os.environ.get('TERMTK_TERMCAPS')) is not None:
+            TTkTerm.capabilities = TTkTerm.Caps.fromString(_caps)
 
         TTkHelper.registerRootWidget(self)
 
@@ -129,59 +148,88 @@ class TTk(TTkContainer):
         self.frame+=1
         delta = curtime - self.time
         if delta > 5:
-            TTkLog.debug(f"fps: {int(self.frame/delta)}")
+            TTkLog.debug("fps: %d", int(self.frame/delta))
             self.frame = 0
             self.time  = curtime
 
     def mainloop(self):
+        '''Enters the main event loop and waits until :meth:`~quit` is called or the main widget is destroyed.'''
         try:
-            '''Enters the main event loop and waits until :meth:`~quit` is called or the main widget is destroyed.'''
-            TTkLog.debug( "" )
-            TTkLog.debug( "         ████████╗            ████████╗    " )
-            TTkLog.debug( "         ╚══██╔══╝            ╚══██╔══╝    " )
-            TTkLog.debug( "            ██║  ▄▄  ▄ ▄▄ ▄▄▖▄▖  ██║ █ ▗▖  " )
-            TTkLog.debug( "    ▞▀▚ ▖▗  ██║ █▄▄█ █▀▘  █ █ █  ██║ █▟▘   " )
-            TTkLog.debug( "    ▙▄▞▐▄▟  ██║ ▀▄▄▖ █    █ ▝ █  ██║ █ ▀▄  " )
-            TTkLog.debug( "    ▌    ▐  ╚═╝                  ╚═╝       " )
-            TTkLog.debug( "      ▚▄▄▘                                 " )
-            TTkLog.debug( "" )
-            TTkLog.debug(f"  Version: {TTkCfg.version}" )
-            TTkLog.debug( "" )
-            TTkLog.debug( "Starting Main Loop..." )
-            TTkLog.debug(f"screen = ({TTkTerm.getTerminalSize()})")
-
-            # Register events
-            TTkSignalDriver.init()
-
-            TTkLog.debug("Signal Event Registered")
-
-            TTkTerm.registerResizeCb(self._win_resize_cb)
-
-            self._timer = TTkTimer()
-            self._timer.timeout.connect(self._time_event)
-            self._timer.start(0.1)
-            self.show()
-
-            # Keep track of the multiTap to avoid the extra key release
-            self._lastMultiTap = False
-            TTkInput.init(
-                mouse=self._termMouse,
-                directMouse=self._termDirectMouse)
-            TTkTerm.init(
-                title=self._title,
-                sigmask=self._sigmask)
-
-            if self._showMouseCursor:
-                TTkTerm.push(TTkTerm.Mouse.DIRECT_ON)
-                m = TTk._mouseCursor()
-                self.rootLayout().addWidget(m)
-
+            self._mainloopInit()
             self._mainLoop()
         finally:
-            if platform.system() != 'Emscripten':
-                TTkSignalDriver.exit()
-                self.quit()
-                TTkTerm.exit()
+            self._mainloopExit()
+
+    async def mainloopAsync(self):
+        '''Run the main event loop in the running :mod:`asyncio` loop until :meth:`~quit` is called or the main widget is destroyed.
+
+        The input, the timers and the paint are scheduled on the asyncio loop,
+        the coroutines can update the widgets and emit the signals directly.
+
+        .. code-block:: python
+
+            async def main():
+                root = ttk.TTk()
+                ...
+                await root.mainloopAsync()
+
+            asyncio.run(main())
+        '''
+        try:
+            self._mainloopInit()
+            await TTkInput.startAsync()
+        finally:
+            self._mainloopExit()
+
+    def _mainloopInit(self):
+        TTkLog.debug( "" )
+        TTkLog.debug( "         ████████╗            ████████╗    " )
+        TTkLog.debug( "         ╚══██╔══╝            ╚══██╔══╝    " )
+        TTkLog.debug( "            ██║  ▄▄  ▄ ▄▄ ▄▄▖▄▖  ██║ █ ▗▖  " )
+        TTkLog.debug( "    ▞▀▚ ▖▗  ██║ █▄▄█ █▀▘  █ █ █  ██║ █▟▘   " )
+        TTkLog.debug( "    ▙▄▞▐▄▟  ██║ ▀▄▄▖ █    █ ▝ █  ██║ █ ▀▄  " )
+        TTkLog.debug( "    ▌    ▐  ╚═╝                  ╚═╝       " )
+        TTkLog.debug( "      ▚▄▄▘                                 " )
+        TTkLog.debug( "" )
+        TTkLog.debug(f"  Version: {TTkCfg.version}" )
+        TTkLog.debug( "" )
+        TTkLog.debug( "Starting Main Loop..." )
+        TTkLog.debug(f"screen = ({TTkTerm.getTerminalSize()})")
+
+        # Register events
+        TTkSignalDriver.init()
+
+        TTkLog.debug("Signal Event Registered")
+
+        # The queued signals are delivered in the paint routine
+        _pyTTkSignal_obj.attachQueue(TTkHelper.unlockPaint)
+        TTkTerm.registerResizeCb(self._termResized.emit)
+
+        self._timer = TTkTimer()
+        self._timer.timeout.connect(self._time_event)
+        self._timer.start(0.1)
+        self.show()
+
+        # Keep track of the multiTap to avoid the extra key release
+        self._lastMultiTap = False
+        TTkInput.init(
+            mouse=self._termMouse,
+            directMouse=self._termDirectMouse)
+        TTkTerm.init(
+            title=self._title,
+            sigmask=self._sigmask)
+
+        if self._showMouseCursor:
+            TTkTerm.push(TTkTerm.Mouse.DIRECT_ON)
+            m = TTk._mouseCursor()
+            self.rootLayout().addWidget(m)
+
+    def _mainloopExit(self):
+        if platform.system() != 'Emscripten':
+            _pyTTkSignal_obj.detachQueue()
+            TTkSignalDriver.exit()
+            self.quit()
+            TTkTerm.exit()
 
     def _mainLoop(self):
         if platform.system() == 'Emscripten':
@@ -273,18 +321,17 @@ class TTk(TTkContainer):
                 TTkHelper.prevFocus(focusWidget if focusWidget else self)
 
     def _time_event(self):
-        # Event.{wait and clear} should be atomic,
-        # BUTt: ( y )
-        #   if an update event (set) happen in between the wait and clear
-        #      the widget is still processed in the current paint routine
-        #   if an update event (set) happen after the wait and clear
+        # The paint timer is not restarted if there is nothing to be painted,
+        # the next update restart it (TTkHelper.unlockPaint)
+        #   if an update event (set) happen after the clear
         #      the widget is processed in the current paint routine
         #      an extra paint routine is triggered which return immediately due to
         #      the empty list of widgets to be processed - Not a big deal
-        #   if an update event (set) happen after the wait and clear and the paintAll Routine
-        #      well, it works as it is supposed to be
-        self._paintEvent.wait()
+        if not self._paintEvent.is_set():
+            return
         self._paintEvent.clear()
+        # A queued emission posted from now on triggers the next frame
+        _pyTTkSignal_obj.processQueued()
 
         w,h = TTkTerm.getTerminalSize()
         self._drawMutex.acquire()
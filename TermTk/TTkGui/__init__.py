@@ -1,5 +1,6 @@
 from .drag         import *
 from .textwrap1    import *
+from .textlines    import *
 from .textcursor   import *
 from .textdocument import *
 from .clipboard    import *
@@ -359,9 +359,6 @@ class TTkTextCursor():
         if self.hasSelection():
             _lineFirst, _lineRem, _lineAdd = self._removeSelectedText()
 
-        lineFirst = self._properties[0].position.line
-        lineRem, lineAdd = 0,0
-
         # Check if the number of lines is the same as the number of cursors
         # this is a corner case where each line belongs to a
         # different cursor
@@ -369,22 +366,20 @@ class TTkTextCursor():
         if len(textLines) != len(self._properties):
             textLines = [text]*len(self._properties)
 
-        # Calc the added and removed lines
-        for i, pr in enumerate(self._properties):
-            lenNewLines=len(textLines[i].split('\n'))
-            l = pr.position.line
-            p = pr.position.pos
-            if (  textLines[i] == '\n' and
-                  l == lineFirst != _lineFirst and
-                  p==len(self._document._dataLines[l]) ):
-                lineFirst = l+1
-                lineAdd = 1
-                lineRem = 0
-            elif (lineFirst + lineRem) > l:
-                lineAdd += lenNewLines-1
-            else:
-                lineAdd += lenNewLines + l-lineFirst-lineRem
-                lineRem = l - lineFirst + 1
+        # Calc the added and removed lines,
+        # the changed range goes from the first to the last cursor line
+        # (more cursors may share the same line)
+        cursorLines = [pr.position.line for pr in self._properties]
+        l = cursorLines[0]
+        if ( len(cursorLines) == 1 and textLines[0] == '\n' and
+             l != _lineFirst and
+             self._properties[0].position.pos == len(self._document._dataLines[l]) ):
+            # A new line added after the cursor line
+            lineFirst, lineRem, lineAdd = l+1, 0, 1
+        else:
+            lineFirst = min(cursorLines)
+            lineRem = max(cursorLines) - lineFirst + 1
+            lineAdd = lineRem + sum(len(t.split('\n'))-1 for t in textLines)
         if _lineFirst != -1:
             lineFirst, lineRem, lineAdd = TTkTextDocument._mergeChangesSlices(
                                                 (_lineFirst, _lineRem, _lineAdd),
@@ -403,9 +398,7 @@ class TTkTextCursor():
             newLines = ( self._document._dataLines[l].substring(to=p) +
                          ttktext +
                          self._document._dataLines[l].substring(fr=p) ).split('\n')
-            self._document._dataLines[l] = newLines[0]
-            for nl in reversed(newLines[1:]):
-                self._document._dataLines.insert(l+1, nl)
+            self._document._dataLines[l:l+1] = newLines
 
             # Move/Shift the cursors based on the pasted content
             #
@@ -440,8 +433,8 @@ class TTkTextCursor():
                 pp.anchor.line += diffLine
         self._autoChanged = True
         self._document.setChanged(True)
-        self._document.contentsChanged.emit()
         self._document.contentsChange.emit(lineFirst,  lineRem,  lineAdd)
+        self._document.contentsChanged.emit()
         self._autoChanged = False
         self._document.cursorPositionChanged.emit(self)
 
@@ -504,22 +497,12 @@ class TTkTextCursor():
     def _removeSelectedText(self):
         currPos = self.position().toNum()
 
-        lineFirst = self._properties[0].selectionStart().line
-        lineAdd = 0
-        lineRem = 0
-
-        for p in self._properties:
-            # Check how many lines are removed/added after this operation
-            selSt = p.selectionStart()
-            selEn = p.selectionEnd()
-
-            if (lineFirst + lineRem) > selSt.line:
-                _lineAdd = 0
-            else:
-                _lineAdd = 0 if selSt.pos == selEn.pos == 0 else 1
-
-            lineAdd += selSt.line - lineFirst - lineRem + _lineAdd
-            lineRem = selEn.line - lineFirst + _lineAdd
+        # The changed range goes from the first to the last selected line
+        # (the selections of more cursors may share the same line)
+        sel = [(p.selectionStart(), p.selectionEnd()) for p in self._properties]
+        lineFirst = min(st.line for st,_ in sel)
+        lineRem   = max(en.line for _,en in sel) - lineFirst + 1
+        lineAdd   = lineRem - sum(en.line - st.line for st,en in sel)
 
         def _alignPoint(point,st,en):
             point.line += st.line - en.line
@@ -531,7 +514,7 @@ class TTkTextCursor():
             selEn = p.selectionEnd()
             self._document._dataLines[selSt.line] = self._document._dataLines[selSt.line].substring(to=selSt.pos) + \
                                self._document._dataLines[selEn.line].substring(fr=selEn.pos)
-            self._document._dataLines = self._document._dataLines[:selSt.line+1] + self._document._dataLines[selEn.line+1:]
+            del self._document._dataLines[selSt.line+1:selEn.line+1]
             for pp in self._properties[i+1:]:
                 _alignPoint(pp.position, selSt, selEn)
                 _alignPoint(pp.anchor,   selSt, selEn)
@@ -546,8 +529,8 @@ class TTkTextCursor():
         a,b,c = self._removeSelectedText()
         self._autoChanged = True
         self._document.setChanged(True)
-        self._document.contentsChanged.emit()
         self._document.contentsChange.emit(a,b,c)
+        self._document.contentsChanged.emit()
         self._autoChanged = False
 
     def applyColor(self, color):
@@ -25,6 +25,7 @@ __all__ = ['TTkTextDocument']
 from TermTk.TTkCore.log import TTkLog
 from TermTk.TTkCore.signal import pyTTkSignal, pyTTkSlot
 from TermTk.TTkCore.string import TTkString
+from TermTk.TTkGui.textlines import TTkTextLines
 
 class TTkTextDocument():
     '''
@@ -129,7 +130,7 @@ class TTkTextDocument():
         self.undoCommandAdded = pyTTkSignal()
         self.modificationChanged = pyTTkSignal(bool)
         text =  kwargs.get('text'," ")
-        self._dataLines = [TTkString(t) for t in text.split('\n')]
+        self._dataLines = TTkTextLines(TTkString(t) for t in text.split('\n'))
         self._modified = False
         # Cumulative changes since the lasrt snapshot
         self._snapChanged = None
@@ -206,16 +207,16 @@ class TTkTextDocument():
         return len(self._dataLines)
 
     def characterCount(self):
-        return sum([len[x] for x in self._dataLines])+self.lineCount()
+        return self._dataLines.charCount()+self.lineCount()
 
     def setText(self, text):
         remLines = len(self._dataLines)
-        self._dataLines = [TTkString(t) for t in text.split('\n')]
+        self._dataLines = TTkTextLines(TTkString(t) for t in text.split('\n'))
         self._modified = False
         self._lastSnap = self._dataLines.copy()
         self._snap = TTkTextDocument._snapshot(self._lastCursor, None, None)
-        self.contentsChanged.emit()
         self.contentsChange.emit(0,remLines,len(self._dataLines))
+        self.contentsChanged.emit()
         self._snapChanged = None
 
     def appendText(self, text):
@@ -226,8 +227,8 @@ class TTkTextDocument():
         self._modified = False
         self._lastSnap = self._dataLines.copy()
         self._snap = TTkTextDocument._snapshot(self._lastCursor, None, None)
-        self.contentsChanged.emit()
         self.contentsChange.emit(oldLines,0,len(self._dataLines)-oldLines)
+        self.contentsChanged.emit()
         self._snapChanged = None
 
     def isUndoAvailable(self):
@@ -281,6 +282,7 @@ class TTkTextDocument():
             (not next and not self._snap._prevDiff) ):
             return None
 
+        d = self._snap._nextDiff if next else self._snap._prevDiff
         if next:
             self._snap = self._snap.getNextSnap(self._dataLines)
         else:
@@ -289,7 +291,9 @@ class TTkTextDocument():
         self._lastSnap = self._dataLines.copy()
         self._lastCursor = self._snap._cursor.copy()
 
+        self.contentsChange.emit(d._i1, d._i2-d._i1, len(d._slice))
         self.contentsChanged.emit()
+        self._snapChanged = None
         self.undoAvailable.emit(self.isUndoAvailable())
         self.redoAvailable.emit(self.isRedoAvailable())
         return self._snap._cursor
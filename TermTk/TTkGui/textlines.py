@@ -0,0 +1,305 @@
+# MIT License
+#
+# Copyright (c) 2024 Eugenio Parodi <ceccopierangiolieugenio AT googlemail DOT com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+__all__ = ['TTkTextLines']
+
+class _TTkTextLinesLeaf():
+    __slots__ = ('items', 'size', 'chars')
+    height = 0
+    def __init__(self, items, chars=None):
+        self.items = items
+        self.size  = len(items)
+        self.chars = sum(map(len, items)) if chars is None else chars
+
+class _TTkTextLinesNode():
+    __slots__ = ('left', 'right', 'size', 'lsize', 'chars', 'height')
+    def __init__(self, left, right):
+        self.left   = left
+        self.right  = right
+        self.lsize  = left.size
+        self.size   = left.size + right.size
+        self.chars  = left.chars + right.chars
+        self.height = 1 + (left.height if left.height > right.height else right.height)
+
+class TTkTextLines():
+    ''' Persistent list of the lines of a :class:`~TermTk.TTkGui.textdocument.TTkTextDocument`
+
+    The lines are stored in blocks, the leaves of a balanced (AVL) rope,
+    built by halves and kept balanced by the rotations of the joins;
+    the nodes are never modified, each change rebuilds only the path to the
+    changed blocks sharing the rest of the tree.
+
+    - :meth:`copy` is constant time (used by the snapshots)
+    - indexing, insert, append and the slice replacement are logarithmic
+      (plus the size of the changed block)
+    - the number of lines and chars is kept in the nodes
+
+    It supports the list operations used by the document and the cursor,
+    the slices are returned as lists.
+    '''
+    __slots__ = ('_root', '_cache')
+
+    _leafSize = 128
+    _empty = _TTkTextLinesLeaf(())
+
+    def __init__(self, lines=()):
+        self._root = TTkTextLines._build(list(lines))
+        self._cache = (None, 0, TTkTextLines._empty)
+
+    # Tree helpers:
+    @staticmethod
+    def _build(items):
+        if not items: return TTkTextLines._empty
+        ls = TTkTextLines._leafSize
+        leaves = [_TTkTextLinesLeaf(tuple(items[i:i+ls])) for i in range(0,len(items),ls)]
+        # Split the blocks in halves, the sizes of the two halves differ at most by one
+        # so do their heights (ceil(log2(n)))
+        def _tree(a, b):
+            if b-a == 1: return leaves[a]
+            m = (a+b+1)//2
+            return _TTkTextLinesNode(_tree(a,m), _tree(m,b))
+        return _tree(0, len(leaves))
+
+    @staticmethod
+    def _balance(l, r):
+        Node = _TTkTextLinesNode
+        if l.height > r.height+1:
+            if l.left.height >= l.right.height:
+                return Node(l.left, Node(l.right, r))
+            lr = l.right
+            return Node(Node(l.left, lr.left), Node(lr.right, r))
+        if r.height > l.height+1:
+            if r.right.height >= r.left.height:
+                return Node(Node(l, r.left), r.right)
+            rl = r.left
+            return Node(Node(l, rl.left), Node(rl.right, r.right))
+        return Node(l, r)
+
+    @staticmethod
+    def _join(a, b):
+        if not a.size: return b
+        if not b.size: return a
+        if a.height > b.height+1:
+            return TTkTextLines._balance(a.left, TTkTextLines._join(a.right, b))
+        if b.height > a.height+1:
+            return TTkTextLines._balance(TTkTextLines._join(a, b.left), b.right)
+        if not a.height and not b.height and len(a.items)+len(b.items) <= TTkTextLines._leafSize:
+            return _TTkTextLinesLeaf(a.items+b.items)
+        return _TTkTextLinesNode(a, b)
+
+    @staticmethod
+    def _split(n, i):
+        ''' Split at the start of the block containing the line **i**
+
+        :return: (left, right, offset of i in the first block of right)
+        '''
+        if type(n) is not _TTkTextLinesNode:
+            if i < len(n.items):
+                return TTkTextLines._empty, n, i
+            return n, TTkTextLines._empty, 0
+        if i < n.lsize:
+            l, r, k = TTkTextLines._split(n.left, i)
+            return l, TTkTextLines._join(r, n.right), k
+        l, r, k = TTkTextLines._split(n.right, i-n.lsize)
+        return TTkTextLines._join(n.left, l), r, k
+
+    @staticmethod
+    def _popFirst(n):
+        if type(n) is not _TTkTextLinesNode:
+            return n, TTkTextLines._empty
+        leaf, l = TTkTextLines._popFirst(n.left)
+        return leaf, TTkTextLines._join(l, n.right)
+
+    @staticmethod
+    def _popLast(n):
+        if type(n) is not _TTkTextLinesNode:
+            return TTkTextLines._empty, n
+        r, leaf = TTkTextLines._popLast(n.right)
+        return TTkTextLines._join(n.left, r), leaf
+
+    @staticmethod
+    def _push(n, items, chars):
+        ''' Append the items (less than a block) following the right spine '''
+        if type(n) is not _TTkTextLinesNode:
+            if len(n.items)+len(items) <= TTkTextLines._leafSize:
+                return _TTkTextLinesLeaf(n.items+items, n.chars+chars)
+            return _TTkTextLinesNode(n, _TTkTextLinesLeaf(items, chars))
+        return TTkTextLines._balance(n.left, TTkTextLines._push(n.right, items, chars))
+
+    @staticmethod
+    def _items(n, a, b):
+        if type(n) is not _TTkTextLinesNode:
+            yield from n.items[a:b]
+            return
+        ls = n.lsize
+        if a < ls:
+            yield from TTkTextLines._items(n.left, a, min(b,ls))
+        if b > ls:
+            yield from TTkTextLines._items(n.right, max(0,a-ls), b-ls)
+
+    @staticmethod
+    def _set(n, i, line):
+        if type(n) is not _TTkTextLinesNode:
+            return _TTkTextLinesLeaf(n.items[:i]+(line,)+n.items[i+1:])
+        if i < n.lsize:
+            return _TTkTextLinesNode(TTkTextLines._set(n.left, i, line), n.right)
+        return _TTkTextLinesNode(n.left, TTkTextLines._set(n.right, i-n.lsize, line))
+
+    def _splice(self, i, j, lines):
+        ''' Replace the lines [i:j] '''
+        _split, _join = TTkTextLines._split, TTkTextLines._join
+        left, rest, k1 = _split(self._root, i)
+        items = list(TTkTextLines._items(rest, 0, k1))
+        items.extend(lines)
+        _, right, k2 = _split(rest, j-left.size)
+        if k2:
+            leaf, right = TTkTextLines._popFirst(right)
+            items += leaf.items[k2:]
+        # Merge the small blocks with the previous one
+        if len(items) < TTkTextLines._leafSize//2 and left.size:
+            left, leaf = TTkTextLines._popLast(left)
+            items[:0] = leaf.items
+        self._root = _join(_join(left, TTkTextLines._build(items)), right)
+
+    def _index(self, i):
+        size = self._root.size
+        if i < 0: i += size
+        if not 0 <= i < size:
+            raise IndexError('TTkTextLines index out of range')
+        return i
+
+    # List interface:
+    def __len__(self):
+        return self._root.size
+
+    def __iter__(self):
+        stack = [self._root]
+        while stack:
+            n = stack.pop()
+            if type(n) is _TTkTextLinesNode:
+                stack += (n.right, n.left)
+            else:
+                yield from n.items
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            a, b, step = i.indices(len(self))
+            if step != 1:
+                return list(self)[i]
+            return list(TTkTextLines._items(self._root, a, b)) if a < b else []
+        root, fr, leaf = self._cache
+        if root is self._root and 0 <= i-fr < leaf.size:
+            return leaf.items[i-fr]
+        i = fr = self._index(i)
+        n = self._root
+        while type(n) is _TTkTextLinesNode:
+            if i < n.lsize:
+                n = n.left
+            else:
+                i -= n.lsize
+                n = n.right
+        # The nodes are immutable, the last block is valid until the root changes
+        self._cache = (self._root, fr-i, n)
+        return n.items[i]
+
+    def __setitem__(self, i, value):
+        if isinstance(i, slice):
+            a, b, step = i.indices(len(self))
+            if step != 1:
+                raise ValueError('TTkTextLines supports only contiguous slices')
+            self._splice(a, max(a,b), list(value))
+        else:
+            self._root = TTkTextLines._set(self._root, self._index(i), value)
+
+    def __delitem__(self, i):
+        if isinstance(i, slice):
+            self[i] = []
+        else:
+            i = self._index(i)
+            self._splice(i, i+1, [])
+
+    def __iadd__(self, lines):
+        self.extend(lines)
+        return self
+
+    def insert(self, i, line):
+        size = len(self)
+        i = max(0, min(size, i+size if i < 0 else i))
+        self._splice(i, i, [line])
+
+    def append(self, line):
+        self._root = TTkTextLines._push(self._root, (line,), len(line))
+
+    def extend(self, lines):
+        lines = tuple(lines)
+        if len(lines) < TTkTextLines._leafSize:
+            self._root = TTkTextLines._push(self._root, lines, sum(map(len, lines)))
+        else:
+            size = len(self)
+            self._splice(size, size, lines)
+
+    def copy(self):
+        ret = TTkTextLines()
+        ret._root  = self._root
+        ret._cache = self._cache
+        return ret
+
+    def charCount(self):
+        ''' Return the number of chars of all the lines (excluding the newlines) '''
+        return self._root.chars
+
+    def charsBefore(self, line):
+        ''' Return the number of chars of the lines before **line** (excluding the newlines) '''
+        line = max(0, min(line, len(self)))
+        n = self._root
+        ret = 0
+        while type(n) is _TTkTextLinesNode:
+            if line < n.lsize:
+                n = n.left
+            else:
+                ret  += n.left.chars
+                line -= n.lsize
+                n = n.right
+        return ret + sum(map(len, n.items[:line]))
+
+    def lineAtChar(self, pos):
+        ''' Return the line containing the char at **pos** and the offset of the char in this line
+        (the newlines are not counted)
+
+        :return: (line, offset)
+        '''
+        if not 0 <= pos < self._root.chars:
+            raise IndexError('TTkTextLines char position out of range')
+        n = self._root
+        line = 0
+        while type(n) is _TTkTextLinesNode:
+            if pos < n.left.chars:
+                n = n.left
+            else:
+                pos  -= n.left.chars
+                line += n.lsize
+                n = n.right
+        for item in n.items:
+            if pos < (size := len(item)):
+                return line, pos
+            pos  -= size
+            line += 1
@@ -23,32 +23,58 @@
 __all__ = ['TTkTextWrap']
 
 from TermTk.TTkCore.constant import TTkK
-from TermTk.TTkCore.signal import pyTTkSignal
+from TermTk.TTkCore.signal import pyTTkSignal, pyTTkSlot
 from TermTk.TTkCore.string import TTkString
+from TermTk.TTkCore.timer import TTkTimer
 from TermTk.TTkGui.textcursor import TTkTextCursor
 from TermTk.TTkGui.textdocument import TTkTextDocument
+from TermTk.TTkGui.textlines import TTkTextLines
 
 class TTkTextWrap():
+    '''
+        _wraps = for each line of the document the tuple of the slices displayed in each screen line;
+                 [ ((posFrom, posTo), ... ), ... ]
+                 The number of screen lines is the number of chars of this :class:`~TermTk.TTkGui.textlines.TTkTextLines`
+        _stale = the lines not wrapped with the current settings,
+                 the stale slices are still valid but they may exceed the wrap width
+
+        The document changes (contentsChange) rewrap only the changed lines,
+        the full rewrap (wrap width or mode change) rewraps only the first chunk of lines
+        and the lines displayed (:meth:`screenLines`), the remaining lines are rewrapped
+        progressively in the main loop.
+    '''
     __slots__ = (
-        '_lines', '_textDocument', '_tabSpaces',
+        '_wraps', '_stale', '_textDocument', '_tabSpaces',
         '_wordWrapMode', '_wrapWidth',
-        '_enable',
+        '_enable', '_rewrapTimer',
         # Signals
         'wrapChanged'
         )
+
+    # Number of lines rewrapped in a single pass
+    _wrapChunk = 2000
+
     def __init__(self, *args, **kwargs):
         # signals
         self.wrapChanged = pyTTkSignal()
 
         self._enable = False
-        self._lines = [(0,(0,0))]
+        self._wraps = TTkTextLines()
+        self._stale = bytearray()
         self._tabSpaces = 4
         self._wrapWidth     = 80
         self._wordWrapMode = TTkK.WrapAnywhere
+        self._textDocument = None
+        self._rewrapTimer = TTkTimer()
+        self._rewrapTimer.timeout.connect(self._rewrapProgress)
         self.setDocument(kwargs.get('document',TTkTextDocument()))
 
     def setDocument(self, document):
+        if self._textDocument:
+            self._textDocument.contentsChange.disconnect(self._documentChange)
         self._textDocument = document
+        self._textDocument.contentsChange.connect(self._documentChange)
+        self._wraps = TTkTextLines()
         self.rewrap()
 
     def disable(self):
@@ -58,7 +84,7 @@ class TTkTextWrap():
         self._enable = True
 
     def size(self):
-        return len(self._lines)
+        return self._wraps.charCount()
 
     def wrapWidth(self):
         return self._wrapWidth
@@ -74,50 +100,123 @@ class TTkTextWrap():
         self._wordWrapMode = mode
         self.rewrap()
 
-    def rewrap(self):
-        self._lines = []
+    def _wrap(self, l:TTkString):
+        ''' Return the slices of the line **l** displayed in each screen line '''
         if not self._enable:
-            def _process(i,l):
-                self._lines.append((i,(0,len(l)+1)))
+            return ((0,len(l)+1),)
+        if not len(l): # if the line is empty append it
+            return ((0,0),)
+        w = self._wrapWidth
+        ret = []
+        fr = 0
+        to = 0
+        while len(l):
+            fl = l.tab2spaces(self._tabSpaces)
+            if fl.termWidth() <= w:
+                ret.append((fr,fr+len(l)+1))
+                break
+            to = max(1,l.tabCharPos(w,self._tabSpaces))
+            if self._wordWrapMode == TTkK.WordWrap: # Find the index of the first white space
+                s = str(l)
+                newTo = to
+                while newTo and ( s[newTo] != ' ' and s[newTo] != '\t' ): newTo-=1
+                if newTo: to = newTo
+            ret.append((fr,fr+to))
+            l = l.substring(to)
+            fr += to
+        return tuple(ret)
+
+    def _rewrapRange(self, fr, to):
+        self._wraps[fr:to] = [self._wrap(l) for l in self._textDocument._dataLines[fr:to]]
+        self._stale[fr:to] = bytes(to-fr)
+
+    def _rewrapStale(self, count):
+        ''' Rewrap up to **count** stale lines
+
+        :return: True if there are still stale lines
+        '''
+        stale = self._stale
+        i = stale.find(1)
+        while i >= 0 and count > 0:
+            if (j := stale.find(0, i, i+count)) < 0:
+                j = min(len(stale), i+count)
+            self._rewrapRange(i, j)
+            count -= j-i
+            i = stale.find(1, j)
+        return i >= 0
+
+    @pyTTkSlot()
+    def _rewrapProgress(self):
+        if self._rewrapStale(TTkTextWrap._wrapChunk):
+            self._rewrapTimer.start()
+        self.wrapChanged.emit()
+
+    def rewrap(self):
+        if self._enable and not self._wrapWidth:
+            return
+        lines = self._textDocument._dataLines
+        # Keep the current slices (if still aligned to the document)
+        # until the lines are rewrapped
+        if len(self._wraps) != len(lines):
+            self._wraps = TTkTextLines(((0,len(l)+1),) for l in lines)
+        self._stale = bytearray(b'\x01')*len(lines)
+        if self._rewrapStale(TTkTextWrap._wrapChunk):
+            self._rewrapTimer.start()
+        self.wrapChanged.emit()
+
+    @pyTTkSlot(int,int,int)
+    def _documentChange(self, line, removed, added):
+        lines = self._textDocument._dataLines
+        # Fallback to the full rewrap if the reported range
+        # is not aligned with the document (i.e. multi cursor insert)
+        if len(self._wraps)-removed+added != len(lines):
+            return self.rewrap()
+        if added <= TTkTextWrap._wrapChunk:
+            self._wraps[line:line+removed] = [self._wrap(l) for l in lines[line:line+added]]
+            self._stale[line:line+removed] = bytes(added)
         else:
-            if not (w := self._wrapWidth):
-                return
-
-            def _process(i,l:TTkString):
-                fr = 0
-                to = 0
-                if not len(l): # if the line is empty append it
-                    self._lines.append((i,(0,0)))
-                    return
-                while len(l):
-                    fl = l.tab2spaces(self._tabSpaces)
-                    if fl.termWidth() <= w:
-                        self._lines.append((i,(fr,fr+len(l)+1)))
-                        l=[]
-                    else:
-                        to = max(1,l.tabCharPos(w,self._tabSpaces))
-                        if self._wordWrapMode == TTkK.WordWrap: # Find the index of the first white space
-                            s = str(l)
-                            newTo = to
-                            while newTo and ( s[newTo] != ' ' and s[newTo] != '\t' ): newTo-=1
-                            if newTo: to = newTo
-
-                        self._lines.append((i,(fr,fr+to)))
-                        l = l.substring(to)
-                        fr += to
-        for i,l in enumerate(self._textDocument._dataLines):
-            _process(i,l)
+            self._wraps[line:line+removed] = [((0,len(l)+1),) for l in lines[line:line+added]]
+            self._stale[line:line+removed] = b'\x01'*added
+            self._rewrapTimer.start()
         self.wrapChanged.emit()
 
+    def screenLines(self, y, h):
+        '''
+        Return the slices displayed in **h** screen lines starting from **y**,
+        the stale lines included are rewrapped
+
+        return:
+        [ (line, (posFrom, posTo)), ... ]
+        '''
+        wraps = self._wraps
+        y = max(0,y)
+        while (size := wraps.charCount()) > y:
+            n = min(h, size-y)
+            fr, k = wraps.lineAtChar(y)
+            to, rows = fr, -k
+            while rows < n:
+                rows += len(wraps[to])
+                to += 1
+            if self._stale.find(1, fr, to) < 0:
+                return [(dt,s) for dt in range(fr,to) for s in wraps[dt]][k:k+n]
+            self._rewrapRange(fr, to)
+        return []
+
     def dataToScreenPosition(self, line, pos):
-        for i, (dt, (fr, to)) in enumerate(self._lines):
-            if dt == line and fr <= pos <= to:
-                l = self._textDocument._dataLines[dt].substring(fr,pos).tab2spaces(self._tabSpaces)
-                return l.termWidth(), i
+        if not 0 <= line < len(self._wraps):
+            return 0,0
+        if self._stale[line]:
+            self._rewrapRange(line, line+1)
+        y = self._wraps.charsBefore(line)
+        for i, (fr, to) in enumerate(self._wraps[line]):
+            if fr <= pos <= to:
+                l = self._textDocument._dataLines[line].substring(fr,pos).tab2spaces(self._tabSpaces)
+                return l.termWidth(), y+i
         return 0,0
 
     def screenToDataPosition(self, x, y):
-        dt, (fr, to) = self._lines[y]
+        dt, k = self._wraps.lineAtChar(y)
+        fr, to = self._wraps[dt][k]
         pos = fr+self._textDocument._dataLines[dt].substring(fr,to).tabCharPos(x,self._tabSpaces)
         return dt, pos
 
@@ -131,7 +230,8 @@ class TTkTextWrap():
         x,y = widget relative position aligned to the close editable char
         '''
         y = max(0,min(y,self.size()-1))
-        dt, (fr, to) = self._lines[y]
+        dt, k = self._wraps.lineAtChar(y)
+        fr, to = self._wraps[dt][k]
         x = max(0,x)
         s = self._textDocument._dataLines[dt].substring(fr,to)
         x = s.tabCharPos(x, self._tabSpaces)
@@ -26,6 +26,8 @@
 
 __all__ = ['TTkLayoutItem', 'TTkLayout']
 
+from heapq import merge
+
 from TermTk.TTkCore.constant import TTkK
 
 class TTkLayoutItem:
@@ -152,6 +154,8 @@ class TTkLayoutItem:
 
     def layoutItemType(self): return self._layoutItemType
 
+    def _invalidateHitIndex(self): pass
+
 class TTkLayout(TTkLayoutItem):
     '''
     | The :class:`TTkLayout` class is the base class of geometry managers. <br/>
@@ -171,11 +175,19 @@ class TTkLayout(TTkLayoutItem):
         ║                            ║
         ╚════════════════════════════╝
     '''
-    __slots__ = ('_items', '_zSortedItems')
+    __slots__ = ('_items', '_zSortedItems', '_hitIndex')
+
+    # Hit-test index, the items are stored in buckets of 8x4 cells
+    # only if the layout has more than "_hitMinItems" items,
+    # an item covering more than "_hitMaxBuckets" buckets is checked for any position
+    _hitMinItems = 16
+    _hitMaxBuckets = 64
+
     def __init__(self, *args, **kwargs):
         TTkLayoutItem.__init__(self, *args, **kwargs)
         self._items = []
         self._zSortedItems = []
+        self._hitIndex = None
         self._layoutItemType = TTkK.LayoutItem
 
     def children(self):
@@ -220,6 +232,57 @@ class TTkLayout(TTkLayoutItem):
 
     def _zSortItems(self):
         self._zSortedItems = sorted(self._items, key=lambda item: item._z)
+        self._hitIndex = None
+
+    def _invalidateHitIndex(self):
+        self._hitIndex = None
+
+    def _buildHitIndex(self):
+        buckets = {}
+        large = []
+        maxBuckets = TTkLayout._hitMaxBuckets
+        for rank,item in enumerate(reversed(self._zSortedItems)):
+            if item._layoutItemType == TTkK.WidgetItem:
+                if item.isEmpty(): continue
+                x,y,w,h = item._widget.geometry()
+            elif item._layoutItemType == TTkK.LayoutItem:
+                # Area checked by the sub layout (geometry + offset)
+                x,y,w,h = item.geometry()
+                ox,oy = item.offset()
+                x,y,w,h = x+ox, y+oy, w-ox, h-oy
+            else:
+                continue
+            if w <= 0 or h <= 0: continue
+            bx0, by0, bx1, by1 = x>>3, y>>2, (x+w-1)>>3, (y+h-1)>>2
+            entry = (rank, item)
+            if (bx1-bx0+1)*(by1-by0+1) > maxBuckets:
+                large.append(entry)
+                continue
+            for by in range(by0, by1+1):
+                for bx in range(bx0, bx1+1):
+                    if (bucket := buckets.get((bx,by))) is None:
+                        buckets[(bx,by)] = [entry]
+                    else:
+                        bucket.append(entry)
+        self._hitIndex = (buckets, large)
+
+    def _itemsAt(self, x, y):
+        ''' Return the items that may include the position (relative to the layout area),
+        the top most first.
+
+        The caller must check the geometry and the visibility of the items returned,
+        the hit-test index is rebuilt lazily after any change of the items,
+        of their geometry or of their z order.
+        '''
+        if len(self._items) <= TTkLayout._hitMinItems:
+            return reversed(self._zSortedItems)
+        if self._hitIndex is None:
+            self._buildHitIndex()
+        buckets, large = self._hitIndex
+        bucket = buckets.get((x>>3, y>>2), ())
+        if large:
+            return [item for _,item in merge(bucket, large)]
+        return [item for _,item in bucket]
 
     @property
     def zSortedItems(self): return self._zSortedItems
@@ -291,13 +354,21 @@ class TTkLayout(TTkLayoutItem):
 
     def removeItems(self, items):
         '''removeItems'''
+        parent = self.parentWidget()
         for item in items:
             if item in self._items:
                 self._items.remove(item)
+                if parent is not None:
+                    # Release the placements of the removed widgets and damage their area
+                    widgets = [item.widget()] if item._layoutItemType == TTkK.WidgetItem else item.iterWidgets(onlyVisible=False)
+                    for widget in widgets:
+                        parent._removePlacement(widget)
                 if item._layoutItemType == TTkK.WidgetItem:
                     item.widget().setParent(None)
                 item.setParent(None)
         self._zSortItems()
+        if parent is not None:
+            parent.update(repaint=False)
 
     def removeWidget(self, widget):
         ''' Remove a widget from this Layout
@@ -347,11 +418,19 @@ class TTkLayout(TTkLayoutItem):
             item.lowerWidget(widget)
         self._zSortItems()
 
+    def setOffset(self, x, y):
+        '''setOffset'''
+        TTkLayoutItem.setOffset(self, x, y)
+        if self._parent is not None:
+            self._parent._invalidateHitIndex()
+
     def setGeometry(self, x, y, w, h):
         '''setGeometry'''
         ax, ay, aw, ah = self.geometry()
         if ax==x and ay==y and aw==w and ah==h: return
         TTkLayoutItem.setGeometry(self, x, y, w, h)
+        if self._parent is not None:
+            self._parent._invalidateHitIndex()
         self.update(repaint=True, updateLayout=True)
 
     def fullWidgetAreaGeometry(self):
@@ -25,6 +25,7 @@ __all__ = ['TTkLogViewer']
 import os
 from TermTk.TTkCore.constant import TTkK
 from TermTk.TTkCore.log import TTkLog
+from TermTk.TTkCore.logring import TTkLogRing
 from TermTk.TTkCore.color import TTkColor
 from TermTk.TTkCore.string import TTkString
 from TermTk.TTkCore.signal import pyTTkSlot
@@ -32,13 +33,29 @@ from TermTk.TTkAbstract.abstractscrollarea import TTkAbstractScrollArea
 from TermTk.TTkAbstract.abstractscrollview import TTkAbstractScrollView
 
 class _TTkLogViewer(TTkAbstractScrollView):
-    __slots__ = ('_messages', '_cwd', '_follow')
+    __slots__ = ('_ring', '_start', '_count', '_lines', '_maxWidth', '_cwd', '_follow')
+    _logTypes = {
+        TTkLog.InfoMsg:     TTkString("INFO "   ,TTkColor.fg("#00ff00")),
+        TTkLog.DebugMsg:    TTkString("DEBUG"   ,TTkColor.fg("#00ffff")),
+        TTkLog.ErrorMsg:    TTkString("ERROR"   ,TTkColor.fg("#ff0000")),
+        TTkLog.FatalMsg:    TTkString("FATAL"   ,TTkColor.fg("#ff0000")),
+        TTkLog.WarningMsg:  TTkString("WARNING ",TTkColor.fg("#ff0000")),
+        TTkLog.CriticalMsg: TTkString("CRITICAL",TTkColor.fg("#ff0000"))}
+
     def __init__(self, *args, **kwargs):
         TTkAbstractScrollView.__init__(self, *args, **kwargs)
-        self._messages = [TTkString()]
+        # The messages are stored in the (bounded) ring shared by all the viewers,
+        # only the visible lines are formatted and measured
+        # (an empty ring is falsy, check None to avoid building the default one)
+        self._ring = TTkLogRing.default() if (ring := kwargs.get('ring')) is None else ring
+        # Display only the messages received after the creation of this viewer
+        self._start = self._count = self._ring.count()
+        self._lines = 0
+        self._maxWidth = 0
         self._cwd = os.getcwd()
         self._follow = kwargs.get('follow' , False )
-        TTkLog.installMessageHandler(self.loggingCallback)
+        # The burst of messages is processed once per frame
+        self._ring.messageAdded.connect(self._messageAdded, type=TTkK.QueuedConnection)
         self.viewChanged.connect(self._viewChangedHandler)
 
     @pyTTkSlot()
@@ -46,26 +63,30 @@ class _TTkLogViewer(TTkAbstractScrollView):
         self.update()
 
     def viewFullAreaSize(self) -> (int, int):
-        w = max( m.termWidth() for m in self._messages)
-        h = len(self._messages)
-        return w , h
+        # The first line is left empty
+        return self._maxWidth , self._lines+1
 
     def viewDisplayedSize(self) -> (int, int):
         return self.size()
 
-    def loggingCallback(self, mode, context, message):
-        logType = "NONE"
-        if mode == TTkLog.InfoMsg:       logType = TTkString("INFO "   ,TTkColor.fg("#00ff00"))
-        elif mode == TTkLog.DebugMsg:    logType = TTkString("DEBUG"   ,TTkColor.fg("#00ffff"))
-        elif mode == TTkLog.ErrorMsg:    logType = TTkString("ERROR"   ,TTkColor.fg("#ff0000"))
-        elif mode == TTkLog.FatalMsg:    logType = TTkString("FATAL"   ,TTkColor.fg("#ff0000"))
-        elif mode == TTkLog.WarningMsg:  logType = TTkString("WARNING ",TTkColor.fg("#ff0000"))
-        elif mode == TTkLog.CriticalMsg: logType = TTkString("CRITICAL",TTkColor.fg("#ff0000"))
-        self._messages.append(logType+TTkString(f": {context.file}:{context.line} {message}".replace(self._cwd,"_")))
+    def _formatMessage(self, record) -> TTkString:
+        mode, file, line, _, message = record
+        logType = self._logTypes.get(mode, "NONE")
+        return logType+TTkString(f": {file}:{line} {message}".replace(self._cwd,"_"))
+
+    @pyTTkSlot()
+    def _messageAdded(self):
+        # Only the new messages still available in the ring are processed
+        index, records = self._ring.tail(self._count)
+        if not records: return
+        self._count = index + len(records)
+        prevLines = self._lines
+        self._lines = min(self._lines + len(records), self._count - self._start, len(self._ring))
         offx, offy = self.getViewOffsets()
         _,h = self.size()
-        if self._follow or offy == len(self._messages)-h-1:
-            offy = len(self._messages)-h
+        # Follow the new messages if the view is at the bottom
+        if self._follow or offy >= prevLines+1-h:
+            offy = self._lines+1-h
         self.viewMoveTo(offx, offy)
         self.viewChanged.emit()
         self.update()
@@ -73,8 +94,18 @@ class _TTkLogViewer(TTkAbstractScrollView):
     def paintEvent(self, canvas):
         ox,oy = self.getViewOffsets()
         _,h = self.size()
-        for y, message in enumerate(self._messages[oy:oy+h]):
-            canvas.drawTTkString(pos=(-ox,y),text=message)
+        # Index of the first message stored, displayed below the empty line
+        base = self._count - self._lines
+        records = self._ring.records(base+max(0,oy-1), min(self._count,base+oy-1+h))
+        width = self._maxWidth
+        for y, record in enumerate(records, 1 if oy==0 else 0):
+            text = self._formatMessage(record)
+            width = max(width, text.termWidth())
+            canvas.drawTTkString(pos=(-ox,y),text=text)
+        # The width is tracked only for the lines displayed
+        if width > self._maxWidth:
+            self._maxWidth = width
+            self.viewChanged.emit()
 
 class TTkLogViewer(TTkAbstractScrollArea):
     __slots__ = ('_logView')
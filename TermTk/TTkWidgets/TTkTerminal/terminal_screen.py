@@ -168,11 +168,10 @@ class _TTkTerminalScreen(_TTkTerminalScreen_CSI, _TTkTerminalScreen_C1):
 
             # I check the size of each char in order to draw
             # it in the correct position
-            for ch in tout:
+            for ch,l in zip(tout, TTkString._charWidths(tout)):
                 if ord(ch) < 0x20:
                     # TTkLog.error(f"Unhandled ASCII: 0x{ord(ch):02x}")
                     continue
-                l = TTkString._getWidthText(ch)
                 # Scroll up if we are at the right border
                 if l+x > w:
                     x=0
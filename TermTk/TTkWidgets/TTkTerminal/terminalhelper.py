@@ -22,15 +22,15 @@
 
 import os, pty, threading
 import struct, fcntl, termios
-from select import select
 
 from TermTk.TTkCore.signal import pyTTkSignal,pyTTkSlot
 from TermTk.TTkCore.log import TTkLog
 from TermTk.TTkCore.helper import TTkHelper
+from TermTk.TTkCore.TTkTerm.input import TTkInput
 
 class TTkTerminalHelper():
     __slots__ = ('_shell', '_fd', '_inout', '_pid',
-                 '_quit_pipe', '_size', '_term',
+                 '_size', '_term',
                  #Signals
                  'terminalClosed', 'dataOut')
     def __init__(self, term=None) -> None:
@@ -40,7 +40,6 @@ class TTkTerminalHelper():
         self._fd = None
         self._inout = None
         self._pid = None
-        self._quit_pipe = None
         self._term = None
         self._size = (80,24)
         TTkHelper.quitEvent.connect(self._quit)
@@ -76,9 +75,8 @@ class TTkTerminalHelper():
             name = os.ttyname(self._fd)
             TTkLog.debug(f"{self._pid=} {self._fd=} {name}")
 
-            self._quit_pipe = os.pipe()
-
-            threading.Thread(target=self.loop).start()
+            # The pty output is served by the main loop
+            TTkInput.addReader(self._fd, self._readOut)
             threading.Thread(target=lambda pid=self._pid:os.waitpid(pid,0)).start()
 
             if self._term:
@@ -110,48 +108,34 @@ class TTkTerminalHelper():
                 # os.kill(pid,9)
             except:
                 pass
-        if self._quit_pipe:
+        if (fd := self._fd) is not None:
+            self._fd = None
+            TTkInput.removeReader(fd)
             try:
-                os.write(self._quit_pipe[1], b'quit')
+                self._inout.close()
             except:
                 pass
 
-    def loop(self):
-        while rs := select( [self._inout,self._quit_pipe[0]], [], [])[0]:
-            if self._quit_pipe[0] in rs:
-                # os.close(self._quit_pipe[0])
-                os.close(self._quit_pipe[1])
-                # os.close(self._resize_pipe[0])
-                os.close(self._fd)
-                return
-
-            if self._inout not in rs:
-                continue
-
-            # _termLog.debug(f"Select - {rs=}")
-            for r in rs:
-                if r is not self._inout:
-                    continue
-
-                try:
-                    _fl = fcntl.fcntl(self._inout, fcntl.F_GETFL)
-                    fcntl.fcntl(self._inout, fcntl.F_SETFL, _fl | os.O_NONBLOCK) # Set the input as NONBLOCK to read the full sequence
-                    out = b""
-                    while _out := self._inout.read():
-                        out += _out
-                    fcntl.fcntl(self._inout, fcntl.F_SETFL, _fl)
-                except Exception as e:
-                    TTkLog.error(f"Error: {e=}")
-                    self._quit()
-                    self.terminalClosed.emit()
-                    return
-
-                # out = out.decode('utf-8','ignore')
-                try:
-                    out = out.decode()
-                except Exception as e:
-                    TTkLog.error(f"{e=}")
-                    TTkLog.error(f"Failed to decode {out}")
-                    out = out.decode('utf-8','ignore')
-
-                self.dataOut.emit(out)
+    def _readOut(self):
+        try:
+            _fl = fcntl.fcntl(self._inout, fcntl.F_GETFL)
+            fcntl.fcntl(self._inout, fcntl.F_SETFL, _fl | os.O_NONBLOCK) # Set the input as NONBLOCK to read the full sequence
+            out = b""
+            while _out := self._inout.read():
+                out += _out
+            fcntl.fcntl(self._inout, fcntl.F_SETFL, _fl)
+        except Exception as e:
+            TTkLog.error(f"Error: {e=}")
+            self._quit()
+            self.terminalClosed.emit()
+            return
+
+        # out = out.decode('utf-8','ignore')
+        try:
+            out = out.decode()
+        except Exception as e:
+            TTkLog.error(f"{e=}")
+            TTkLog.error(f"Failed to decode {out}")
+            out = out.decode('utf-8','ignore')
+
+        self.dataOut.emit(out)
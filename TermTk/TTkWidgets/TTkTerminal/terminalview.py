@@ -195,7 +195,7 @@ class TTkTerminalView(TTkAbstractScrollView, _TTkTerminal_CSI_DEC):
             _checkSize()
 
             sout = (leftUnhandled+out).split('\033')
-            _termLog.debug(f"{leftUnhandled=} - {sout[0]=}")
+            _termLog.debug(lambda: f"{leftUnhandled=} - {sout[0]=}")
 
             # The first element is not an escaped sequence
             if sout[0]:
@@ -204,8 +204,7 @@ class TTkTerminalView(TTkAbstractScrollView, _TTkTerminal_CSI_DEC):
             escapeGenerator = (i for i in sout[1:])
             for slice in escapeGenerator:
                 leftUnhandled = ""
-                ssss = slice.replace('\033','<ESC>').replace('\n','\\n').replace('\r','\\r')
-                _termLog.debug(f"slice: '{ssss}'")
+                _termLog.debug(lambda: "slice: '%s'" % slice.replace('\033','<ESC>').replace('\n','\\n').replace('\r','\\r'))
 
                 ################################################
                 # CSI Modes
@@ -307,7 +306,7 @@ class TTkTerminalView(TTkAbstractScrollView, _TTkTerminal_CSI_DEC):
                     y  = ps = int(y) if (y:=m.group(2)) else defval[0]
                     sep = m.group(3)
                     x =       int(x) if (x:=m.group(4)) else defval[1]
-                    _termLog.debug(f"{mg[0]}{fn} = ps:{y=} {sep=} {x=} {fn=}")
+                    _termLog.debug(lambda: f"{mg[0]}{fn} = ps:{y=} {sep=} {x=} {fn=}")
                     if fn in ['n']:
                         # Handle the non screen related functions
                         _ex = self._CSI_MAP.get(
@@ -697,7 +696,7 @@ class TTkTerminalView(TTkAbstractScrollView, _TTkTerminal_CSI_DEC):
 
             self.update()
             self.setWidgetCursor(pos=self._screen_current.getCursor())
-            _termLog.debug(f"wc:{self._screen_current.getCursor()}")
+            _termLog.debug(lambda: f"wc:{self._screen_current.getCursor()}")
 
     def pasteEvent(self, txt:str):
         if self._terminal.bracketedMode:
@@ -707,7 +706,7 @@ class TTkTerminalView(TTkAbstractScrollView, _TTkTerminal_CSI_DEC):
 
     def keyEvent(self, evt):
         # _termLog.debug(f"Key: {evt.code=}")
-        _termLog.debug(f"Key: {str(evt)=}")
+        _termLog.debug(lambda: f"Key: {str(evt)=}")
         if evt.type == TTkK.SpecialKey:
             if evt.mod == TTkK.ControlModifier and evt.key == TTkK.Key_V:
                 txt = self._clipboard.text()
@@ -725,7 +724,7 @@ class TTkTerminalView(TTkAbstractScrollView, _TTkTerminal_CSI_DEC):
             #     # self.termData.emit(b'\n')
             #     # self.termData.emit(evt.code.encode())
         else: # Input char
-            _termLog.debug(f"Key: {evt.key=}")
+            _termLog.debug(lambda: f"Key: {evt.key=}")
             # self.termData.emit(evt.key.encode())
         self.termData.emit(evt.code.encode())
         return True
@@ -832,7 +831,8 @@ class TTkTerminalView(TTkAbstractScrollView, _TTkTerminal_CSI_DEC):
                 TTkK.WHEEL_Down:(k,  1,'M')}.get(
                     evt.evt,(0,0,'M'))
             # _termLog.mouse(f'Mouse: <ESC>[<{k+km};{x};{y}{pr}')
-            self.termData.emit(f'\033[<{k+km};{x};{y}{pr}'.encode())
+            # The merged wheel steps are forwarded one by one
+            self.termData.emit(f'\033[<{k+km};{x};{y}{pr}'.encode()*evt.count)
         else:
             head = {
                 TTkK.Press:     b'\033[M ',
@@ -847,7 +847,7 @@ class TTkTerminalView(TTkAbstractScrollView, _TTkTerminal_CSI_DEC):
             bah.append((x+32)%0xff)
             bah.append((y+32)%0xff)
             # _termLog.mouse(f'Mouse: '+bah.decode().replace('\033','<ESC>'))
-            self.termData.emit(bah)
+            self.termData.emit(bah*evt.count)
         return True
 
     def mousePressEvent(self, evt):
@@ -280,9 +280,10 @@ class TTkComboBox(TTkContainer):
 
     def wheelEvent(self, evt):
         if evt.evt == TTkK.WHEEL_Up:
-            self.setCurrentIndex(self._id-1)
+            if self._id > 0:
+                self.setCurrentIndex(max(0,self._id-evt.count))
         else:
-            self.setCurrentIndex(self._id+1)
+            self.setCurrentIndex(min(len(self._list)-1,self._id+evt.count))
         return True
 
     def mousePressEvent(self, evt):
@@ -63,11 +63,15 @@ class TTkContainer(TTkWidget):
     __slots__ = (
         '_padt', '_padb', '_padl', '_padr',
         '_forwardStyle',
+        '_placements', '_removedPlacements', '_background',
         '_layout')
 
     def __init__(self, *, padding=(0,0,0,0), forwardStyle=False,**kwargs):
 
         self._forwardStyle = forwardStyle
+        self._placements = None
+        self._removedPlacements = []
+        self._background = None
         padding = kwargs.get('padding', 0 )
         self._padt = kwargs.get('paddingTop',    padding )
         self._padb = kwargs.get('paddingBottom', padding )
@@ -114,6 +118,13 @@ class TTkContainer(TTkWidget):
         TTkLog.error("<TTkWidget>.removeWidget(...) is deprecated, use <TTkWidget>.layout().removeWidget(...)")
         if self.layout(): self.layout().removeWidget(widget)
 
+    def _removePlacement(self, widget):
+        ''' Drop the placement of a removed child,
+        the area it used to cover is damaged in the next composition
+        '''
+        if self._placements and (old := self._placements.pop(widget, None)):
+            self._removedPlacements.append(old)
+
     # def forwardStyleTo(self, widget:TTkWidget):
     #     widget._currentStyle |= self._currentStyle
     #     widget.update()
@@ -171,6 +182,165 @@ class TTkContainer(TTkWidget):
         ''' .. caution:: Don't touch this! '''
         TTkContainer._paintChildCanvas(self._canvas, self.rootLayout(), self.rootLayout().geometry(), self.rootLayout().offset())
 
+    @staticmethod
+    def _childPlacements(item, geometry, offset):
+        ''' Yield (widget, geometry, bound) of the children in the z order,
+        following the same path of :meth:`_paintChildCanvas`
+        '''
+        lx,ly,lw,lh = geometry
+        ox, oy = offset
+        if item.layoutItemType() == TTkK.WidgetItem and not item.isEmpty():
+            child = item.widget()
+            cx,cy,cw,ch = child.geometry()
+            yield child, (cx+ox, cy+oy, cw, ch), (lx, ly, lw, lh)
+        else:
+            for child in item.zSortedItems:
+                igx, igy, igw, igh = item.geometry()
+                iox, ioy = item.offset()
+                ix, iy = igx+ox, igy+oy
+                bx = max(ix,lx)
+                by = max(iy,ly)
+                bw = min(ix+igw,lx+lw)-bx
+                bh = min(iy+igh,ly+lh)-by
+                yield from TTkContainer._childPlacements(child, (bx,by,bw,bh), (ix+iox,iy+ioy))
+
+    @staticmethod
+    def _mergeRects(rects, bound, maxRects=8):
+        ''' Clip the rects to the bound and merge the overlapping ones,
+        if too many rects are left, their bounding box is returned
+        '''
+        bx,by,bw,bh = bound
+        ret = []
+        for x,y,w,h in rects:
+            xa,ya,xb,yb = max(x,bx), max(y,by), min(x+w,bx+bw), min(y+h,by+bh)
+            if xa>=xb or ya>=yb: continue
+            # Merge with the overlapping or touching rects until nothing changes
+            merged = True
+            while merged:
+                merged = False
+                for i,(ra,rya,rb,ryb) in enumerate(ret):
+                    if xa<=rb and ra<=xb and ya<=ryb and rya<=yb:
+                        xa,ya,xb,yb = min(xa,ra), min(ya,rya), max(xb,rb), max(yb,ryb)
+                        ret.pop(i)
+                        merged = True
+                        break
+            ret.append((xa,ya,xb,yb))
+        if len(ret) > maxRects:
+            ret = [(min(r[0] for r in ret), min(r[1] for r in ret),
+                    max(r[2] for r in ret), max(r[3] for r in ret))]
+        return [(xa,ya,xb-xa,yb-ya) for xa,ya,xb,yb in ret]
+
+    def _useBackground(self):
+        ''' The cached background layer is required only to compose the visible children,
+        without them the paintEvent is drawn straight in the canvas
+        '''
+        return ( type(self).paintChildCanvas is not TTkContainer.paintChildCanvas or
+                 any(True for _ in self.rootLayout().iterWidgets()) )
+
+    def _repaint(self):
+        ''' .. caution:: Don't touch this!
+
+        The paintEvent is drawn in a cached background layer,
+        reused to compose again the children until the widget itself is updated
+        '''
+        canvas = self._canvas
+        canvas.updateSize()
+        if not self._useBackground():
+            self._background = None
+            canvas.clean()
+            self.paintEvent(canvas)
+            return
+        bg = self._background
+        if (bg is None or type(bg) is not type(canvas) or
+            bg.size() != canvas.size() or bg._transparent != canvas._transparent):
+            bg = self._background = type(canvas)(width=canvas._width, height=canvas._height)
+            if canvas._transparent:
+                bg.setTransparent(True)
+        else:
+            bg.clean()
+        self.paintEvent(bg)
+
+    def _composeDamage(self, repainted, damages):
+        ''' .. caution:: Don't touch this!
+
+        Compose the children canvases and return the damaged area
+        of this widget canvas as a list of rects (x,y,w,h)
+
+        Only the rects changed by the children (placement or content)
+        are composed again if the widget itself has not been repainted
+
+        :param repainted: the widget canvas has been cleaned and painted in this frame
+        :param damages: the damaged rects, in their own coordinates, of the children already composed in this frame
+        '''
+        canvas = self._canvas
+        size = (0,0)+canvas.size()
+        layout = self.rootLayout()
+        prev = self._placements
+        removed = self._removedPlacements
+        self._removedPlacements = []
+        placements = list(TTkContainer._childPlacements(layout, layout.geometry(), layout.offset()))
+        self._placements = {
+            child:(i,geom,bound,child.getCanvas()._visible) for i,(child,geom,bound) in enumerate(placements)}
+
+        if not self._useBackground():
+            if self._background is not None:
+                # The last visible child is gone, paint the canvas without the cached layer
+                self._repaint()
+                return [size]
+            return [size] if repainted else []
+
+        bg = self._background
+        if bg is None or bg.size() != canvas.size():
+            self._repaint()
+            repainted = True
+            bg = self._background
+
+        if repainted or prev is None:
+            canvas.copyRect(bg, size)
+            self.paintChildCanvas()
+            return [size]
+
+        def _area(geom,bound,visible):
+            if not visible: return None
+            x,y,w,h = geom
+            bx,by,bw,bh = bound
+            xa,ya,xb,yb = max(x,bx), max(y,by), min(x+w,bx+bw), min(y+h,by+bh)
+            if xa>=xb or ya>=yb: return None
+            # Include the columns touched by the wide chars checks
+            return (xa-1,ya,xb-xa+2,yb-ya)
+
+        rects = []
+        for child,(i,geom,bound,visible) in self._placements.items():
+            old = prev.get(child)
+            if old != (i,geom,bound,visible):
+                rects += [r for r in (_area(*old[1:]) if old else None, _area(geom,bound,visible)) if r]
+            elif visible and (childDamage := damages.get(child)):
+                x,y = geom[:2]
+                bx,by,bw,bh = bound
+                for dx,dy,dw,dh in childDamage:
+                    xa,ya,xb,yb = max(x+dx,bx), max(y+dy,by), min(x+dx+dw,bx+bw), min(y+dy+dh,by+bh)
+                    if xa<xb and ya<yb:
+                        rects.append((xa-1,ya,xb-xa+2,yb-ya))
+        rects += [r for child,old in prev.items() if child not in self._placements and (r:=_area(*old[1:]))]
+        rects += [r for old in removed if (r:=_area(*old[1:]))]
+        if not (rects := TTkContainer._mergeRects(rects, size)):
+            return []
+
+        if type(self).paintChildCanvas is not TTkContainer.paintChildCanvas:
+            # The custom composition may paint anywhere on top of the children
+            canvas.copyRect(bg, size)
+            self.paintChildCanvas()
+            return [size]
+
+        # Restore the cached background
+        # and compose again only the children inside the damaged rects
+        for rect in rects:
+            canvas.copyRect(bg, rect)
+            for child,geom,bound in placements:
+                cw,ch = geom[2:]
+                canvas.paintCanvas(child.getCanvas(), geom, (0,0,cw,ch), bound, rect)
+        return rects
+
     def getPadding(self) -> (int, int, int, int):
         ''' Retrieve the widget padding sizes
 
@@ -206,21 +376,25 @@ class TTkContainer(TTkWidget):
             return False
         x-=lx
         y-=ly
-        for item in reversed(layout.zSortedItems):
-        # for item in layout.zSortedItems:
-            if item.layoutItemType() == TTkK.WidgetItem and not item.isEmpty():
-                widget = item.widget()
-                if not widget._visible: continue
-                wx,wy,ww,wh = widget.geometry()
-                # Skip the mouse event if outside this widget
-                if not (wx <= x < wx+ww and wy <= y < wy+wh): continue
-                wevt = evt.clone(pos=(x-wx, y-wy))
-                if widget.mouseEvent(wevt):
-                    return True
-            elif item.layoutItemType() == TTkK.LayoutItem:
-                levt = evt.clone(pos=(x, y))
-                if TTkContainer._mouseEventLayoutHandle(levt, item):
-                    return True
+        # The event is translated in place for each child
+        # and restored before returning to the caller
+        try:
+            for item in layout._itemsAt(x, y):
+                if item._layoutItemType == TTkK.WidgetItem and not item.isEmpty():
+                    widget = item._widget
+                    if not widget._visible: continue
+                    wx,wy,ww,wh = widget.geometry()
+                    # Skip the mouse event if outside this widget
+                    if not (wx <= x < wx+ww and wy <= y < wy+wh): continue
+                    evt.x, evt.y = x-wx, y-wy
+                    if widget.mouseEvent(evt):
+                        return True
+                elif item._layoutItemType == TTkK.LayoutItem:
+                    evt.x, evt.y = x, y
+                    if TTkContainer._mouseEventLayoutHandle(evt, item):
+                        return True
+        finally:
+            evt.x, evt.y = x+lx, y+ly
         return False
 
     _mouseOver = None
@@ -393,6 +567,8 @@ class TTkContainer(TTkWidget):
         if not self._visible: return
         self._visible = False
         self._canvas.hide()
+        # Release the cached layer, it is painted again when shown
+        self._background = None
         self.update(repaint=False, updateParent=True)
 
     def update(self, repaint: bool =True, updateLayout: bool =False, updateParent: bool =False):
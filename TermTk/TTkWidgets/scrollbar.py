@@ -126,9 +126,9 @@ class TTkScrollBar(TTkWidget):
 
     def wheelEvent(self, evt):
         if evt.evt == TTkK.WHEEL_Up:
-            value = self._value-self._pageStep
+            value = self._value-self._pageStep*evt.count
         else:
-            value = self._value+self._pageStep
+            value = self._value+self._pageStep*evt.count
         self.setValue(max(self._minimum,min(self._maximum,value)))
         self.sliderMoved.emit(self._value)
         return True
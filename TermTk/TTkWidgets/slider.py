@@ -50,11 +50,11 @@ class TTkSlider(TTkScrollBar):
 
     def wheelEvent(self, evt):
         if self._orientation == TTkK.VERTICAL:
-            if evt.evt == TTkK.WHEEL_Up: value = self._value+self._pageStep
-            else:                        value = self._value-self._pageStep
+            if evt.evt == TTkK.WHEEL_Up: value = self._value+self._pageStep*evt.count
+            else:                        value = self._value-self._pageStep*evt.count
         else:
-            if evt.evt == TTkK.WHEEL_Up: value = self._value-self._pageStep
-            else:                        value = self._value+self._pageStep
+            if evt.evt == TTkK.WHEEL_Up: value = self._value-self._pageStep*evt.count
+            else:                        value = self._value+self._pageStep*evt.count
         self.setValue(max(self._minimum,min(self._maximum,value)))
         self.sliderMoved.emit(self._value)
         return True
@@ -107,9 +107,9 @@ class TTkSpinBox(TTkContainer):
 
     def wheelEvent(self, evt):
         if evt.evt == TTkK.WHEEL_Up:
-            self.setValue(self._value+1)
+            self.setValue(self._value+evt.count)
         else:
-            self.setValue(self._value-1)
+            self.setValue(self._value-evt.count)
         return True
 
     def keyEvent(self, evt):
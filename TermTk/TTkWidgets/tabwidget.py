@@ -494,10 +494,11 @@ class TTkTabBar(TTkContainer):
         self._updateTabs()
 
     def wheelEvent(self, evt):
-        if evt.evt == TTkK.WHEEL_Up:
-            self._moveToTheLeft()
-        else:
-            self._andMoveToTheRight()
+        for _ in range(evt.count):
+            if evt.evt == TTkK.WHEEL_Up:
+                self._moveToTheLeft()
+            else:
+                self._andMoveToTheRight()
         return True
 
     def keyEvent(self, evt):
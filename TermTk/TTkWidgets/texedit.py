@@ -59,7 +59,7 @@ class _TTkTextEditViewLineNumber(TTkAbstractScrollView):
         self.setMaximumWidth(2)
 
     def _wrapChanged(self):
-        dt = max(1,self._textWrap._lines[-1][0])
+        dt = max(1,self._textWrap._textDocument.lineCount()-1)
         off  = self._startingNumber
         width = 1+max(len(str(int(dt+off))),len(str(int(off))))
         self.setMaximumWidth(width)
@@ -91,7 +91,7 @@ class _TTkTextEditViewLineNumber(TTkAbstractScrollView):
         separatorColor = style['separatorColor']
 
         if self._textWrap:
-            for i, (dt, (fr, _)) in enumerate(self._textWrap._lines[oy:oy+h]):
+            for i, (dt, (fr, _)) in enumerate(self._textWrap.screenLines(oy,h)):
                 if fr:
                     canvas.drawText(pos=(0,i), text='<', width=w, color=wrapColor)
                 else:
@@ -137,7 +137,8 @@ class TTkTextEditView(TTkAbstractScrollView):
     '''
         in order to support the line wrap, I need to divide the full data text in;
         _textDocument = the entire text divided in lines, easy to add/remove/append lines
-        _textWrap._lines     = an array of tuples for each displayed line with a pointer to a
+        _textWrap            = for each line of the document the slices to be shown in each displayed line,
+                     screenLines(y,h) return the tuples for the displayed lines with a pointer to a
                      specific line and its slice to be shown at this coordinate;
                      [ (line, (posFrom, posTo)), ... ]
                      This is required to support the wrap feature
@@ -229,7 +230,8 @@ class TTkTextEditView(TTkAbstractScrollView):
             self._textDocument.cursorPositionChanged.disconnect(self._cursorPositionChanged)
             self._textDocument.undoAvailable.disconnect(self._undoAvailable)
             self._textDocument.redoAvailable.disconnect(self._redoAvailable)
-            self._textWrap.wrapChanged.disconnect(self.update)
+            self._textDocument.contentsChange.disconnect(self._textWrap._documentChange)
+            self._textWrap.wrapChanged.disconnect(self._wrapChanged)
         if not document:
             document = TTkTextDocument()
         self._textDocument = document
@@ -240,7 +242,7 @@ class TTkTextEditView(TTkAbstractScrollView):
         self._textDocument.undoAvailable.connect(self._undoAvailable)
         self._textDocument.redoAvailable.connect(self._redoAvailable)
         # Trigger an update when the rewrap happen
-        self._textWrap.wrapChanged.connect(self.update)
+        self._textWrap.wrapChanged.connect(self._wrapChanged)
 
     # forward textWrap Methods
     def wrapWidth(self, *args, **kwargs):       return self._textWrap.wrapWidth(*args, **kwargs)
@@ -323,9 +325,15 @@ class TTkTextEditView(TTkAbstractScrollView):
 
     @pyTTkSlot()
     def _documentChanged(self):
-        self._rewrap()
+        # The changed lines are already rewrapped (contentsChange)
+        self.update()
         self.textChanged.emit()
 
+    @pyTTkSlot()
+    def _wrapChanged(self):
+        self.viewChanged.emit()
+        self.update()
+
     def _rewrap(self):
         self._textWrap.rewrap()
         self.viewChanged.emit()
@@ -605,7 +613,7 @@ class TTkTextEditView(TTkAbstractScrollView):
         lineColor = style['lineColor']
 
         h = self.height()
-        subLines = self._textWrap._lines[oy:oy+h]
+        subLines = self._textWrap.screenLines(oy,h)
         if not subLines: return
         outLines = self._textCursor.getHighlightedLines(subLines[0][0], subLines[-1][0], selectColor)
 
@@ -29,6 +29,7 @@ from TermTk.TTkCore.helper    import TTkHelper
 from TermTk.TTkCore.color     import TTkColor
 from TermTk.TTkCore.string    import TTkString
 from TermTk.TTkCore.canvas    import TTkCanvas
+from TermTk.TTkCore.canvas_packed import TTkCanvasPacked
 from TermTk.TTkCore.signal    import pyTTkSignal, pyTTkSlot
 from TermTk.TTkTemplates.dragevents import TDragEvents
 from TermTk.TTkTemplates.mouseevents import TMouseEvents
@@ -152,7 +153,8 @@ class TTkWidget(TMouseEvents,TKeyEvents, TDragEvents):
         self.setStyle(self.classStyle)
         self._processStyleEvent(TTkWidget._S_DEFAULT)
 
-        self._canvas = TTkCanvas(
+        canvasClass = TTkCanvasPacked if TTkCfg.packedCanvas else TTkCanvas
+        self._canvas = canvasClass(
                             width  = self._width  ,
                             height = self._height )
 
@@ -208,6 +210,19 @@ class TTkWidget(TMouseEvents,TKeyEvents, TDragEvents):
     def paintChildCanvas(self):
         pass
 
+    def _repaint(self):
+        ''' .. caution:: Don't touch this! '''
+        # Resize the canvas just before the paintEvent
+        # to avoid too many allocations
+        canvas = self._canvas
+        canvas.updateSize()
+        canvas.clean()
+        self.paintEvent(canvas)
+
+    def _composeDamage(self, repainted, damages):
+        ''' .. caution:: Don't touch this! '''
+        return [(0,0)+self._canvas.size()] if repainted else []
+
     def moveEvent(self, x: int, y: int):
         ''' Event Callback triggered after a successful move'''
         pass
@@ -233,6 +248,8 @@ class TTkWidget(TMouseEvents,TKeyEvents, TDragEvents):
         if x==self._x and y==self._y: return
         self._x = x
         self._y = y
+        if layout := self._widgetItem._parent:
+            layout._invalidateHitIndex()
         self.update(repaint=False, updateLayout=False)
         self.moveEvent(x,y)
 
@@ -246,6 +263,8 @@ class TTkWidget(TMouseEvents,TKeyEvents, TDragEvents):
         if w!=self._width or h!=self._height:
             self._width  = w
             self._height = h
+            if layout := self._widgetItem._parent:
+                layout._invalidateHitIndex()
             self._canvas.resize(self._width, self._height)
             self.update(repaint=True, updateLayout=True)
         self.resizeEvent(w,h)
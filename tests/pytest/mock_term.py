@@ -63,6 +63,15 @@ class Mock_TTkTerm():
         @staticmethod
         def hide(): pass
 
+    class Caps():
+        RELMOVE = 0x0001
+        REP     = 0x0002
+        ECH     = 0x0004
+        EL      = 0x0008
+        BCE     = 0x0010
+
+    capabilities = Caps.RELMOVE | Caps.ECH | Caps.EL
+
     class Sigmask():
         CTRL_C = 0x0001
         CTRL_S = 0x0002
@@ -74,6 +83,11 @@ class Mock_TTkTerm():
         sys.stdout.write(str(*args))
         sys.stdout.flush()
 
+    @staticmethod
+    def frameBegin(): pass
+    @staticmethod
+    def frameEnd(): pass
+
     @staticmethod
     def registerResizeCb(_): pass
     @staticmethod
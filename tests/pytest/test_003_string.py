@@ -65,3 +65,85 @@ def test_stringAlign1():
     assert '  Yes⌛⌛⌛  '== str(test1.align(width=13, alignment=TermTk.TTkK.CENTER_ALIGN))
     # width=14: |  Yes⌛⌛⌛   |
     assert '  Yes⌛⌛⌛   '==str(test1.align(width=14, alignment=TermTk.TTkK.CENTER_ALIGN))
+
+def test_stringColorSpans():
+    r = TermTk.TTkColor.RST
+    b = TermTk.TTkColor.BOLD
+    f = TermTk.TTkColor.fg('#FF0000')
+    test1 = TermTk.TTkString('abcdef') + f + 'ghi' + b + 'jkl'
+
+    assert test1.getData()[1] == [r]*6 + [f]*3 + [b]*3
+    assert len(test1._spans) == 3
+    # The long uniform strings are stored in a single span
+    assert len(TermTk.TTkString('x'*10000, f)._spans) == 1
+
+    sub = test1.substring(4,10)
+    assert str(sub) == 'efghij'
+    assert sub.getData()[1] == [r]*2 + [f]*3 + [b]
+
+    col = test1.setColor(f, posFrom=2, posTo=7)
+    assert col.getData()[1] == [r]*2 + [f]*7 + [b]*3
+    assert len(col._spans) == 3
+    col = test1.setColor(b, match='k')
+    assert col.getData()[1] == [r]*6 + [f]*3 + [b]*3
+    assert len(col._spans) == 3
+
+    bg = TermTk.TTkColor.bg('#000044')
+    cmp = test1.completeColor(bg, posFrom=5, posTo=8)
+    assert cmp.getData()[1] == [r]*5 + [r|bg] + [f|bg]*2 + [f] + [b]*3
+
+    test2 = test1 + test1.setColor(b)
+    assert test2.getData()[1] == [r]*6 + [f]*3 + [b]*15
+    assert len(test2._spans) == 3
+
+    tab = (TermTk.TTkString('a\tb', f) + b + '\tc').tab2spaces(4)
+    assert str(tab) == 'a   b   c'
+    assert tab.getData()[1] == [f]*5 + [b]*4
+    assert tab.colorAt(4) == f and tab.colorAt(5) == b
+
+    test1.setColorAt(0, b)
+    assert test1.colorAt(0) == b and test1.colorAt(1) == r
+    assert test1.sameAs(TermTk.TTkString() + b + 'a' + TermTk.TTkColor.RST + 'bcdef' + f + 'ghi' + b + 'jkl')
+
+def test_stringWidths():
+    text = 'a\u65e5\u672ce\u0301\U0001F600z' # 'a日本é😀z'
+    assert list(TermTk.TTkString.widths(text)) == [0,1,3,5,6,6,8,9]
+    assert TermTk.TTkString.widths(text) is TermTk.TTkString.widths(text)
+
+    test1 = TermTk.TTkString(text)
+    assert test1.termWidth() == 9
+    assert test1.getData()[0] == ['a','\u65e5','','\u672c','','e\u0301','\U0001F600','','z']
+    assert test1.nextPos(3) == 5
+    assert test1.prevPos(5) == 3
+    assert test1.tabCharPos(2) == 1
+    assert test1.tabCharPos(5) == 3
+    assert test1.tabCharPos(6) == 5
+    assert str(test1.align(width=2)) == 'a\u227d'
+    assert str(test1.align(width=5)) == 'a\u65e5\u672c'
+    assert str(test1.align(width=6)) == 'a\u65e5\u672ce'
+
+    # The wide combining marks are zero sized
+    test2 = TermTk.TTkString('\u304b\u3099') # 'か' + combining voiced mark
+    assert test2.termWidth() == 2
+    assert test2.getData()[0] == ['\u304b\u3099','']
+
+def test_stringAnsi():
+    r = TermTk.TTkColor.RST
+    test1 = TermTk.TTkString('abc\033[1mdef\033[31mghi\033[0mjkl\033[1m')
+    assert str(test1) == 'abcdefghijkl'
+    colors = test1.getData()[1]
+    assert colors[0:3] == [r]*3
+    assert colors[3:6] == [TermTk.TTkColor.BOLD]*3
+    assert colors[6:9] == [TermTk.TTkColor.BOLD+TermTk.TTkColor.ansi('\033[31m')]*3
+    assert colors[9:]  == [r]*3
+    # Consecutive escapes and the trailing one don't produce empty spans
+    assert len(test1._spans) == 4
+
+    # The plain strings are not parsed
+    test2 = TermTk.TTkString('plain', TermTk.TTkColor.BOLD)
+    assert test2._spans == ((0,TermTk.TTkColor.BOLD),)
+    # An unterminated escape is kept as text
+    assert str(TermTk.TTkString('abc\033[1')) == 'abc\033[1'
+
+    test3 = TermTk.TTkString() + 'x\033[1my'
+    assert test3.toAnsi() == TermTk.TTkString('x\033[1my').toAnsi()
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+# MIT License
+#
+# Copyright (c) 2024 Eugenio Parodi <ceccopierangiolieugenio AT googlemail DOT com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import sys, os
+
+sys.path.append(os.path.join(sys.path[0],'../..'))
+
+import TermTk
+from TermTk.TTkCore.color import _TTkColorTable
+
+def test_colorInterning():
+    c1 = TermTk.TTkColor.fg('#FF0000') + TermTk.TTkColor.bg('#0000FF')
+    c2 = TermTk.TTkColor.fg('#FF0000') + TermTk.TTkColor.bg('#0000FF')
+    c3 = TermTk.TTkColor.fg('#FF0000') + TermTk.TTkColor.bg('#00FF00')
+
+    # The composition return the same instance for the same color
+    assert c1 is c2
+    assert c1 == c2
+    assert c1 != c3
+    assert hash(c1) == hash(TermTk.TTkColor.fg('#FF0000', link='') + TermTk.TTkColor.bg('#0000FF'))
+
+    # Colors created directly are not shared but compare equal
+    c4 = TermTk.TTkColor(fg=(255,0,0), bg=(0,0,255))
+    assert c4 is not c1
+    assert c4 == c1
+    assert len({c1,c2,c3,c4}) == 2
+
+def test_colorInterningGenerations():
+    c1 = TermTk.TTkColor(fg=(1,2,3))
+    c2 = TermTk.TTkColor(fg=(1,2,3))
+    c3 = TermTk.TTkColor(fg=(3,2,1))
+    assert c1 == c2
+    # A new generation, the old ids fallback to the fields comparison
+    _TTkColorTable.clear()
+    c4 = TermTk.TTkColor(fg=(1,2,3))
+    assert c4 == c1
+    assert c4 != c3
+    assert c2 == c1
+
+def test_colorSub():
+    c1 = TermTk.TTkColor.fg('#FF0000')
+    c2 = TermTk.TTkColor.fg('#FF0000') + TermTk.TTkColor.BOLD
+    assert str(c1 - c2) == str(c1 - c2)
+    assert (c1 - c2) is (c1 - c2)
+    assert (c2 - c2) is c2
+
+def test_colorDiff2Str():
+    red   = TermTk.TTkColor.fg('#FF0000')
+    redBg = TermTk.TTkColor.fg('#FF0000') + TermTk.TTkColor.bg('#0000FF')
+    bold  = TermTk.TTkColor.fg('#FF0000') + TermTk.TTkColor.BOLD
+    rst   = TermTk.TTkColor.RST
+
+    # Only the changed attributes are emitted
+    assert '\033[48;2;0;0;255m'   == redBg.canvasDiff2Str(red)
+    assert '\033[49m'             == red.canvasDiff2Str(redBg)
+    assert '\033[1m'              == bold.canvasDiff2Str(red)
+    assert '\033[22m'             == red.canvasDiff2Str(bold)
+    assert '\033[38;2;255;0;0m'   == red.canvasDiff2Str(rst)
+    # The full reset is shorter
+    assert '\033[0m'              == rst.canvasDiff2Str(redBg)
+
+    stats = TermTk.TTkColor.diffCacheStats()
+    red.canvasDiff2Str(rst)
+    assert stats['hits']+1 == TermTk.TTkColor.diffCacheStats()['hits']
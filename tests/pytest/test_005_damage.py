@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+# MIT License
+#
+# Copyright (c) 2024 Eugenio Parodi <ceccopierangiolieugenio AT googlemail DOT com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import sys, os
+
+sys.path.append(os.path.join(sys.path[0],'../..'))
+
+import TermTk as ttk
+
+def _fullCompose(widget):
+    w,h = widget.size()
+    canvas = ttk.TTkCanvas(width=w, height=h)
+    widget.paintEvent(canvas)
+    ttk.TTkContainer._paintChildCanvas(canvas, widget.rootLayout(), widget.rootLayout().geometry(), widget.rootLayout().offset())
+    return canvas.toAnsi()
+
+def _scene():
+    root = ttk.TTkContainer(size=(60,20))
+    win1 = ttk.TTkWindow(parent=root, pos=( 2,1), size=(30,10), title="Win 1")
+    win2 = ttk.TTkWindow(parent=root, pos=(20,5), size=(30,10), title="Win 2 日本")
+    label = ttk.TTkLabel(parent=win2, pos=(0,0), size=(20,1), text="Label 表示")
+    for w in (root, win1, win2, label):
+        w._repaint()
+    for w in (label, win2, win1, root):
+        w._composeDamage(True, {})
+    return root, win1, win2, label
+
+def test_mergeRects():
+    merge = ttk.TTkContainer._mergeRects
+    assert merge([], (0,0,10,10)) == []
+    assert merge([(-5,-5,7,7)], (0,0,10,10)) == [(0,0,2,2)]
+    assert merge([(20,20,5,5)], (0,0,10,10)) == []
+    assert merge([(0,0,2,2),(1,1,2,2)], (0,0,10,10)) == [(0,0,3,3)]
+    assert sorted(merge([(0,0,1,1),(5,5,1,1)], (0,0,10,10))) == [(0,0,1,1),(5,5,1,1)]
+    assert merge([(i*2,0,1,1) for i in range(5)], (0,0,10,10), maxRects=4) == [(0,0,9,1)]
+
+def test_damage_nothing():
+    root, win1, win2, label = _scene()
+    assert root._composeDamage(False, {}) == []
+
+def test_damage_move():
+    root, win1, win2, label = _scene()
+    win1.move(10,8)
+    damage = root._composeDamage(False, {})
+    assert damage
+    assert all(x>=0 and y>=0 and x+w<=60 and y+h<=20 for x,y,w,h in damage)
+    assert root.getCanvas().toAnsi() == _fullCompose(root)
+
+def test_damage_raise():
+    root, win1, win2, label = _scene()
+    win1.raiseWidget()
+    assert root._composeDamage(False, {})
+    assert root.getCanvas().toAnsi() == _fullCompose(root)
+
+def test_damage_child():
+    root, win1, win2, label = _scene()
+    label.setText("Other 日本")
+    label._repaint()
+    damages = {label:label._composeDamage(True, {})}
+    damages[win2] = win2._composeDamage(False, damages)
+    damage = root._composeDamage(False, damages)
+    # The damage is limited to the label area (+ the wide chars columns on each level)
+    assert len(damage) == 1
+    x,y,w,h = damage[0]
+    assert h == 1 and w <= 24
+    assert win2.getCanvas().toAnsi() == _fullCompose(win2)
+    assert root.getCanvas().toAnsi() == _fullCompose(root)
+
+def test_damage_cached_background():
+    root, win1, win2, label = _scene()
+    painted = []
+    class _Frame(ttk.TTkFrame):
+        def paintEvent(self, canvas):
+            painted.append(self)
+            super().paintEvent(canvas)
+    frame = _Frame(parent=root, pos=(5,5), size=(20,8), title="Frame")
+    child = ttk.TTkLabel(parent=frame, pos=(0,0), size=(10,1), text="Before")
+    for w in (child, frame, root):
+        w._repaint()
+        w._composeDamage(True, {})
+    painted.clear()
+    child.setText("After")
+    child._repaint()
+    frame._composeDamage(False, {child:child._composeDamage(True, {})})
+    assert painted == []
+    assert frame.getCanvas().toAnsi() == _fullCompose(frame)
+
+def test_damage_background_release():
+    root, win1, win2, label = _scene()
+    # No cached layer without visible children
+    frame = ttk.TTkFrame(parent=root, pos=(5,5), size=(20,8), title="Frame")
+    frame._repaint()
+    assert frame._composeDamage(True, {})
+    assert frame._background is None
+    assert frame.getCanvas().toAnsi() == _fullCompose(frame)
+    assert win2._background is not None
+    win2.hide()
+    assert win2._background is None
+    # The last child removed, the canvas is painted again without the cached layer
+    child = ttk.TTkLabel(parent=frame, pos=(0,0), size=(10,1), text="Child")
+    child._repaint()
+    child._composeDamage(True, {})
+    frame._repaint()
+    frame._composeDamage(True, {})
+    assert frame._background is not None
+    frame.layout().removeWidget(child)
+    assert frame._composeDamage(False, {}) == [(0,0,20,8)]
+    assert frame._background is None
+    assert frame.getCanvas().toAnsi() == _fullCompose(frame)
+
+def test_damage_remove():
+    root, win1, win2, label = _scene()
+    root.layout().removeWidget(win2)
+    # The removed child is no longer referenced by the placements
+    assert win2 not in root._placements
+    assert root._composeDamage(False, {})
+    assert win2 not in root._placements
+    assert root.getCanvas().toAnsi() == _fullCompose(root)
+
+def test_damage_hide():
+    root, win1, win2, label = _scene()
+    win2.hide()
+    assert root._composeDamage(False, {})
+    assert root.getCanvas().toAnsi() == _fullCompose(root)
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+# MIT License
+#
+# Copyright (c) 2024 Eugenio Parodi <ceccopierangiolieugenio AT googlemail DOT com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import sys, os, time
+
+sys.path.append(os.path.join(sys.path[0],'../..'))
+
+import TermTk as ttk
+
+def _timers(n):
+    # Drop the timers started by the other tests
+    ttk.TTkTimer._heap.clear()
+    fired = []
+    timers = []
+    for i in range(n):
+        t = ttk.TTkTimer()
+        t.timeout.connect(lambda i=i: fired.append(i))
+        timers.append(t)
+    return timers, fired
+
+def test_timer_order():
+    timers, fired = _timers(3)
+    timers[0].start(0.03)
+    timers[1].start(0.01)
+    timers[2].start(0.02)
+    assert all(t.isActive() for t in timers)
+    assert 0 < ttk.TTkTimer.nextTimeout() <= 0.01
+    time.sleep(0.04)
+    ttk.TTkTimer.processTimers()
+    assert fired == [1,2,0]
+    assert not any(t.isActive() for t in timers)
+    assert ttk.TTkTimer.nextTimeout() is None
+
+def test_timer_stop_restart():
+    timers, fired = _timers(2)
+    timers[0].start(0.01)
+    timers[1].start(0.01)
+    timers[0].stop()
+    # Restarted, only the last deadline is valid
+    timers[1].start(0)
+    timers[1].start(10)
+    time.sleep(0.02)
+    ttk.TTkTimer.processTimers()
+    assert fired == []
+    assert 9 < ttk.TTkTimer.nextTimeout() <= 10
+    timers[1].stop()
+    assert ttk.TTkTimer.nextTimeout() is None
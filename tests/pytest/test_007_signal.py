@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+# MIT License
+#
+# Copyright (c) 2024 Eugenio Parodi <ceccopierangiolieugenio AT googlemail DOT com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import sys, os, gc, threading
+from dataclasses import dataclass, field
+
+sys.path.append(os.path.join(sys.path[0],'../..'))
+
+import TermTk as ttk
+
+class _Receiver():
+    def __init__(self):
+        self.values = []
+    def slot(self, a, b):
+        self.values.append((a,b))
+    def slot1(self, a):
+        self.values.append(a)
+
+def test_signal_args():
+    s = ttk.pyTTkSignal(int,int)
+    values = []
+    s.connect(lambda a: values.append(a))
+    s.connect(lambda a,b: values.append((a,b)))
+    s.emit(1,2)
+    assert values == [1,(1,2)]
+    try:
+        s.emit(1)
+        assert False
+    except TypeError:
+        pass
+
+def test_signal_recursion():
+    s = ttk.pyTTkSignal(int)
+    values = []
+    def _slot(v):
+        values.append(v)
+        s.emit(v+1)
+    s.connect(_slot)
+    s.emit(0)
+    assert values == [0]
+
+def test_signal_exception():
+    s = ttk.pyTTkSignal()
+    def _raise():
+        raise ValueError()
+    s.connect(_raise)
+    try:
+        s.emit()
+    except ValueError:
+        pass
+    s.disconnect(_raise)
+    values = []
+    s.connect(lambda: values.append(1))
+    s.emit()
+    assert values == [1]
+
+def test_signal_weak_receiver():
+    s = ttk.pyTTkSignal(int,int)
+    r1, r2 = _Receiver(), _Receiver()
+    s.connect(r1.slot)
+    s.connect(r2.slot1)
+    s.emit(1,2)
+    assert r1.values == [(1,2)]
+    assert r2.values == [1]
+    # The connection does not keep the receiver alive
+    del r1
+    gc.collect()
+    assert len(s._connected_slots) == 1
+    s.emit(3,4)
+    assert r2.values == [1,3]
+    s.disconnect(r2.slot1)
+    assert not s._connected_slots
+    s.emit(5,6)
+    assert r2.values == [1,3]
+
+def test_signal_unhashable_receiver():
+    @dataclass
+    class _Data():
+        values: list = field(default_factory=list)
+        def slot(self, a, b):
+            self.values.append((a,b))
+    s = ttk.pyTTkSignal(int,int)
+    d1, d2 = _Data(), _Data()
+    # Equal but different receivers
+    s.connect(d1.slot)
+    s.connect(d2.slot)
+    s.connect(d1.slot)
+    s.emit(1,2)
+    assert d1.values == [(1,2)]
+    assert d2.values == [(1,2)]
+    s.disconnect(d1.slot)
+    s.emit(3,4)
+    assert d1.values == [(1,2)]
+    assert d2.values == [(1,2),(3,4)]
+    del d2
+    gc.collect()
+    assert not s._connected_slots
+
+def test_signal_weak_widget():
+    s = ttk.pyTTkSignal(int,int)
+    w = ttk.TTkWidget()
+    s.connect(w.resize)
+    del w
+    gc.collect()
+    assert not s._connected_slots
+
+def test_signal_queued():
+    from TermTk.TTkCore.signal import _pyTTkSignal_obj
+    _pyTTkSignal_obj.processQueued()
+    wakeups = []
+    _pyTTkSignal_obj.attachQueue(lambda: wakeups.append(threading.get_ident()))
+    s = ttk.pyTTkSignal(int,int)
+    r = _Receiver()
+    values = []
+    s.connect(r.slot, type=ttk.TTkK.QueuedConnection)
+    s.connect(lambda a: values.append(a))
+    # The direct connections are not affected
+    s.emit(1,2)
+    assert values == [1]
+    assert r.values == []
+    # Coalesced, only the last emission is delivered
+    th = threading.Thread(target=lambda: [s.emit(i,i) for i in range(10)])
+    th.start()
+    th.join()
+    assert len(wakeups) == 1
+    _pyTTkSignal_obj.processQueued()
+    assert r.values == [(9,9)]
+    _pyTTkSignal_obj.processQueued()
+    assert r.values == [(9,9)]
+    # The pending emission is dropped on disconnect
+    s.emit(3,4)
+    s.disconnect(r.slot)
+    _pyTTkSignal_obj.processQueued()
+    assert r.values == [(9,9)]
+    _pyTTkSignal_obj.detachQueue()
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+# MIT License
+#
+# Copyright (c) 2024 Eugenio Parodi <ceccopierangiolieugenio AT googlemail DOT com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import sys, os
+
+sys.path.append(os.path.join(sys.path[0],'../..'))
+
+import TermTk as ttk
+
+def test_log_modes():
+    messages = []
+    def _handler(mode, context, message):
+        messages.append((mode, os.path.basename(context.file), context.function, message))
+    evaluated = []
+    def _lazy():
+        evaluated.append(1)
+        return "lazy"
+    # Drop the handlers installed by the other tests
+    handlers = ttk.TTkLog._messageHandler
+    ttk.TTkLog._messageHandler = []
+    ttk.TTkLog.installMessageHandler(_handler, ttk.TTkLog.ErrorMsg | ttk.TTkLog.WarningMsg)
+    try:
+        assert ttk.TTkLog.isEnabled(ttk.TTkLog.ErrorMsg)
+        ttk.TTkLog.debug(_lazy)
+        ttk.TTkLog.info("Info %s", 1)
+        assert not evaluated
+        ttk.TTkLog.error(_lazy)
+        ttk.TTkLog.warn("Warn %s-%d", "a", 2)
+        assert evaluated == [1]
+        assert messages == [
+            (ttk.TTkLog.ErrorMsg,   'test_008_log.py', 'test_log_modes', 'lazy'),
+            (ttk.TTkLog.WarningMsg, 'test_008_log.py', 'test_log_modes', 'Warn a-2')]
+        ttk.TTkLog.removeMessageHandler(_handler)
+        ttk.TTkLog.error(_lazy)
+        assert evaluated == [1]
+    finally:
+        ttk.TTkLog._messageHandler = handlers
+        ttk.TTkLog._updateModes()
+
+def test_log_ring(tmp_path):
+    logFile = str(tmp_path / 'ring.log')
+    ring = ttk.TTkLogRing(size=10, file=logFile, modes=ttk.TTkLog.InfoMsg)
+    try:
+        for i in range(5):
+            ttk.TTkLog.info("Message %d", i)
+        ttk.TTkLog.debug("Not Stored")
+        assert ring.count() == 5
+        assert [r[4] for r in ring.records()] == [f"Message {i}" for i in range(5)]
+        # Wait the writer
+        ring.close()
+        with open(logFile) as f:
+            lines = f.read().splitlines()
+        assert len(lines) == 5
+        assert lines[0].startswith("INFO:(MainThread")
+        assert lines[0].endswith("Message 0")
+        assert ring.dropped() == 0
+    finally:
+        ring.close()
+
+def test_log_ring_bounded():
+    ring = ttk.TTkLogRing(size=10, modes=ttk.TTkLog.InfoMsg)
+    try:
+        for i in range(100):
+            ttk.TTkLog.info("Message %d", i)
+        assert ring.count() == 100
+        assert len(ring) == 10
+        assert ring.first() == 90
+        assert [r[4] for r in ring.records(95,97)] == ["Message 95", "Message 96"]
+        index, records = ring.tail(50)
+        assert index == 90 and len(records) == 10
+        assert ring.dropped() == 90
+    finally:
+        ring.close()
+
+def test_log_viewer_lazy(monkeypatch):
+    from TermTk.TTkTestWidgets.logviewer import _TTkLogViewer
+    formatted = []
+    formatMessage = _TTkLogViewer._formatMessage
+    monkeypatch.setattr(_TTkLogViewer, '_formatMessage', lambda s,r: formatted.append(r) or formatMessage(s,r))
+    monkeypatch.setattr(ttk.TTkLogRing, '_default', None)
+    ring = ttk.TTkLogRing(size=1000, modes=ttk.TTkLog.InfoMsg)
+    try:
+        view = _TTkLogViewer(ring=ring, size=(40,5))
+        # The given ring is used, the default one is not created
+        assert ttk.TTkLogRing._default is None
+        for i in range(100):
+            ttk.TTkLog.info("Message %d", i)
+        view._messageAdded()
+        assert view.viewFullAreaSize()[1] == 101
+        # Only the displayed messages are formatted
+        assert formatted == []
+        view.paintEvent(ttk.TTkCanvas(width=40, height=5))
+        assert [r[4] for r in formatted] == [f"Message {i}" for i in range(95,100)]
+        assert view.viewFullAreaSize()[0] == max(formatMessage(view,r).termWidth() for r in formatted)
+    finally:
+        ring.close()
+
+def test_log_viewer_size(monkeypatch):
+    from TermTk.TTkTestWidgets.logviewer import _TTkLogViewer
+    monkeypatch.setattr(ttk.TTkLogRing, '_default', None)
+    ring = ttk.TTkLogRing(size=1000, modes=ttk.TTkLog.InfoMsg)
+    try:
+        view = _TTkLogViewer(ring=ring, size=(40,5))
+        for i in range(10):
+            ttk.TTkLog.info("Long message %d "*20, *range(20))
+        view._messageAdded()
+        view.paintEvent(ttk.TTkCanvas(width=40, height=5))
+        # The widest line extends the view area, not the widget geometry
+        assert view.viewFullAreaSize()[0] > 40
+        assert view.size() == (40,5)
+        assert view.viewDisplayedSize() == (40,5)
+    finally:
+        ring.close()
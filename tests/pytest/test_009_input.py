@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+# MIT License
+#
+# Copyright (c) 2024 Eugenio Parodi <ceccopierangiolieugenio AT googlemail DOT com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import sys, os, random, pickle
+
+sys.path.append(os.path.join(sys.path[0],'../..'))
+
+import TermTk as ttk
+# The input module is mocked in conftest.py
+from TermTk.TTkCore.TTkTerm.input_loop import TTkInput
+from TermTk.TTkCore.TTkTerm.inputtokenizer import TTkInputTokenizer
+from TermTk.TTkCore.TTkTerm.inputmouse import TTkMouseEvent
+
+def _run(seqs, flags=TTkInput.Coalesce.ALL):
+    events = []
+    def _input(kevt, mevt):
+        events.append(kevt if kevt else mevt)
+    TTkInput.setCoalescing(flags)
+    TTkInput.inputEvent.connect(_input)
+    try:
+        for s in seqs:
+            TTkInput._dispatch(s)
+        TTkInput._dispatch(None)
+    finally:
+        TTkInput.inputEvent.disconnect(_input)
+        TTkInput.setCoalescing()
+    return events
+
+def _move(x,y): return f"\033[<35;{x+1};{y+1}M"
+def _wheelUp(x,y): return f"\033[<64;{x+1};{y+1}M"
+def _wheelDown(x,y): return f"\033[<65;{x+1};{y+1}M"
+
+def test_coalesce_move():
+    dropped = TTkInput.droppedEvents()['move']
+    evts = _run([_move(i,2) for i in range(10)])
+    assert [(e.x,e.y,e.evt) for e in evts] == [(9,2,ttk.TTkK.Move)]
+    assert TTkInput.droppedEvents()['move'] == dropped+9
+
+    evts = _run([_move(i,2) for i in range(10)], flags=TTkInput.Coalesce.NONE)
+    assert len(evts) == 10
+
+def test_coalesce_wheel():
+    dropped = TTkInput.droppedEvents()['wheel']
+    evts = _run([_wheelUp(5,5)]*20 + [_wheelDown(5,5)]*3 + [_wheelDown(6,5)])
+    assert [(e.evt,e.count,e.x) for e in evts] == [
+        (ttk.TTkK.WHEEL_Up,20,5), (ttk.TTkK.WHEEL_Down,3,5), (ttk.TTkK.WHEEL_Down,1,6)]
+    assert TTkInput.droppedEvents()['wheel'] == dropped+21
+
+def test_coalesce_default():
+    # The wheel steps are not merged by default
+    assert TTkInput.coalescing() == TTkInput.Coalesce.MOVE | TTkInput.Coalesce.DRAG
+    evts = _run([_wheelUp(5,5)]*3 + [_move(i,2) for i in range(3)], flags=TTkInput.coalescing())
+    assert [(e.evt,e.count) for e in evts] == [(ttk.TTkK.WHEEL_Up,1)]*3 + [(ttk.TTkK.Move,1)]
+
+def test_coalesce_order():
+    # The keys and the clicks are never merged and they close the pending run
+    evts = _run([_move(1,1), _move(2,1), 'a', _move(3,1), "\033[<0;4;2M", _wheelUp(3,1), _wheelUp(3,1)])
+    assert [(e.x,e.evt,e.count) if hasattr(e,'count') else e.key for e in evts] == [
+        (2,ttk.TTkK.Move,1), 'a', (3,ttk.TTkK.Move,1), (3,ttk.TTkK.Press,1), (3,ttk.TTkK.WHEEL_Up,2)]
+
+_T = TTkInputTokenizer
+
+def test_tokenizer():
+    tk = TTkInputTokenizer()
+    assert tk.feed("ab\033[A\033OP\033x\033[1;5C") == [
+        (_T.Key,'a'), (_T.Key,'b'), (_T.Key,'\033[A'), (_T.Key,'\033OP'), (_T.Key,'\033x'), (_T.Key,'\033[1;5C')]
+    assert tk.feed("\033[<0;10;5M\033[<35;1;1m") == [
+        (_T.Mouse,(0,9,4,True,'\033[<0;10;5M')), (_T.Mouse,(35,0,0,False,'\033[<35;1;1m'))]
+    assert tk.feed("\033[I\033[O") == [(_T.FocusIn,None), (_T.FocusOut,None)]
+    # Escape alone
+    assert tk.feed("\033") == [(_T.Key,'\033')]
+    assert not tk.pending()
+
+def test_tokenizer_split():
+    tk = TTkInputTokenizer()
+    assert tk.feed("a\033[<0;1") == [(_T.Key,'a')]
+    assert tk.pending()
+    assert tk.feed("0;5M") == [(_T.Mouse,(0,9,4,True,'\033[<0;10;5M'))]
+    # Escape at the end of a read is completed by the next one or flushed
+    assert tk.feed("b\033") == [(_T.Key,'b')]
+    assert tk.feed("[B") == [(_T.Key,'\033[B')]
+    assert tk.feed("c\033") == [(_T.Key,'c')]
+    assert tk.flush() == [(_T.Key,'\033')]
+    assert not tk.pending()
+
+def test_tokenizer_paste():
+    tk = TTkInputTokenizer()
+    text = "Paste\r\033[A Test " * 1000
+    assert tk.feed("x\033[200~"+text+"\033[201~y") == [
+        (_T.Key,'x'), (_T.Paste,text.replace('\r','\n')), (_T.Key,'y')]
+    # The end marker split in all the possible positions
+    for i in range(1,6):
+        stream = "\033[200~abc\033[201~d"
+        pos = stream.index('\033[201~')+i
+        assert tk.feed(stream[:pos]) == []
+        assert tk.feed(stream[pos:]) == [(_T.Paste,'abc'), (_T.Key,'d')]
+
+def test_tokenizer_fuzz():
+    # The tokens must not depend on how the input is split across the reads
+    rnd = random.Random(1)
+    seqs = ['a', 'Z', ' ', '\r', '\t', '\x01', '\033[A', '\033[1;5D', '\033[5~', '\033OQ', '\033b',
+            '\033[<0;3;4M', '\033[<64;100;200M', '\033[<2;1;1m', '\033[I', '\033[O',
+            '\033[200~paste \033[A\r text\033[201~', '\033[200~\033[201~', 'è', '😁']
+    for _ in range(200):
+        stream = ''.join(rnd.choice(seqs) for _ in range(rnd.randint(1,40)))
+        ref = TTkInputTokenizer().feed(stream)
+        tk = TTkInputTokenizer()
+        tokens = []
+        pos = 0
+        while pos < len(stream):
+            step = rnd.randint(1,8)
+            chunk = stream[pos:pos+step]
+            # A read with an escape alone is the Escape key
+            if chunk == '\033':
+                step += 1
+                chunk = stream[pos:pos+step]
+            tokens += tk.feed(chunk)
+            pos += step
+        tokens += tk.flush()
+        assert tokens == ref, repr(stream)
+
+def test_input_paste():
+    pastes = []
+    TTkInput.pasteEvent.connect(pastes.append)
+    try:
+        evts = _run(["\033[200~Hello\r", "World\033[2", "01~", _move(1,1)])
+    finally:
+        TTkInput.pasteEvent.disconnect(pastes.append)
+    assert pastes == ["Hello\nWorld"]
+    assert [(e.x,e.evt) for e in evts] == [(1,ttk.TTkK.Move)]
+
+def test_mouse_unpickle_old():
+    # The recordings store the events pickled before the count was added
+    evt = TTkMouseEvent(3, 4, TTkMouseEvent.Wheel, TTkMouseEvent.Up, 0, 0, '\033[<64;4;5M')
+    del evt.count
+    old = pickle.dumps(evt)
+    evt = pickle.loads(old)
+    assert evt.count == 1
+    assert (evt.x, evt.y, evt.evt) == (3, 4, TTkMouseEvent.Up)
+    assert evt.clone(pos=(1,2)).count == 1
+    evt = pickle.loads(pickle.dumps(TTkMouseEvent(3, 4, TTkMouseEvent.Wheel, TTkMouseEvent.Up, 0, 0, '', 5)))
+    assert evt.count == 5
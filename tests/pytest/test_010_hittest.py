@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+# MIT License
+#
+# Copyright (c) 2024 Eugenio Parodi <ceccopierangiolieugenio AT googlemail DOT com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import sys, os, random
+
+sys.path.append(os.path.join(sys.path[0],'../..'))
+
+import TermTk as ttk
+from TermTk.TTkCore.TTkTerm.inputmouse import TTkMouseEvent
+
+def _widgetAt(x, y, layout):
+    # Reference, scan all the items
+    for item in reversed(layout.zSortedItems):
+        if item.layoutItemType() == ttk.TTkK.WidgetItem:
+            widget = item.widget()
+            if not widget.isVisible(): continue
+            wx,wy,ww,wh = widget.geometry()
+            if wx <= x < wx+ww and wy <= y < wy+wh:
+                return widget
+    return None
+
+def _check(rnd, layout, w, h):
+    for _ in range(500):
+        x,y = rnd.randint(0,w-1), rnd.randint(0,h-1)
+        assert ttk.TTkHelper.widgetAt(x, y, layout) is (_widgetAt(x, y, layout) or layout.parentWidget())
+
+def test_hittest_index():
+    rnd = random.Random(1)
+    root = ttk.TTkContainer(layout=ttk.TTkLayout(), size=(200,100))
+    root.layout().setGeometry(0,0,200,100)
+    widgets = []
+    for i in range(500):
+        widgets.append(ttk.TTkWidget(parent=root,
+                                     pos=(rnd.randint(-5,195),rnd.randint(-5,95)),
+                                     size=(rnd.randint(1,10),rnd.randint(1,4))))
+    # Big widgets covering most of the area
+    widgets.append(ttk.TTkWidget(parent=root, pos=(10,10), size=(150,60)))
+    root.layout().lowerWidget(widgets[-1])
+    assert len(root.layout().zSortedItems) > ttk.TTkLayout._hitMinItems
+    _check(rnd, root.layout(), 200, 100)
+
+    for wid in rnd.sample(widgets, 100):
+        wid.move(rnd.randint(0,190),rnd.randint(0,90))
+    for wid in rnd.sample(widgets, 100):
+        wid.resize(rnd.randint(1,20),rnd.randint(1,6))
+    for wid in rnd.sample(widgets, 50):
+        wid.raiseWidget()
+    for wid in rnd.sample(widgets, 50):
+        wid.hide()
+    root.layout().removeWidgets(rnd.sample(widgets, 50))
+    _check(rnd, root.layout(), 200, 100)
+
+def test_hittest_mouse_event():
+    # The event is delivered relative to the widget
+    # and restored once the dispatch is completed
+    class _W(ttk.TTkWidget):
+        def mousePressEvent(self, evt):
+            pos.append((self, evt.x, evt.y))
+            return True
+    pos = []
+    root = ttk.TTkContainer(layout=ttk.TTkLayout(), size=(100,100))
+    root.layout().setGeometry(0,0,100,100)
+    ws = [_W(parent=root, pos=(x*5,y*2), size=(5,2)) for x in range(20) for y in range(10)]
+    evt = TTkMouseEvent(23, 11, ttk.TTkK.LeftButton, ttk.TTkK.Press, ttk.TTkK.NoModifier, 1, '')
+    assert root.mouseEvent(evt)
+    assert pos == [(ws[4*10+5], 3, 1)]
+    assert (evt.x, evt.y) == (23, 11)
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+# MIT License
+#
+# Copyright (c) 2024 Eugenio Parodi <ceccopierangiolieugenio AT googlemail DOT com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import sys, os, random
+
+sys.path.append(os.path.join(sys.path[0],'../..'))
+
+import TermTk as ttk
+
+def _checkBalance(node):
+    # AVL invariant, return the height
+    if not hasattr(node, 'left'):
+        return 0
+    hl, hr = _checkBalance(node.left), _checkBalance(node.right)
+    assert abs(hl-hr) <= 1
+    assert node.height == 1+max(hl,hr)
+    assert node.size == node.left.size+node.right.size
+    return node.height
+
+def test_textLinesBuild():
+    for n in (0, 1, 127, 128, 129, 5*128, 5*128+1, 100000):
+        lines = ttk.TTkTextLines(str(i) for i in range(n))
+        assert list(lines) == [str(i) for i in range(n)]
+        assert lines._root.height <= 2+(max(1,n)//128).bit_length()
+        _checkBalance(lines._root)
+
+def test_textLinesList():
+    rnd = random.Random(1)
+    ref = [f'{i}' for i in range(500)]
+    lines = ttk.TTkTextLines(ref)
+    snaps = []
+    for op in range(3000):
+        n = len(ref)
+        a = rnd.randrange(8)
+        if a == 0:
+            ref.append(f'a{op}') ; lines.append(f'a{op}')
+        elif a == 1:
+            i = rnd.randrange(-n-1,n+2)
+            ref.insert(i,f'i{op}') ; lines.insert(i,f'i{op}')
+        elif a == 2 and n:
+            i = rnd.randrange(-n,n)
+            ref[i] = f's{op}' ; lines[i] = f's{op}'
+        elif a == 3:
+            i,j = rnd.randrange(n+1), rnd.randrange(n+1)
+            new = [f'p{op}']*rnd.choice([0,1,5,200])
+            ref[i:j] = new ; lines[i:j] = new
+        elif a == 4:
+            i,j = rnd.randrange(n+1), rnd.randrange(n+1)
+            del ref[i:j] ; del lines[i:j]
+        elif a == 5:
+            new = [f'e{op}']*rnd.randrange(300)
+            ref += new ; lines += new
+        elif a == 6:
+            snaps.append((ref.copy(), lines.copy()))
+        else:
+            i,j = rnd.randrange(-n,n+1), rnd.randrange(-n,n+1)
+            assert ref[i:j] == lines[i:j]
+        assert len(ref) == len(lines)
+        if op % 100 == 0:
+            _checkBalance(lines._root)
+    assert list(lines) == ref
+    assert [lines[i] for i in range(len(ref))] == ref
+    assert lines.charCount() == sum(len(l) for l in ref)
+    # The copies are not affected by the following changes
+    for r,l in snaps:
+        assert list(l) == r
+
+def test_textLinesAppend():
+    lines = ttk.TTkTextLines()
+    for i in range(100000):
+        lines.append('x'*(i%7))
+    assert len(lines) == 100000
+    assert lines[-1] == 'x'*(99999%7)
+    assert lines.charCount() == sum(i%7 for i in range(100000))
+
+def test_textDocumentUndo():
+    doc = ttk.TTkTextDocument(text='\n'.join(f'Line {i}' for i in range(1000)))
+    cursor = ttk.TTkTextCursor(document=doc)
+    assert doc.characterCount() == sum(len(f'Line {i}') for i in range(1000)) + 1000
+    cursor.setPosition(500,4)
+    cursor.insertText('\nabc\ndef')
+    doc.saveSnapshot(cursor.copy())
+    cursor.setPosition(10,0)
+    cursor.setPosition(600,2,moveMode=ttk.TTkTextCursor.KeepAnchor)
+    cursor.removeSelectedText()
+    doc.saveSnapshot(cursor.copy())
+    assert doc.lineCount() == 1002-590
+    doc.restoreSnapshotPrev()
+    assert doc.lineCount() == 1002
+    assert str(doc._dataLines[501]) == 'abc'
+    doc.restoreSnapshotPrev()
+    assert doc.toPlainText() == '\n'.join(f'Line {i}' for i in range(1000))
+    doc.restoreSnapshotNext()
+    doc.restoreSnapshotNext()
+    assert doc.lineCount() == 1002-590
+    assert str(doc._dataLines[10]) == 'ne 598'
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+# MIT License
+#
+# Copyright (c) 2024 Eugenio Parodi <ceccopierangiolieugenio AT googlemail DOT com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import sys, os, random
+
+sys.path.append(os.path.join(sys.path[0],'../..'))
+
+import TermTk as ttk
+
+def _fullWrap(doc, width, mode):
+    # Reference, wrap the whole document
+    tw = ttk.TTkTextWrap(document=doc)
+    doc.contentsChange.disconnect(tw._documentChange)
+    tw.enable()
+    tw.setWordWrapMode(mode)
+    tw.setWrapWidth(width)
+    while tw._rewrapStale(1000): pass
+    return tw.screenLines(0, tw.size())
+
+def _words(rnd):
+    return ' '.join(rnd.choice(['a','bb','日本','ccccccc','xx yy','long'*5]) for _ in range(rnd.randrange(15)))
+
+def _randomEdits(rnd, chunk):
+    ttk.TTkTextWrap._wrapChunk = chunk
+    for _ in range(10):
+        doc = ttk.TTkTextDocument(text='\n'.join(_words(rnd) for _ in range(rnd.randrange(1,60))))
+        width = rnd.randrange(5,30)
+        mode = rnd.choice([ttk.TTkK.WordWrap,ttk.TTkK.WrapAnywhere])
+        tw = ttk.TTkTextWrap(document=doc)
+        tw.enable()
+        tw.setWordWrapMode(mode)
+        tw.setWrapWidth(width)
+        cursor = ttk.TTkTextCursor(document=doc)
+        for _ in range(40):
+            def _rndPos():
+                line = rnd.randrange(doc.lineCount())
+                return line, rnd.randrange(len(doc._dataLines[line])+1)
+            op = rnd.randrange(5)
+            if op == 0:
+                cursor.setPosition(*_rndPos())
+                cursor.insertText(rnd.choice(['x','\n',_words(rnd),_words(rnd)+'\n'+_words(rnd)]))
+            elif op == 1:
+                cursor.setPosition(*_rndPos())
+                cursor.setPosition(*_rndPos(), moveMode=ttk.TTkTextCursor.KeepAnchor)
+                cursor.removeSelectedText()
+            elif op == 2:
+                doc.saveSnapshot(cursor.copy())
+            elif op == 3:
+                if c := doc.restoreSnapshotPrev():
+                    cursor.restore(c)
+                cursor.setPosition(0,0)
+            else:
+                doc.appendText(_words(rnd)+'\n'+_words(rnd))
+            # The displayed lines are always wrapped
+            for dt,_ in tw.screenLines(rnd.randrange(tw.size()), 10):
+                assert not tw._stale[dt]
+            while tw._rewrapStale(1000): pass
+            assert tw.screenLines(0, tw.size()) == _fullWrap(doc, width, mode)
+
+def test_textWrapIncremental():
+    _randomEdits(random.Random(1), 2000)
+
+def test_textWrapProgressive():
+    chunk = ttk.TTkTextWrap._wrapChunk
+    try:
+        _randomEdits(random.Random(2), 3)
+    finally:
+        ttk.TTkTextWrap._wrapChunk = chunk
+
+def test_textWrapSingleLine(monkeypatch):
+    doc = ttk.TTkTextDocument(text='\n'.join('Lorem ipsum dolor sit amet' for _ in range(10000)))
+    tw = ttk.TTkTextWrap(document=doc)
+    tw.enable()
+    tw.setWordWrapMode(ttk.TTkK.WordWrap)
+    tw.setWrapWidth(10)
+    while tw._rewrapStale(1000): pass
+    assert tw.size() == 40000
+    # Only the edited line is rewrapped
+    rewrapped = []
+    wrap = ttk.TTkTextWrap._wrap
+    monkeypatch.setattr(ttk.TTkTextWrap, '_wrap', lambda s,l: rewrapped.append(str(l)) or wrap(s,l))
+    cursor = ttk.TTkTextCursor(document=doc)
+    cursor.setPosition(5000,5)
+    cursor.insertText('xxxxxxxxxx ')
+    assert rewrapped == ['Loremxxxxxxxxxx  ipsum dolor sit amet']
+    assert tw.size() == 40001
+    assert tw.dataToScreenPosition(5001,0) == (0,20005)
+    assert tw.screenToDataPosition(3,20005) == (5001,3)
+
+def test_textWrapMultiCursor():
+    doc = ttk.TTkTextDocument(text='abcde\nxy')
+    tw = ttk.TTkTextWrap(document=doc)
+    tw.enable()
+    tw.setWordWrapMode(ttk.TTkK.WrapAnywhere)
+    tw.setWrapWidth(4)
+    assert tw.screenLines(0, tw.size()) == [(0,(0,4)),(0,(4,6)),(1,(0,3))]
+    # Two cursors on the same line remove a char each
+    cursor = ttk.TTkTextCursor(document=doc)
+    cursor.setPosition(0,1)
+    cursor.addCursor(0,3)
+    cursor.movePosition(ttk.TTkTextCursor.Left, ttk.TTkTextCursor.KeepAnchor, textWrap=tw)
+    cursor.removeSelectedText()
+    assert str(doc._dataLines[0]) == 'bde'
+    assert tw.screenLines(0, tw.size()) == [(0,(0,4)),(1,(0,3))]
+
+def test_textWrapMultiCursorRandom():
+    rnd = random.Random(3)
+    for _ in range(20):
+        doc = ttk.TTkTextDocument(text='\n'.join(_words(rnd) for _ in range(rnd.randrange(1,20))))
+        width = rnd.randrange(5,30)
+        mode = rnd.choice([ttk.TTkK.WordWrap,ttk.TTkK.WrapAnywhere])
+        tw = ttk.TTkTextWrap(document=doc)
+        tw.enable()
+        tw.setWordWrapMode(mode)
+        tw.setWrapWidth(width)
+        changes = []
+        doc.contentsChange.connect(lambda a,b,c: changes.append((a,b,c)))
+        cursor = ttk.TTkTextCursor(document=doc)
+        for _ in range(20):
+            def _rndPos():
+                line = rnd.randrange(doc.lineCount())
+                return line, rnd.randrange(len(doc._dataLines[line])+1)
+            cursor.clearCursors()
+            cursor.setPosition(*_rndPos())
+            for _ in range(rnd.randrange(1,4)):
+                cursor.addCursor(*_rndPos())
+            cursor.movePosition(rnd.choice([ttk.TTkTextCursor.Left,ttk.TTkTextCursor.Right,ttk.TTkTextCursor.Down]),
+                                ttk.TTkTextCursor.KeepAnchor, n=rnd.randrange(1,4), textWrap=tw)
+            old = [str(l) for l in doc._dataLines]
+            changes.clear()
+            if rnd.randrange(2):
+                cursor.removeSelectedText()
+            else:
+                cursor.insertText(rnd.choice(['x','\n',_words(rnd)+'\n'+_words(rnd)]))
+            # The reported range covers all the changed lines
+            new = [str(l) for l in doc._dataLines]
+            for a,b,c in changes[:1]:
+                assert old[:a] == new[:a] and old[a+b:] == new[a+c:]
+            while tw._rewrapStale(1000): pass
+            assert tw.screenLines(0, tw.size()) == _fullWrap(doc, width, mode)
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+# MIT License
+#
+# Copyright (c) 2024 Eugenio Parodi <ceccopierangiolieugenio AT googlemail DOT com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import sys, os, threading
+
+sys.path.append(os.path.join(sys.path[0],'../..'))
+
+from TermTk.TTkCore.TTkTerm.term_base import TTkTermBase
+
+def _pipeTerm(monkeypatch, maxWrite=None, blockAt=()):
+    # Route the frames of TTkTermBase to a pipe,
+    # the os.write wrapper can shorten the writes and raise BlockingIOError on the given calls
+    rd, wr = os.pipe()
+    writes = []
+    osWrite = os.write
+    def _write(fd, data):
+        writes.append(len(data))
+        if len(writes) in blockAt:
+            raise BlockingIOError()
+        return osWrite(fd, data if maxWrite is None else data[:maxWrite])
+    monkeypatch.setattr(os, 'write', _write)
+    monkeypatch.setattr(TTkTermBase, 'syncUpdate', True)
+    monkeypatch.setattr(TTkTermBase, 'pushFrame', lambda txt: TTkTermBase._writeFd(wr, txt))
+    monkeypatch.setattr(TTkTermBase, 'push', lambda txt: TTkTermBase._frameAppend(txt) or osWrite(wr, txt.encode()))
+    return rd, wr, writes
+
+def _read(rd):
+    return os.read(rd, 1<<16).decode()
+
+def test_frameSingleWrite(monkeypatch):
+    rd, wr, writes = _pipeTerm(monkeypatch)
+    stats = TTkTermBase.frameStats()
+    TTkTermBase.frameBegin()
+    for i in range(10):
+        TTkTermBase.push(f"line {i};")
+    assert writes == []
+    TTkTermBase.frameEnd()
+    txt = ''.join(f"line {i};" for i in range(10))
+    assert len(writes) == 1
+    assert _read(rd) == TTkTermBase.BEGIN_SYNC_UPDATE + txt + TTkTermBase.END_SYNC_UPDATE
+    newStats = TTkTermBase.frameStats()
+    assert newStats['frames']   == stats['frames']+1
+    assert newStats['syscalls'] == 1
+    assert newStats['bytes']    == len(txt) + len(TTkTermBase.BEGIN_SYNC_UPDATE + TTkTermBase.END_SYNC_UPDATE)
+    # No frame open, the output is pushed straight away
+    TTkTermBase.push("direct")
+    assert _read(rd) == "direct"
+    # An empty frame does not write anything
+    TTkTermBase.frameBegin()
+    TTkTermBase.frameEnd()
+    assert len(writes) == 1
+    os.close(rd)
+    os.close(wr)
+
+def test_framePartialWrite(monkeypatch):
+    rd, wr, writes = _pipeTerm(monkeypatch, maxWrite=7, blockAt=(2,4))
+    monkeypatch.setattr(TTkTermBase, 'syncUpdate', False)
+    txt = "0123456789"*5
+    TTkTermBase.frameBegin()
+    TTkTermBase.push(txt)
+    TTkTermBase.frameEnd()
+    assert _read(rd) == txt
+    stats = TTkTermBase.frameStats()
+    # 50 bytes in chunks of 7 + the 2 retries after BlockingIOError
+    assert stats['bytes'] == 50
+    assert stats['syscalls'] == len(writes) == 8+2
+    os.close(rd)
+    os.close(wr)
+
+def test_frameOtherThread(monkeypatch):
+    rd, wr, writes = _pipeTerm(monkeypatch)
+    TTkTermBase.frameBegin()
+    TTkTermBase.push("frame;")
+    # The pushes from other threads are not collected in the open frame
+    th = threading.Thread(target=TTkTermBase.push, args=("thread;",))
+    th.start()
+    th.join()
+    assert _read(rd) == "thread;"
+    TTkTermBase.frameEnd()
+    assert _read(rd) == TTkTermBase.BEGIN_SYNC_UPDATE + "frame;" + TTkTermBase.END_SYNC_UPDATE
+    os.close(rd)
+    os.close(wr)
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+# MIT License
+#
+# Copyright (c) 2024 Eugenio Parodi <ceccopierangiolieugenio AT googlemail DOT com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import sys, os
+
+sys.path.append(os.path.join(sys.path[0],'../..'))
+
+import TermTk as ttk
+from TermTk.TTkCore import canvas_packed
+
+w,h = 40,12
+
+def _frame(canvasClass, frame, pushed):
+    root = canvasClass(width=w, height=h)
+    root.enableDoubleBuffer()
+    child = canvasClass(width=15, height=6)
+    child.setTransparent(True)
+    _paint(root, child, frame, pushed)
+    return root, child
+
+def _paint(root, child, frame, pushed):
+    # Each frame uses new colors, like an animated gradient
+    root.clean()
+    for y in range(h):
+        root.fill(pos=(0,y), size=(w,1), color=ttk.TTkColor.bg(f'#{frame%256:02X}{y:02X}FF'))
+    root.drawText(pos=(1,1), text=ttk.TTkString(f"Frame {frame:04}", ttk.TTkColor.fg(f'#FF{frame%256:02X}00')))
+    root.drawText(pos=(frame%w-3,3), text=ttk.TTkString("Wide 日本語 chars"))
+    child.clean()
+    child.drawText(pos=(0,frame%6), text=ttk.TTkString(f"child {frame}", ttk.TTkColor.BOLD))
+    root.paintCanvas(child, (frame%(w+10)-5, 5, 15, 6), (0,0,15,6), (0,0,w,h))
+    pushed.clear()
+    root.pushToTerminalBuffered(0, 0, w, h)
+
+def _compare(monkeypatch, frames):
+    pushed = []
+    monkeypatch.setattr(ttk.TTkTerm, 'push', lambda txt: pushed.append(txt))
+    rootA, childA = _frame(ttk.TTkCanvas, 0, pushed)
+    outA = pushed.copy()
+    rootB, childB = _frame(ttk.TTkCanvasPacked, 0, pushed)
+    assert pushed == outA
+    assert rootB.toAnsi() == rootA.toAnsi()
+    for frame in range(1,frames):
+        _paint(rootA, childA, frame, pushed)
+        outA = pushed.copy()
+        _paint(rootB, childB, frame, pushed)
+        assert pushed == outA
+        assert rootB.toAnsi() == rootA.toAnsi()
+
+def test_packedCanvas(monkeypatch):
+    _compare(monkeypatch, 20)
+
+def test_packedCanvasCompact(monkeypatch):
+    # With small tables the compaction is triggered many times,
+    # the output must be the same of the list based canvas
+    monkeypatch.setattr(canvas_packed._TTkCellTable, 'maxSize', 100)
+    canvas_packed.TTkCanvasPacked.compactTables(force=True)
+    _compare(monkeypatch, 50)
+    # Only the ids used by the live canvases survive the compaction
+    canvas_packed.TTkCanvasPacked.compactTables(force=True)
+    glyphs, colors = ttk.TTkCanvasPacked.tableSizes()
+    live = [c for c in canvas_packed._canvases]
+    usedColors = {i for c in live for a in (c._colorIds, getattr(c,'_bufferedColorIds',None)) if a is not None for i in a}
+    assert colors == len(usedColors | {0})
+    assert glyphs < 100
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+
+# MIT License
+#
+# Copyright (c) 2024 Eugenio Parodi <ceccopierangiolieugenio AT googlemail DOT com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# Create and destroy 100k widgets connected to long living signals,
+# the RSS must stay flat once the first round is allocated
+
+import sys, os, gc
+
+sys.path.append(os.path.join(sys.path[0],'../..'))
+import TermTk as ttk
+from TermTk.TTkCore.signal import _pyTTkSignal_obj
+
+def rss() -> int:
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') // 1024
+    except OSError:
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+root = ttk.TTkContainer(layout=ttk.TTkLayout())
+lineEdit = ttk.TTkLineEdit()
+
+class Receiver(ttk.TTkButton):
+    @ttk.pyTTkSlot(str)
+    def _textChanged(self, text): pass
+
+rounds = 10
+loop = 10000
+for r in range(rounds):
+    for i in range(loop):
+        w = Receiver(parent=root, text=f"{r}-{i}")
+        lineEdit.textChanged.connect(w._textChanged)
+        root.sizeChanged.connect(w.resize)
+        w.clicked.connect(root.update)
+        w.close()
+    # There is no main loop, drop the pending updates
+    ttk.TTkHelper._updateWidget.clear()
+    ttk.TTkHelper._updateBuffer.clear()
+    gc.collect()
+    print(f"Round {r:2}: {(r+1)*loop:7} widgets, RSS {rss():8} KiB, "
+          f"slots: textChanged={len(lineEdit.textChanged._connected_slots)} sizeChanged={len(root.sizeChanged._connected_slots)}, "
+          f"signals alive={len(_pyTTkSignal_obj._signals)}")
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+
+# MIT License
+#
+# Copyright (c) 2024 Eugenio Parodi <ceccopierangiolieugenio AT googlemail DOT com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# Run the pyTermTk main loop inside asyncio,
+# the coroutines update the widgets directly
+# and the terminal output is served by the same event loop
+
+import sys, os
+import asyncio
+sys.path.append(os.path.join(sys.path[0],'../..'))
+import TermTk as ttk
+
+async def counter(label:ttk.TTkLabel):
+    i = 0
+    while True:
+        await asyncio.sleep(0.1)
+        label.setText(f"asyncio counter: {i}")
+        i += 1
+
+async def main():
+    root = ttk.TTk()
+
+    label = ttk.TTkLabel(parent=root, pos=(0,0), size=(30,1), text="asyncio counter: -")
+    ttk.TTkButton(parent=root, pos=(0,1), size=(10,3), text="Quit", border=True).clicked.connect(ttk.TTkHelper.quit)
+
+    win = ttk.TTkWindow(parent=root, pos=(0,4), size=(80,25), title="Terminal", layout=ttk.TTkGridLayout())
+    term = ttk.TTkTerminal(parent=win)
+    th = ttk.TTkTerminalHelper(term=term)
+    th.runShell()
+
+    task = asyncio.create_task(counter(label))
+    await root.mainloopAsync()
+    task.cancel()
+
+asyncio.run(main())
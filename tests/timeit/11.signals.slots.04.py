@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+
+# MIT License
+#
+# Copyright (c) 2024 Eugenio Parodi <ceccopierangiolieugenio AT googlemail DOT com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import sys, os
+
+import timeit
+
+sys.path.append(os.path.join(sys.path[0],'../..'))
+sys.path.append(os.path.join(sys.path[0],'.'))
+import TermTk as ttk
+
+# Emit cost of pyTTkSignal, with no slots, a single slot and many slots
+
+def f0():          pass
+def f1(a):         pass
+def f2(a,b):       pass
+def f3(a,b,c):     pass
+
+class Obj():
+    def m2(self,a,b): pass
+
+o = Obj()
+
+s0 = ttk.pyTTkSignal(int,int)
+
+s1 = ttk.pyTTkSignal(int,int)
+s1.connect(f2)
+
+s2 = ttk.pyTTkSignal(int,int)
+s2.connect(f1)
+
+s3 = ttk.pyTTkSignal(int,int)
+s3.connect(o.m2)
+
+s4 = ttk.pyTTkSignal(int,int)
+s4.connect(f0)
+s4.connect(f1)
+s4.connect(f2)
+s4.connect(lambda a,b: None)
+
+s5 = ttk.pyTTkSignal()
+s5.connect(f0)
+
+def test1(): return s0.emit(1,2)  # No slots
+def test2(): return s1.emit(1,2)  # 1 slot, all the args
+def test3(): return s2.emit(1,2)  # 1 slot, truncated args
+def test4(): return s3.emit(1,2)  # 1 bound method
+def test5(): return s4.emit(1,2)  # 4 slots
+def test6(): return s5.emit()     # 1 slot, no args
+def test7(): return f2(1,2)       # Direct call, reference
+
+loop = 500000
+
+iii = 1
+while (testName := f'test{iii}') and (testName in globals()):
+    result = min(timeit.repeat(f'{testName}()', globals=globals(), number=loop, repeat=5))
+    print(f"{iii}) {result / loop:.10f} - {result / loop} {globals()[testName]()}")
+    iii+=1
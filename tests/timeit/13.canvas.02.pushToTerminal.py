@@ -381,15 +381,66 @@ def ptt3():
         if not empty:
             empty=True
 
+# One changed line, the "before" scan of all the rows and cells
+dataA1   = [l.copy() for l in dataA]
+colorsA1 = [l.copy() for l in colorsA]
+dataA1[h//2], colorsA1[h//2] = dataB[h//2].copy(), colorsB[h//2].copy()
+
+def ptt4():
+    lastcolor = ttk.TTkColor.RST
+    empty = True
+    ansi = ""
+    for y,(lda,ldb,lca,lcb) in enumerate(zip(dataA1,dataA,colorsA1,colorsA)):
+        for x,(da,db,ca,cb) in enumerate(zip(lda,ldb,lca,lcb)):
+            if da==db and ca==cb:
+                if not empty:
+                    empty=True
+                continue
+            ch, color = da, ca
+            if empty:
+                ansi = ttk.TTkTerm.Cursor.moveTo(y+1,x+1)
+                empty = False
+            if color != lastcolor:
+                ansi += color.canvasDiff2Str(lastcolor)
+                lastcolor = color
+            ansi+=ch
+        if not empty:
+            empty=True
+
+# One changed line, the "after" scan of the dirty rows only
+ttk.TTkTerm.push = lambda *args: None
+
+def _bufferedCanvas(canvasClass):
+    canvas = canvasClass(width=w, height=h)
+    canvas.enableDoubleBuffer()
+    for y,(ld,lc) in enumerate(zip(dataA,colorsA)):
+        for x,(ch,color) in enumerate(zip(ld,lc)):
+            canvas._set(y,x,ch,color)
+    canvas.pushToTerminalBuffered(0, 0, w, h)
+    return canvas
+
+canvasList   = _bufferedCanvas(ttk.TTkCanvas)
+canvasPacked = _bufferedCanvas(ttk.TTkCanvasPacked)
+_toggle = [False]
+
+def ptt5(canvas):
+    # Paint a different char on a single row and push it
+    _toggle[0] = not _toggle[0]
+    canvas.fill(pos=(0,h//2), size=(w,1), char='X' if _toggle[0] else 'O')
+    canvas.pushToTerminalBuffered(0, 0, w, h)
+
+def ptt6(canvas):
+    # Nothing changed
+    canvas.pushToTerminalBuffered(0, 0, w, h)
+
 def test1(): return ptt1()
 def test2(): return ptt2()
-def test3(): return ptt2()
-def test4(): return ptt1()
-def test5(): return ptt1()
-def test6(): return ptt1()
-def test7(): return ptt1()
-def test8(): return ptt1()
-def test9(): return ptt1()
+def test3(): return ptt3()
+def test4(): return ptt4()
+def test5(): return ptt5(canvasList)
+def test6(): return ptt5(canvasPacked)
+def test7(): return ptt6(canvasList)
+def test8(): return ptt6(canvasPacked)
 
 loop = 50
 
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+
+# MIT License
+#
+# Copyright (c) 2024 Eugenio Parodi <ceccopierangiolieugenio AT googlemail DOT com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# Compare the list based TTkCanvas with the array based TTkCanvasPacked
+#
+#   - memory used by a 300x100 canvas
+#   - compose a full frame (fill, draw text, paint children)
+#   - diff the root canvas with the terminal double buffer
+
+import sys, os
+
+import timeit
+import tracemalloc
+
+sys.path.append(os.path.join(sys.path[0],'../..'))
+import TermTk as ttk
+
+w,h = 300,100
+
+# Don't write anything to the terminal
+ttk.TTkTerm.push = lambda *args: None
+
+def memory(canvasClass):
+    tracemalloc.start()
+    c = canvasClass(width=w, height=h)
+    c.drawText(pos=(0,0),text=ttk.TTkString("Test"*50,ttk.TTkColor.RED))
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size
+
+colors = [ttk.TTkColor.fg(f'#{r:02X}{g:02X}00')+ttk.TTkColor.bg('#000044') for r in range(0,256,32) for g in range(0,256,32)]
+texts  = [ttk.TTkString(f"Line {i:04} "*20, colors[i%len(colors)]) for i in range(h)]
+
+def prepare(canvasClass):
+    root  = canvasClass(width=w, height=h)
+    root.enableDoubleBuffer()
+    childs = []
+    for i in range(10):
+        c = canvasClass(width=60, height=30)
+        c.fill(color=colors[i])
+        for y in range(30):
+            c.drawText(pos=(1,y),text=texts[y+i])
+        childs.append(c)
+    return root, childs
+
+def compose(root, childs, frame):
+    root.clean()
+    for y in range(h):
+        root.drawText(pos=(0,y),text=texts[(y+frame)%h])
+    for i,c in enumerate(childs):
+        root.paintCanvas(c, (i*25+frame%5, i*7, 60, 30), (0,0,60,30), (0,0,w,h))
+    root.pushToTerminalBuffered(0, 0, w, h)
+
+rootA, childsA = prepare(ttk.TTkCanvas)
+rootB, childsB = prepare(ttk.TTkCanvasPacked)
+
+print(f"Memory {w}x{h} TTkCanvas:       {memory(ttk.TTkCanvas)} bytes")
+print(f"Memory {w}x{h} TTkCanvasPacked: {memory(ttk.TTkCanvasPacked)} bytes")
+
+frame = 0
+def test1():
+    global frame
+    frame += 1
+    return compose(rootA, childsA, frame)
+def test2():
+    global frame
+    frame += 1
+    return compose(rootB, childsB, frame)
+def test3():
+    # Diff only (unchanged frame)
+    return rootA.pushToTerminalBuffered(0, 0, w, h)
+def test4():
+    # Diff only (unchanged frame)
+    return rootB.pushToTerminalBuffered(0, 0, w, h)
+
+loop = 20
+
+result = timeit.timeit('test1()', globals=globals(), number=loop)
+print(f"1  {result / loop:.10f} - {result / loop} {test1()} - compose TTkCanvas")
+result = timeit.timeit('test2()', globals=globals(), number=loop)
+print(f"2  {result / loop:.10f} - {result / loop} {test2()} - compose TTkCanvasPacked")
+result = timeit.timeit('test3()', globals=globals(), number=loop)
+print(f"3  {result / loop:.10f} - {result / loop} {test3()} - diff TTkCanvas")
+result = timeit.timeit('test4()', globals=globals(), number=loop)
+print(f"4  {result / loop:.10f} - {result / loop} {test4()} - diff TTkCanvasPacked")
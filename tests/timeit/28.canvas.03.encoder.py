@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+
+# MIT License
+#
+# Copyright (c) 2024 Eugenio Parodi <ceccopierangiolieugenio AT googlemail DOT com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# Bytes written and time spent by the terminal diff
+# with the different terminal capabilities
+#
+#   - a text area where a few words change every frame
+#   - a window moving over a blank background
+
+import sys, os
+
+import timeit
+
+sys.path.append(os.path.join(sys.path[0],'../..'))
+import TermTk as ttk
+
+w,h = 200,60
+
+written = 0
+def _push(s):
+    global written
+    written += len(s.encode())
+ttk.TTkTerm.push = _push
+
+Caps = ttk.TTkTerm.Caps
+bg    = ttk.TTkColor.bg('#000044')
+color = ttk.TTkColor.fg('#FFFF00')+bg
+texts = [ttk.TTkString(f"Line {i:04} "+"Lorem ipsum dolor sit amet "*7, color) for i in range(h)]
+win   = ttk.TTkCanvas(width=60, height=20)
+win.fill(color=ttk.TTkColor.bg('#444444'))
+win.drawText(pos=(1,1),text=ttk.TTkString("─"*58))
+
+def prepare(canvasClass):
+    root = canvasClass(width=w, height=h)
+    root.enableDoubleBuffer()
+    return root
+
+def frameText(root, frame):
+    for y in range(h):
+        root.drawText(pos=(0,y),text=texts[y])
+        root.drawText(pos=(40+(y*7+frame)%100,y),text=ttk.TTkString(f"{frame:05}",color))
+    root.pushToTerminalBuffered(0, 0, w, h)
+
+def frameWindow(root, frame):
+    root.fill(color=bg)
+    root.paintCanvas(win, (frame%100, 10+frame%20, 60, 20), (0,0,60,20), (0,0,w,h))
+    root.pushToTerminalBuffered(0, 0, w, h)
+
+def run(caps, canvasClass, paint):
+    global written
+    ttk.TTkTerm.capabilities = caps
+    root = prepare(canvasClass)
+    paint(root, 0)
+    written = 0
+    frame = 0
+    def _test():
+        nonlocal frame
+        frame += 1
+        paint(root, frame)
+    result = timeit.timeit(_test, number=loop)
+    return result / loop, written // loop
+
+loop = 50
+
+for name, caps in (
+        ('absolute',     0),
+        ('default',      Caps.RELMOVE | Caps.ECH | Caps.EL),
+        ('all',          Caps.RELMOVE | Caps.REP | Caps.ECH | Caps.EL | Caps.BCE)):
+    for paintName, paint in (('text', frameText), ('window', frameWindow)):
+        for canvasClass in (ttk.TTkCanvas, ttk.TTkCanvasPacked):
+            t, b = run(caps, canvasClass, paint)
+            print(f"{name:10} {paintName:8} {canvasClass.__name__:16} {t:.10f}s {b:8} bytes/frame")
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+
+# MIT License
+#
+# Copyright (c) 2024 Eugenio Parodi <ceccopierangiolieugenio AT googlemail DOT com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# Compose overlapping transparent canvases,
+# the layers scroll at different speeds like in the
+# tests/stress/03.parallax.* scenarios
+#
+#   - each layer has opaque sprites separated by transparent gaps
+#   - the layers are not modified between the frames
+
+import sys, os
+
+import timeit
+
+sys.path.append(os.path.join(sys.path[0],'../..'))
+import TermTk as ttk
+
+w,h = 200,50
+
+colors = [ttk.TTkColor.fg('#FFFFFF')+ttk.TTkColor.bg(c) for c in ('#0000FF','#AAAAAA','#888888','#666666')]
+
+def prepare(canvasClass):
+    root = canvasClass(width=w, height=h)
+    layers = []
+    for i,color in enumerate(colors):
+        layer = canvasClass(width=2*w, height=h-i*10)
+        layer.setTransparent(True)
+        for x in range(0,2*w,30+i*7):
+            for y in range(i*3,h-i*10,4):
+                layer.drawText(pos=(x,y),   color=color, text='▀'*(12+i*3))
+                layer.drawText(pos=(x,y+1), color=color, text=f'┌{"─╥"*(5+i)}─┐')
+        layers.append(layer)
+    return root, layers
+
+def compose(root, layers, frame):
+    root.fill(color=colors[0])
+    for i,layer in enumerate(layers):
+        lw,lh = layer.size()
+        x = -((frame*(i+1)) % w)
+        root.paintCanvas(layer, (x, i*10, lw, lh), (0,0,lw,lh), (0,0,w,h))
+
+rootA, layersA = prepare(ttk.TTkCanvas)
+rootB, layersB = prepare(ttk.TTkCanvasPacked)
+
+frame = 0
+def test1():
+    global frame
+    frame += 1
+    return compose(rootA, layersA, frame)
+def test2():
+    global frame
+    frame += 1
+    return compose(rootB, layersB, frame)
+
+loop = 100
+
+result = timeit.timeit('test1()', globals=globals(), number=loop)
+print(f"1  {result / loop:.10f} - {result / loop} {test1()} - compose transparent TTkCanvas")
+result = timeit.timeit('test2()', globals=globals(), number=loop)
+print(f"2  {result / loop:.10f} - {result / loop} {test2()} - compose transparent TTkCanvasPacked")
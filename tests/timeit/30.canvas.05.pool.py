@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+
+# MIT License
+#
+# Copyright (c) 2024 Eugenio Parodi <ceccopierangiolieugenio AT googlemail DOT com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# Resize a canvas step by step, like during a window drag
+# (TTkResizableFrame, TTkSplitter) and report the
+# time, the memory blocks allocated and the canvas pool counters
+
+import sys, os
+
+import timeit
+import tracemalloc
+
+sys.path.append(os.path.join(sys.path[0],'../..'))
+import TermTk as ttk
+
+sizes = [(80+i,25+i//3) for i in range(60)] + [(140-i,45-i//3) for i in range(60)]
+
+def drag(canvasClass):
+    c = canvasClass(width=80, height=25)
+    for w,h in sizes:
+        c.resize(w,h)
+        c.updateSize()
+        c.clean()
+        c.drawText(pos=(0,0),text="Test")
+
+def memory(canvasClass):
+    tracemalloc.start()
+    drag(canvasClass)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+def test1(): return drag(ttk.TTkCanvas)
+def test2(): return drag(ttk.TTkCanvasPacked)
+
+loop = 20
+
+result = timeit.timeit('test1()', globals=globals(), number=loop)
+print(f"1  {result / loop:.10f} - {result / loop} {test1()} - drag resize TTkCanvas")
+result = timeit.timeit('test2()', globals=globals(), number=loop)
+print(f"2  {result / loop:.10f} - {result / loop} {test2()} - drag resize TTkCanvasPacked")
+
+print(f"Peak memory TTkCanvas:       {memory(ttk.TTkCanvas)} bytes")
+print(f"Peak memory TTkCanvasPacked: {memory(ttk.TTkCanvasPacked)} bytes")
+if hasattr(ttk,'TTkCanvasPool'):
+    ttk.TTkCanvasPool.resetStats()
+    drag(ttk.TTkCanvas)
+    print(f"Pool: {ttk.TTkCanvasPool.stats()}")
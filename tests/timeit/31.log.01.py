@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+
+# MIT License
+#
+# Copyright (c) 2024 Eugenio Parodi <ceccopierangiolieugenio AT googlemail DOT com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import sys, os
+
+import timeit
+
+sys.path.append(os.path.join(sys.path[0],'../..'))
+sys.path.append(os.path.join(sys.path[0],'.'))
+import TermTk as ttk
+
+# Cost of the TTkLog calls with/without a handler requiring the message
+
+count = [0]
+def _handler(mode, context, message):
+    count[0] += 1
+
+value = [1,2,3]
+
+def test1(): ttk.TTkLog.debug(f"Value: {value}")
+def test2(): ttk.TTkLog.debug("Value: %s", value)
+def test3(): ttk.TTkLog.debug(lambda: f"Value: {value}")
+def test4(): ttk.TTkLog.error(f"Value: {value}")
+
+loop = 100000
+
+def run(name):
+    print(name)
+    iii = 1
+    while (testName := f'test{iii}') and (testName in globals()):
+        count[0] = 0
+        result = min(timeit.repeat(f'{testName}()', globals=globals(), number=loop, repeat=3))
+        print(f"  {iii}) {result / loop:.10f} - handled {count[0]}")
+        iii+=1
+
+run("No handlers")
+if hasattr(ttk.TTkLog, 'AllMsg'):
+    ttk.TTkLog.installMessageHandler(_handler, ttk.TTkLog.ErrorMsg)
+    run("Handler (Errors only)")
+    ttk.TTkLog.removeMessageHandler(_handler)
+ttk.TTkLog.installMessageHandler(_handler)
+run("Handler (All)")
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+
+# MIT License
+#
+# Copyright (c) 2024 Eugenio Parodi <ceccopierangiolieugenio AT googlemail DOT com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+
+import sys, os, re
+
+import timeit
+
+sys.path.append(os.path.join(sys.path[0],'../..'))
+sys.path.append(os.path.join(sys.path[0],'.'))
+from TermTk.TTkCore.TTkTerm.inputtokenizer import TTkInputTokenizer
+
+# Previous input split: regex split of each read,
+# the mouse sequences parsed by another regex, the paste concatenated char by char
+_seq_re = re.compile('(\033?[^\033]+)')
+_mouse_re = re.compile(r"\033\[<(\d+);(\d+);(\d+)([mM])")
+
+def _split(stdinRead):
+    if stdinRead == '\033':
+        return ['\033']
+    ret = []
+    for sr in _seq_re.findall(stdinRead):
+        if '\033' == sr[0]:
+            ret.append(sr)
+        else:
+            ret += sr
+    return ret
+
+def _old(reads):
+    out = []
+    paste = None
+    for read in reads:
+        for seq in _split(read):
+            if paste is not None:
+                if seq.endswith("\033[201~"):
+                    paste += seq[:-6]
+                    out.append(paste)
+                    paste = None
+                else:
+                    paste += seq
+            elif seq.startswith("\033[200~"):
+                paste = seq[6:]
+            elif m := _mouse_re.match(seq):
+                out.append((int(m.group(1)), int(m.group(2)), int(m.group(3)), m.group(4)))
+            else:
+                out.append(seq)
+    return out
+
+def _new(reads):
+    tk = TTkInputTokenizer()
+    out = []
+    for read in reads:
+        out += tk.feed(read)
+    return out
+
+# Reads of 4096 chars
+def _reads(stream): return [stream[i:i+4096] for i in range(0,len(stream),4096)]
+
+keys   = _reads("Hello World\033[A\033[1;5C" * 2000)
+mouse  = _reads("".join(f"\033[<35;{i%200+1};{i%50+1}M" for i in range(20000)))
+paste  = _reads("\033[200~" + "Paste test with some text\r" * 4000 + "\033[201~")
+pasteL = _reads("\033[200~" + "Paste test with some text\r" * 40000 + "\033[201~")
+
+def test1(): return _old(keys)
+def test2(): return _new(keys)
+def test3(): return _old(mouse)
+def test4(): return _new(mouse)
+def test5(): return _old(paste)
+def test6(): return _new(paste)
+def test7(): return _old(pasteL)
+def test8(): return _new(pasteL)
+
+loop = 5
+
+print("Keys (old/new), Mouse (old/new), Paste 100K (old/new), Paste 1M (old/new)")
+a = {}
+iii = 1
+while (testName := f'test{iii}') and (testName in globals()):
+    result = min(timeit.repeat(f'{testName}()', globals=globals(), number=loop, repeat=3))
+    print(f"{iii}) {result / loop:.10f}")
+    iii+=1
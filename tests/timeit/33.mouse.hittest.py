@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+
+# MIT License
+#
+# Copyright (c) 2024 Eugenio Parodi <ceccopierangiolieugenio AT googlemail DOT com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+
+import sys, os, random
+
+import timeit
+
+sys.path.append(os.path.join(sys.path[0],'../..'))
+sys.path.append(os.path.join(sys.path[0],'.'))
+import TermTk as ttk
+from TermTk.TTkCore.TTkTerm.inputmouse import TTkMouseEvent
+
+# Mouse dispatch (Move events) and widgetAt
+# in a container with a grid of N cells as widgets
+
+def _build(n):
+    cols = 100
+    root = ttk.TTkContainer(layout=ttk.TTkLayout(), size=(200,(n//cols)+1))
+    root.layout().setGeometry(0,0,200,(n//cols)+1)
+    for i in range(n):
+        ttk.TTkWidget(parent=root, pos=((i%cols)*2,i//cols), size=(2,1))
+    return root
+
+rnd = random.Random(1)
+points = [(rnd.randint(0,199), rnd.randint(0,9)) for _ in range(1000)]
+evts   = [TTkMouseEvent(x, y, ttk.TTkK.NoButton, ttk.TTkK.Move, ttk.TTkK.NoModifier, 0, '') for x,y in points]
+
+def test1():
+    for evt in evts:
+        root.mouseEvent(evt)
+
+def test2():
+    layout = root.layout()
+    for x,y in points:
+        ttk.TTkHelper.widgetAt(x, y, layout)
+
+loop = 3
+
+for n in (100, 1000, 5000):
+    root = _build(n)
+    r1 = min(timeit.repeat('test1()', globals=globals(), number=loop, repeat=3)) / loop / len(evts)
+    r2 = min(timeit.repeat('test2()', globals=globals(), number=loop, repeat=3)) / loop / len(evts)
+    print(f"N={n:5d} mouseEvent: {r1*1000000:8.2f}us  widgetAt: {r2*1000000:8.2f}us")
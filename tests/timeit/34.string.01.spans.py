@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+
+# MIT License
+#
+# Copyright (c) 2024 Eugenio Parodi <ceccopierangiolieugenio AT googlemail DOT com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+
+import sys, os
+
+import timeit
+import tracemalloc
+
+sys.path.append(os.path.join(sys.path[0],'../..'))
+sys.path.append(os.path.join(sys.path[0],'.'))
+import TermTk as ttk
+
+# Cost of the TTkString color storage (per char list vs run-length spans)
+
+color = ttk.TTkColor.fg('#FF0000')
+bold  = ttk.TTkColor.BOLD
+bg    = ttk.TTkColor.bg('#000044')
+
+long  = ttk.TTkString("x"*10000, color)
+line  = ttk.TTkString()+color+"abc "*50+bg+"def\tghi "*10
+
+tracemalloc.start()
+lines = [ttk.TTkString("Lorem ipsum dolor sit amet, consectetur adipiscing elit "*3, color) for _ in range(10000)]
+size,_ = tracemalloc.get_traced_memory()
+tracemalloc.stop()
+print(f"10000 lines x {len(lines[0])} chars: {size/1000000:.2f}MB")
+
+def test1(): return long + long
+def test2(): return long.substring(100,9000)
+def test3(): return long.setColor(bold,posFrom=10,posTo=20)
+def test4(): return long.completeColor(bg)
+def test5(): return line.align(400)
+def test6(): return line.tab2spaces()
+def test7(): return line.getData()
+
+loop = 1000
+
+iii = 1
+while (testName := f'test{iii}') and (testName in globals()):
+    result = min(timeit.repeat(f'{testName}()', globals=globals(), number=loop, repeat=5))
+    print(f"{iii}) {result / loop:.10f}")
+    iii+=1
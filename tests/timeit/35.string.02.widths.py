@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+
+# MIT License
+#
+# Copyright (c) 2024 Eugenio Parodi <ceccopierangiolieugenio AT googlemail DOT com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+
+import sys, os
+
+import timeit
+
+sys.path.append(os.path.join(sys.path[0],'../..'))
+sys.path.append(os.path.join(sys.path[0],'.'))
+import TermTk as ttk
+
+# Cost of the width computations on ascii and CJK text
+
+ascii = "Lorem ipsum dolor sit amet, consectetur adipiscing elit "*4
+cjk   = "日本語のテキストとカタカナ、ひらがな、漢字、e\u0301 combining "*4
+
+def run(name, text):
+    s = ttk.TTkString(text)
+    g = dict(ttk=ttk, s=s, text=text, w=s.termWidth()//2, l=len(text)//2)
+    print(f"{name} ({len(text)} chars)")
+    for testName, stmt in (
+            ('ctor',     "ttk.TTkString(text)"),
+            ('getData',  "s.getData()"),
+            ('align',    "s.align(w)"),
+            ('nextPos',  "s.nextPos(l)"),
+            ('prevPos',  "s.prevPos(l)"),
+            ('tabPos',   "s.tabCharPos(w)"),
+            ('width',    "ttk.TTkString._getWidthText(text)"),
+            ('charloop', "[ttk.TTkString._getWidthText(ch) for ch in text]")):
+        loop = 1000
+        result = min(timeit.repeat(stmt, globals=g, number=loop, repeat=5))
+        print(f"  {testName:10} {result / loop:.10f}")
+
+run("Ascii", ascii)
+run("CJK",   cjk)
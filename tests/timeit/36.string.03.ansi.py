@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+
+# MIT License
+#
+# Copyright (c) 2024 Eugenio Parodi <ceccopierangiolieugenio AT googlemail DOT com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+
+import sys, os
+
+import timeit
+
+sys.path.append(os.path.join(sys.path[0],'../..'))
+sys.path.append(os.path.join(sys.path[0],'.'))
+import TermTk as ttk
+
+# Cost of the TTkString construction from plain and ansi strings
+
+path = os.path.join(sys.path[0],'..')
+
+with open(os.path.join(path,'textedit.ANSI.txt')) as f:
+    ansiText = f.read().split('\n')
+with open(os.path.join(path,'../multiplexers/workbench/eumigo.ansi')) as f:
+    ansiArt = f.read().split('\n')
+
+plain = ['Yes⌛⌛⌛', 'Lorem ipsum dolor sit amet, consectetur adipiscing elit', 'x'*1000, '']
+
+def test1(): return [ttk.TTkString(s) for s in plain]
+def test2(): return ttk.TTkString() + plain[1] + ttk.TTkColor.BOLD + plain[0]
+def test3(): return [ttk.TTkString(s) for s in ansiText]
+def test4(): return [ttk.TTkString(s) for s in ansiArt]
+
+loop = 100
+
+iii = 1
+while (testName := f'test{iii}') and (testName in globals()):
+    result = min(timeit.repeat(f'{testName}()', globals=globals(), number=loop, repeat=5))
+    print(f"{iii}) {result / loop:.10f}")
+    iii+=1
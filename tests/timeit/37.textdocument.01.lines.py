@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+
+# MIT License
+#
+# Copyright (c) 2024 Eugenio Parodi <ceccopierangiolieugenio AT googlemail DOT com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+import sys, os
+
+import timeit
+
+sys.path.append(os.path.join(sys.path[0],'../..'))
+sys.path.append(os.path.join(sys.path[0],'.'))
+import TermTk as ttk
+
+# Cost of the TTkTextDocument edits on a large (100k lines) document
+
+text = '\n'.join(f'Line {i} Lorem ipsum dolor sit amet' for i in range(100000))
+
+docAppend = ttk.TTkTextDocument(text=text)
+docEdit   = ttk.TTkTextDocument(text=text)
+cursor    = ttk.TTkTextCursor(document=docEdit)
+cursor.setPosition(50000,5)
+
+def test1():
+    # Tail a log, one line for each append
+    for i in range(100):
+        docAppend.appendText(f'Log {i}')
+def test2():
+    # Type a char and save the undo snapshot
+    cursor.insertText('x')
+    docEdit.saveSnapshot(cursor.copy())
+def test3():
+    # Paste 100 lines in the middle of the document
+    cursor.insertText('pasted\n'*100)
+    docEdit.saveSnapshot(cursor.copy())
+def test4():
+    lines = docEdit._dataLines
+    return [lines[i] for i in range(0,len(lines),100)]
+def test5():
+    lines = docEdit._dataLines
+    return [lines[i] for i in range(40000,41000)]
+
+loop = 20
+
+iii = 1
+while (testName := f'test{iii}') and (testName in globals()):
+    result = min(timeit.repeat(f'{testName}()', globals=globals(), number=loop, repeat=5))
+    print(f"{iii}) {result / loop:.10f}")
+    iii+=1
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+
+# MIT License
+#
+# Copyright (c) 2024 Eugenio Parodi <ceccopierangiolieugenio AT googlemail DOT com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+import sys, os
+
+import timeit
+
+sys.path.append(os.path.join(sys.path[0],'../..'))
+sys.path.append(os.path.join(sys.path[0],'.'))
+import TermTk as ttk
+
+# Cost of the rewrap of a large (100k lines) word wrapped document
+
+text = '\n'.join(f'Line {i} Lorem ipsum dolor sit amet, consectetur adipiscing elit, sed do eiusmod tempor' for i in range(100000))
+
+view = ttk.TTkTextEditView(readOnly=False)
+view.setText(text)
+view.setLineWrapMode(ttk.TTkK.FixedWidth)
+view.setWordWrapMode(ttk.TTkK.WordWrap)
+view.setWrapWidth(40)
+cursor = view.textCursor()
+cursor.setPosition(50000,5)
+
+def test1():
+    # Type a char
+    cursor.insertText('x')
+def test2():
+    # Type a newline
+    cursor.insertText('\n')
+def test3():
+    # Change the wrap width
+    view.setWrapWidth(30 if view.wrapWidth()==40 else 40)
+
+loop = 3
+
+iii = 1
+while (testName := f'test{iii}') and (testName in globals()):
+    result = min(timeit.repeat(f'{testName}()', globals=globals(), number=loop, repeat=3))
+    print(f"{iii}) {result / loop:.10f}")
+    iii+=1
@@ -10,15 +10,26 @@ __check(){
             -e "signal.py:from inspect import getfullargspec" \
             -e "signal.py:from types import LambdaType" \
             -e "signal.py:from threading import Lock" \
+            -e "signal.py:from weakref import WeakSet, ref" \
             -e "colors.py:from .colors_ansi_map" \
-            -e "log.py:import inspect" \
+            -e "log.py:import sys" \
             -e "log.py:import logging" \
-            -e "log.py:from collections.abc import Callable, Set" \
+            -e "log.py:from collections.abc import Callable" \
+            -e "logring.py:import atexit" \
+            -e "logring.py:import threading" \
+            -e "logring.py:from itertools import islice" \
+            -e "logring.py:from collections import deque" \
             -e "term.py:import importlib.util" \
             -e "term.*.py:import sys, os, signal" \
             -e "term.*.py:from .term_base import TTkTermBase" \
+            -e "term_base.py:import os, select" \
+            -e "term_base.py:from threading import get_ident" \
             -e "timer.py:import importlib" \
             -e "timer_unix.py:import threading" \
+            -e "timer_unix.py:import heapq" \
+            -e "timer_unix.py:import itertools" \
+            -e "timer_unix.py:from time import monotonic" \
+            -e "timer_unix.py:from typing import Optional" \
             -e "timer_pyodide.py:import pyodideProxy" \
             -e "ttk.py:import signal" \
             -e "ttk.py:import time" \
@@ -28,7 +39,14 @@ __check(){
             -e "clipboard.py:import importlib.util" \
             -e "filebuffer.py:import threading" \
             -e "texedit.py:from math import log10, floor" \
+            -e "layout.py:from heapq import merge" \
             -e "string.py:import unicodedata" \
+            -e "string.py:from array import array" \
+            -e "string.py:from bisect import bisect_left, bisect_right" \
+            -e "string.py:from functools import lru_cache" \
+            -e "string.py:from itertools import accumulate, repeat" \
+            -e "canvas_packed.py:from array import array" \
+            -e "canvas_packed.py:from weakref import WeakSet" \
             -e "progressbar.py:import math" \
             -e "uiloader.py:import json" \
             -e "uiproperties.py:from .properties.* import" \
@@ -45,17 +63,24 @@ __check(){
             -e "TTkTerm/input_thread.py:from time import time" \
             -e "TTkTerm/input_thread.py:import threading, queue" \
             -e "TTkTerm/input_thread.py:from ..drivers import TTkInputDriver" \
-            -e "TTkTerm/input.py:from .input_thread import *" |
+            -e "TTkTerm/input.py:from .input_thread import *" \
+            -e "TTkTerm/input_loop.py:from time import time" \
+            -e "TTkTerm/input_loop.py:from ..drivers import TTkInputDriver" \
+            -e "TTkTerm/input_loop.py:import asyncio" \
+            -e "TTkTerm/input_loop.py:from typing import Optional" \
+            -e "TTkTerm/input.py:from .input_loop import *" |
         grep -v \
             -e "TTkTerm/term.py:from ..drivers import *" \
             -e "drivers/unix_thread.py:import sys, os" \
             -e "drivers/unix_thread.py:from select import select" \
             -e "drivers/unix_thread.py:import threading" \
             -e "drivers/unix_thread.py:import queue" \
-            -e "drivers/unix.py:import sys, os, re" \
+            -e "drivers/unix.py:import sys, os" \
             -e "drivers/unix.py:import signal" \
             -e "drivers/unix.py:from select import select" \
             -e "drivers/windows.py:import signal" \
+            -e "drivers/windows.py:import math" \
+            -e "drivers/windows.py:from typing import Optional" \
             -e "drivers/windows.py:from ctypes import Structure, Union, byref, wintypes, windll" \
             -e "drivers/pyodide.py:from pyodide import __version__ as pyodideVersion" \
             -e "drivers/term_windows.py:import sys, os" \
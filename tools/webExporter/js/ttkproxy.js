@@ -236,11 +236,8 @@ class TTkProxy {
               # ttk_log(f"{type(data.to_py())=}, {str(data.to_py())}")
 
             def ttk_input(val):
-              kevt,mevt,paste = TTkInput.key_process(val)
-              if kevt or mevt:
-                TTkInput.inputEvent.emit(kevt, mevt)
-              if paste:
-                TTkInput.pasteEvent.emit(paste)
+              TTkInput._dispatch(val)
+              TTkInput._dispatch(None)
 
             def ttk_resize(w,h):
               ttk.TTkLog.debug(f"Resize: {w=} {h=}")
@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+
+# MIT License
+#
+# Copyright (c) 2024 Eugenio Parodi <ceccopierangiolieugenio AT googlemail DOT com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import TermTk as ttk
+
+    # define the callback used to process the log message
+def message_handler(mode, context, message):
+    print(f"{context.file}:{context.line} {message}")
+
+    # Register the callback only for the Error and Warning messages
+ttk.TTkLog.installMessageHandler(message_handler, ttk.TTkLog.ErrorMsg | ttk.TTkLog.WarningMsg)
+
+def expensive():
+    return sum(range(100000))
+
+    # The debug message is discarded, no handler requires it
+    # the lambda is never evaluated
+ttk.TTkLog.debug(lambda: f"Test Debug Message {expensive()}")
+    # The %-format is evaluated only if a handler requires the message
+ttk.TTkLog.error("Test Error Message %s", 123)
+ttk.TTkLog.warn(lambda: f"Test Warning Message {expensive()}")